@@ -1,13 +1,14 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Optional
+from typing import Iterable, Optional
 from os import path
 
 import pygame
 
-from game.utilities import GameState, read_image, rotate_image
+from game.utilities import GameState, TimerWheel, EventBus, Camera, asset_cache, rotation_cache
 from game.game_objects.weapon import Weapon
 from game.game_objects.projectile import Projectile
+from game.game_objects.projectile_system import ProjectileSystem
 
 
 class CharacterState(Enum):
@@ -39,27 +40,42 @@ class Character(pygame.sprite.Sprite, ABC):
     one has a grey overlay).
 
     A Character's position is stored in the 'position' attribute. Characters move across the map with a certain speed
-    ('speed' attribute). A start position can be passed when initializing an object. Since Character's can rotate, its
+    ('speed' attribute, in pixels per second). A start position can be passed when initializing an object. The position
+    of the previous simulation step is kept in 'previous_position', so rendering can interpolate between the two. Since Character's can rotate, its
     current rotation is stored in the 'rotation' attribute. Two methods ('move' and '_calculate_rotation') have to be
     implemented in derived classes.
 
     All weapons a Character carries, are contained in the 'weapons' sprite group. The currently selected weapon is
-    controlled via the 'active_weapon_index' attribute.
+    controlled via the 'active_weapon_index' attribute. The game's services (TimerWheel, EventBus, ProjectileSystem and
+    the map's bounds) are passed to every Character, its weapons use them through their owner.
     """
     size = (64, 64)
     initial_health = 100.0
+    team = "neutral"
 
-    def __init__(self, display: pygame.Surface, images: Optional[dict] = None, position: Optional[pygame.Vector2] = None, *args):
+    def __init__(self, display: pygame.Surface, images: Optional[dict] = None,
+                 position: Optional[pygame.Vector2] = None, *args, timers: Optional[TimerWheel] = None,
+                 events: Optional[EventBus] = None, projectile_system: Optional[ProjectileSystem] = None,
+                 world_bounds: Optional[pygame.Rect] = None):
         """Abstract base class for Player and Enemy classes
 
         :param display: pygame.display used for rendering
         :param images: optional dictionary for passing custom images for different CharacterStates
         :param position: Character spawn location
+        :param timers: TimerWheel for cooldowns and despawns, without one they are tracked per step or immediate
+        :param events: EventBus the Character's events are published on
+        :param projectile_system: ProjectileSystem the Character's weapons spawn their projectiles in, if set
+        :param world_bounds: area of the map, projectiles of the Character's weapons leaving it are culled
         """
         super().__init__(*args)
         self.display = display
-        self.position = position or pygame.Vector2(200, 200)
-        self.speed = 5
+        self.timers = timers
+        self.events = events
+        self.projectile_system = projectile_system
+        self.world_bounds = world_bounds
+        self.position = pygame.Vector2(position) if position is not None else pygame.Vector2(200, 200)
+        self.previous_position = self.position.copy()
+        self.speed = 300
         self.critical_health_limit = 0.2 * self.initial_health
         self.state = CharacterState.DEFAULT
         self._health = self.initial_health
@@ -68,8 +84,9 @@ class Character(pygame.sprite.Sprite, ABC):
         self._active_weapon_idx = 0
         self.rotation = 0
         self.images = images or self._read_images()
-        self.frames_since_last_attack = 0
-        self.rect = self.images[CharacterState.DEFAULT].get_rect()
+        self.time_since_last_attack = 0.0
+        self.attack_ready = True
+        self.rect = self.images[CharacterState.DEFAULT].get_rect(topleft=self.position)
 
     @classmethod
     def _read_images(cls) -> dict[CharacterState, pygame.Surface]:
@@ -81,17 +98,26 @@ class Character(pygame.sprite.Sprite, ABC):
 
         :return: dictionary with CharacterStates as keys and pygame Surfaces as Values
         """
+        image_paths = cls.image_paths()
+        default = asset_cache.get_image(image_paths[CharacterState.DEFAULT])
+        return {state: asset_cache.get_image(image_path) if image_path else default
+                for state, image_path in image_paths.items()}
+
+    @classmethod
+    def image_paths(cls) -> dict[CharacterState, Optional[str]]:
+        """Returns the image file for every CharacterState
+
+        States without an own png in the 'resources' directory are mapped to None, except for the DEFAULT state.
+
+        :return: dictionary with CharacterStates as keys and image paths (or None) as values
+        """
         base_directory = path.join("resources", "actors", cls.__name__)
-        state_images = {}
-        default = read_image(path.join(base_directory, "default.png"))
-        state_images[CharacterState.DEFAULT] = default
+        image_paths = {}
         for state in CharacterState:
             filename = path.join(base_directory, f"{str(state.name).lower()}.png")
-            if path.exists(filename):
-                state_images[state] = read_image(filename)
-            else:
-                state_images[state] = default
-        return state_images
+            image_paths[state] = filename if path.exists(filename) else None
+        image_paths[CharacterState.DEFAULT] = path.join(base_directory, "default.png")
+        return image_paths
 
     @property
     def active_weapon_idx(self) -> int:
@@ -122,9 +148,23 @@ class Character(pygame.sprite.Sprite, ABC):
         """Character health"""
         return self._health
 
-    def calc_new_health(self, projectiles: [Projectile]):
-        projectiles_hit = pygame.sprite.spritecollide(self, projectiles, True)
-        for projectile in projectiles_hit:
+    def calc_new_health(self, projectiles: Iterable[Projectile]) -> None:
+        """Applies the damage of all projectiles that hit the Character
+
+        :param projectiles: projectiles that might hit the Character, e.g. candidates queried from a SpatialHash
+        """
+        for projectile in projectiles:
+            self.take_hit(projectile)
+
+    def take_hit(self, projectile: Projectile) -> None:
+        """Applies a projectile's damage if it collides with the Character
+
+        A projectile can only hit once, so it is removed from the game on collision.
+
+        :param projectile: projectile that might hit the Character
+        """
+        if projectile.alive() and self.rect.colliderect(projectile.rect):
+            projectile.kill()
             self.health -= projectile.damage_points
 
     @health.setter
@@ -168,7 +208,9 @@ class Character(pygame.sprite.Sprite, ABC):
     def reset(self) -> None:
         """Resets the Character"""
         self.position = pygame.Vector2(200, 200)
+        self.previous_position = self.position.copy()
         self.health = self.initial_health
+        self.attack_ready = True
         self.draw()
 
     @abstractmethod
@@ -179,39 +221,82 @@ class Character(pygame.sprite.Sprite, ABC):
         aiming.
         """
 
-    def draw(self) -> None:
-        """Renders the Player
+    def render_position(self, alpha: float = 1.0) -> pygame.Vector2:
+        """Interpolates the Character's position between the last two simulation steps
+
+        :param alpha: fraction of a simulation step that has passed since the last step (0 to 1)
+        :return: position to render the Character at
+        """
+        return self.previous_position.lerp(self.position, max(0.0, min(1.0, alpha)))
+
+    def draw(self, alpha: float = 1.0, camera: Optional[Camera] = None) -> None:
+        """Renders the Character and its active Weapon
 
         Chooses the correct image depending on the Character's state, rotates it based on the 'rotation' attribute and
-        displays it. This method is called every tick.
+        displays it at its interpolated position. This method is called every frame. Characters outside the camera's
+        view are skipped (their 'actor' is set to None), but their Weapon's projectiles are still drawn.
+
+        :param alpha: fraction of a simulation step that has passed since the last step (0 to 1)
+        :param camera: Camera used for the world-to-screen transform, without one world and screen are the same
         """
-        img = self.images[self.state].copy()
-        rot_img = rotate_image(img=img, angle=self.rotation)
-        self.actor = self.display.blit(rot_img, self.position)
-        self.rect = self.actor
+        image = self.images[self.state]
+        position = self.render_position(alpha)
+        if camera is not None:
+            # rotating enlarges the image by up to half its size
+            bounds = image.get_rect(topleft=position)
+            if not camera.is_visible(bounds.inflate(bounds.width // 2, bounds.height // 2)):
+                self.actor = None
+                if self.active_weapon:
+                    self.active_weapon.draw(self.rotation, alpha, camera)
+                return
+            position = camera.to_screen(position)
+        rot_img = rotation_cache.rotate(image, self.rotation)
+        self.actor = self.display.blit(rot_img, position)
+        if self.active_weapon:
+            self.active_weapon.draw(self.rotation, alpha, camera)
 
     def attack(self) -> None:
-        """Attacks with the Character's Weapon"""
-        if self.state not in [CharacterState.KILLED, CharacterState.IMMOVABLE] and \
-                self.frames_since_last_attack >= self.active_weapon.fire_rate:
-            self.active_weapon.attack(angle=self.rotation)
-            self.frames_since_last_attack = 0
+        """Attacks with the Character's Weapon
+
+        With a TimerWheel, the Weapon's cooldown runs on the wheel, otherwise it is tracked in 'time_since_last_attack'.
+        """
+        if self.state in [CharacterState.KILLED, CharacterState.IMMOVABLE] or self.active_weapon is None:
+            return
+        if self.timers is not None:
+            if not self.attack_ready:
+                return
+            self.attack_ready = False
+            self.timers.schedule(self.active_weapon.fire_rate, self._reload)
+        elif self.time_since_last_attack < self.active_weapon.fire_rate:
+            return
+        self.active_weapon.attack(angle=self.rotation)
+        self.time_since_last_attack = 0.0
+
+    def _reload(self) -> None:
+        """Ends the Weapon's cooldown"""
+        self.attack_ready = True
 
     @abstractmethod
-    def move(self) -> None:
+    def move(self, dt: float) -> None:
         """Moves the Character
 
         This method must move the Character across the map either depending on user input or on the player's location.
-        This method is called every tick.
+        This method is called every simulation step.
+
+        :param dt: length of the simulation step in seconds
         """
 
-    def update(self, game_state: GameState, *args, **kwargs) -> None:
-        """Method to run on tick
+    def update(self, game_state: GameState, dt: float, *args, update_weapon: bool = True, **kwargs) -> None:
+        """Method to run on every simulation step
 
         This method changes a Character's state based on the game's current state (e.g., PAUSED or WIN). If the
-        Character is able to move, '_calculate_rotation()' and 'move' are called.
+        Character is able to move, '_calculate_rotation()' and 'move' are called. Rendering is done separately in
+        'draw'.
 
         :param game_state: current GameState
+        :param dt: time since the Character's last update in seconds (usually the length of the simulation step)
+        :param update_weapon: position the active Weapon in the Character's hand (skipped for off-screen Characters),
+                              the Weapon's projectiles are always updated
         """
         if game_state in [GameState.READY, GameState.PAUSED, GameState.WIN]:
             self.state = CharacterState.IMMOVABLE
@@ -221,10 +306,15 @@ class Character(pygame.sprite.Sprite, ABC):
                 self.state = CharacterState.CRITICAL
             else:
                 self.state = CharacterState.DEFAULT
+        self.previous_position = self.position.copy()
         if self.state not in [CharacterState.KILLED, CharacterState.IMMOVABLE]:
             self._calculate_rotation()
-            self.move()
-        self.draw()
+            self.move(dt)
+        self.rect = self.images[self.state].get_rect(topleft=self.position)
         if self.active_weapon:
-            self.active_weapon.update(game_state, self.rotation)
-        self.frames_since_last_attack += 1
+            if update_weapon:
+                self.active_weapon.update(game_state, dt, self.rotation)
+            else:
+                self.active_weapon.update_projectiles(game_state, dt)
+                self.active_weapon.rect = None  # recomputed when attacking
+        self.time_since_last_attack += dt
@@ -1,18 +1,38 @@
 from math import pi, atan2
 from abc import ABC
+from typing import Optional
 
 import pygame
 import random
 
 from .character import Character, CharacterState
 from .player import Player
-from game.utilities.events import ENEMY_KILLED_EVENT, ENEMY_DESPAWN_EVENT
-from ..utilities import GameState
+from game.utilities.events import EnemyKilledEvent, EnemyDespawnEvent
+from ..utilities import GameState, NeighbourGrid, FlowField
 from game.game_objects.ranged.bow import generate_bow, Bow
+from .steering import SteeringSystem
 
 
 class Enemy(Character, ABC):
-    def __init__(self, target: Player, points: int = 10, *args, **kwargs):
+    team = "enemy"
+    steering: Optional[SteeringSystem] = None
+    steering_slot: Optional[int] = None
+    crowd: Optional[NeighbourGrid] = None  # neighbour grid of the Enemy's wave, used for local avoidance
+    separation_radius = 48  # Enemies closer than this push each other apart (pixels)
+    separation_weight = 1.5  # strength of the push compared to the pull towards the target
+    flow_field: Optional[FlowField] = None  # shared FlowField towards the target, used to walk around obstacles
+    despawn_delay = 2.0  # time in seconds a killed Enemy stays on the map
+    _on_screen = True
+    lod_elapsed = 0.0  # time since the last update by the LODScheduler
+
+    def __init__(self, target: Player, points: int = 10, *args, rng: Optional[random.Random] = None, **kwargs):
+        """Base class of all Enemies
+
+        :param target: Player the Enemy attacks
+        :param points: points the Player gets for killing the Enemy
+        :param rng: random number generator for the speed, the game's seeded one for deterministic replays
+        """
+        self.rng = rng if rng is not None else random.Random()
         super().__init__(*args, **kwargs)
         self.target = target
         self.points = points
@@ -24,50 +44,206 @@ class Enemy(Character, ABC):
         value = max(0.0, value)
         new_state = self._get_future_state_from_health(value)
         if new_state == CharacterState.KILLED and self.state != new_state:
-            kill_event = pygame.event.Event(ENEMY_KILLED_EVENT)  # create an ENEMY_KILLED_EVENT
-            kill_event.killed = self  # attach the killed enemy (self) to the event
-            pygame.event.post(kill_event)  # fire the event so the Player gets points based on the enemy
-            despawn_event = pygame.event.Event(ENEMY_DESPAWN_EVENT)  # set a timer so the Enemy is despawned from the game
-            despawn_event.killed = self
-            pygame.time.set_timer(despawn_event, 2_000)
+            if self.events is not None:
+                self.events.publish(EnemyKilledEvent(self))  # so the Player gets points based on the enemy
+            self._schedule_despawn()
         self.state = new_state
         self._health = value
+        if self.steering is not None:
+            self.steering.alive[self.steering_slot] = value > 0
+            self.steering.awake[self.steering_slot] = True  # updated in Python, e.g., to switch weapons
+
+    def _schedule_despawn(self) -> None:
+        """Removes the killed Enemy from the game after 'despawn_delay' seconds
+
+        The delay runs on the shared TimerWheel, so it only counts down while the simulation runs. Without a TimerWheel,
+        the Enemy is removed immediately.
+        """
+        if self.timers is not None:
+            self.timers.schedule(self.despawn_delay, self._despawn)
+        else:
+            self._despawn()
+
+    def kill(self) -> None:
+        """Removes the Enemy from all groups and from its SteeringSystem and culls its weapons' projectiles in flight"""
+        for weapon in self.weapons:
+            weapon.cull_projectiles("despawn")
+        if self.steering is not None:
+            self.steering.remove(self)
+        super().kill()
+
+    def _despawn(self) -> None:
+        """Removes the Enemy from the game and publishes an EnemyDespawnEvent"""
+        self.kill()
+        if self.events is not None:
+            self.events.publish(EnemyDespawnEvent(self))
+
+    @property
+    def position(self) -> pygame.Vector2:
+        """Position of the Enemy
+
+        Enemies registered with a SteeringSystem store their position in the system's arrays, the returned vector is a
+        copy, so the position has to be assigned (e.g., with '+=') to change it.
+        """
+        if self.steering is None:
+            return self._position
+        return pygame.Vector2(*self.steering.position[self.steering_slot])
+
+    @position.setter
+    def position(self, value: pygame.Vector2) -> None:
+        if self.steering is None:
+            self._position = pygame.Vector2(value)
+        else:
+            self.steering.position[self.steering_slot] = value
+
+    @property
+    def previous_position(self) -> pygame.Vector2:
+        """Position of the previous simulation step (a copy for Enemies registered with a SteeringSystem)"""
+        if self.steering is None:
+            return self._previous_position
+        return pygame.Vector2(*self.steering.previous[self.steering_slot])
+
+    @previous_position.setter
+    def previous_position(self, value: pygame.Vector2) -> None:
+        if self.steering is None:
+            self._previous_position = pygame.Vector2(value)
+        else:
+            self.steering.previous[self.steering_slot] = value
+
+    @property
+    def rotation(self) -> float:
+        """Rotation of the Enemy, computed for the whole wave by a SteeringSystem"""
+        if self.steering is None:
+            return self._rotation
+        return float(self.steering.rotation[self.steering_slot])
+
+    @rotation.setter
+    def rotation(self, value: float) -> None:
+        if self.steering is None:
+            self._rotation = value
+        else:
+            self.steering.rotation[self.steering_slot] = value
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """Area covered by the Enemy
+
+        Enemies registered with a SteeringSystem have their rects moved by the system, the returned Rect is a copy.
+        """
+        if self.steering is None:
+            return self._rect
+        return pygame.Rect(self.steering.rects[self.steering_slot].tolist())
+
+    @rect.setter
+    def rect(self, value: pygame.Rect) -> None:
+        if self.steering is None:
+            self._rect = value
+        else:
+            self.steering.rects[self.steering_slot] = value
+
+    @property
+    def on_screen(self) -> bool:
+        """Whether the Enemy is in view (set by the LODScheduler or the SteeringSystem), off-screen ones aren't drawn"""
+        if self.steering is None:
+            return self._on_screen
+        return bool(self.steering.on_screen[self.steering_slot])
+
+    @on_screen.setter
+    def on_screen(self, value: bool) -> None:
+        if self.steering is None:
+            self._on_screen = value
+        else:
+            self.steering.on_screen[self.steering_slot] = value
 
     @property
     def vector_to_target(self) -> pygame.Vector2:
         """Vector from Enemy to Player
 
         Calculates the vector from the Enemy to its target/the Player. The vector is normalized (so its length is 1)
-        so it can be multiplied with the 'speed' attribute when the Enemy is moved.
+        so it can be multiplied with the 'speed' attribute when the Enemy is moved. If the Enemy stands exactly on its
+        target, a zero vector is returned.
 
         :return: Vector from Enemy to Player
         """
-        return (self.target.position - self.position).normalize()
+        if self.steering is not None:
+            return pygame.Vector2(*self.steering.direction[self.steering_slot])
+        offset = self.target.position - self.position
+        return offset.normalize() if offset.length_squared() else offset
 
     def _calculate_rotation(self):
         """Determines the Enemy's rotation from the Player position
 
         Calculates the Enemy's image/aiming rotation based on the Player's and its own position. Atan2 is used to
-        calculate the rotation from the vector_to_target property.
+        calculate the rotation from the vector_to_target property. With a SteeringSystem, the rotation is computed for
+        the whole wave.
         """
-        rotation = (180 / pi) * -atan2(self.vector_to_target.y, self.vector_to_target.x)
+        if self.steering is not None:
+            return
+        direction = self.vector_to_target
+        rotation = (180 / pi) * -atan2(direction.y, direction.x)
         self.rotation = (0 - rotation) % 360
 
-    def move(self):
-        """Moves the Enemy towards the Player, if the Player is alive"""
-        if self.target.is_alive:
-            delta = self.vector_to_target
-            distance = (self.target.position - self.position).length()
-            if self.active_weapon is not None and distance >= self.active_weapon.hitbox_radius:
-                self.position += self.speed * delta
-            if self.active_weapon and distance < self.active_weapon.hitbox_radius:
+    def _flow_direction(self) -> Optional[pygame.Vector2]:
+        """Direction of the FlowField at the Enemy's position
+
+        On a map with obstacles, the Enemy always follows the FlowField (which also leads out of blocked tiles). Where
+        the field has no direction (on the target's tile, on unreachable tiles or without obstacles), None is returned
+        and the Enemy walks straight towards the target.
+        """
+        if self.flow_field is None:
+            return None
+        direction = self.flow_field.direction(self.position)
+        return direction if direction else None
+
+    def _separation(self) -> pygame.Vector2:
+        """Direction away from the nearby Enemies of the same wave
+
+        Every neighbour within 'separation_radius' pushes the Enemy away, the closer it is, the stronger the push. The
+        length of the result is limited to 1. Without a neighbour grid, a zero vector is returned.
+        """
+        push = pygame.Vector2()
+        if self.crowd is None:
+            return push
+        position = self.position
+        for _, other_position in self.crowd.neighbours(self, position, self.separation_radius):
+            offset = position - other_position
+            distance = offset.length()
+            if distance:
+                push += offset * ((self.separation_radius - distance) / (self.separation_radius * distance))
+        if push.length_squared() > 1:
+            push.scale_to_length(1)
+        return push
+
+    def move(self, dt: float):
+        """Moves the Enemy towards the Player, if the Player is alive
+
+        Enemies that aren't in range to attack walk towards the Player (following the FlowField around obstacles), all
+        Enemies are pushed apart by their nearby neighbours so they don't stack up on top of each other. Enemies
+        registered with a SteeringSystem are moved by the system, they only attack here.
+
+        :param dt: length of the simulation step in seconds
+        """
+        if not self.target.is_alive or self.active_weapon is None:
+            return
+        if self.steering is not None:
+            if self.steering.in_range[self.steering_slot]:
                 self.attack()
+            return
+        in_range = (self.target.position - self.position).length() < self.active_weapon.hitbox_radius
+        if not in_range:
+            direction = self._flow_direction()
+            self.position += self.speed * dt * (direction if direction is not None else self.vector_to_target)
+        separation = self._separation()
+        if separation:
+            self.position += self.speed * dt * self.separation_weight * separation
+        if in_range:
+            self.attack()
 
     def _generate_unique_speed(self, min_speed, max_speed):
-        """Creates for every enemy in a wave, a unique speed"""
+        """Creates for every enemy in a wave, a unique speed (in pixels per second)"""
         speeds = [enemy.speed for enemy in self.enemies.sprites()]
         while True:
-            speed = random.uniform(min_speed, max_speed)
+            speed = self.rng.uniform(min_speed, max_speed)
             if speed not in speeds:
                 return speed
 
@@ -79,7 +255,7 @@ class Enemy1(Enemy):
         super().__init__(*args, **kwargs)
         self.points = 150
         self.initial_health = self.health
-        self.speed = self._generate_unique_speed(1.8, 2.5)
+        self.speed = self._generate_unique_speed(108, 150)
 
 
 class Enemy2(Enemy):
@@ -89,7 +265,7 @@ class Enemy2(Enemy):
         super().__init__(*args, **kwargs)
         self.points = 200
         self.initial_health = self.health
-        self.speed = self._generate_unique_speed(1.5, 2)
+        self.speed = self._generate_unique_speed(90, 120)
 
 
 class Enemy3(Enemy):
@@ -99,7 +275,7 @@ class Enemy3(Enemy):
         super().__init__(*args, **kwargs)
         self.points = 250
         self.initial_health = self.health
-        self.speed = self._generate_unique_speed(1, 1.5)
+        self.speed = self._generate_unique_speed(60, 90)
 
 
 class Enemy4(Enemy):
@@ -109,10 +285,12 @@ class Enemy4(Enemy):
         super().__init__(*args, **kwargs)
         self.points = 300
         self.initial_health = self.health
-        self.speed = self._generate_unique_speed(1.2, 1.2)
+        self.speed = self._generate_unique_speed(72, 72)
 
     def update(self, game_state: GameState, *args, **kwargs) -> None:
         super().update(game_state, *args, **kwargs)
         if self.health < self.initial_health / 2 and not isinstance(self.active_weapon, Bow):
             self.weapons.add(generate_bow(self.display, self))
             self.active_weapon_idx += 1
+            if self.steering is not None:
+                self.steering.set_attack_radius(self.steering_slot, self.active_weapon.hitbox_radius)
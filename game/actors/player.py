@@ -1,11 +1,14 @@
 from math import pi, atan2
+from typing import Optional
 
 import pygame
 from pygame.locals import *
 
 from .character import Character, CharacterState
 from game.game_objects import generate_prime_sword, generate_wooden_sword
-from game.utilities.events import PLAYER_KILLED_EVENT
+from game.utilities.events import PlayerKilledEvent
+from game.utilities.input import InputSource
+from game.utilities.camera import Camera
 from game.game_objects.melee.axe import generate_double_edged_axe, generate_single_edged_axe
 from game.game_objects.ranged.bow import generate_bow
 from game.game_objects.ranged.wand import generate_wand
@@ -17,13 +20,20 @@ class Player(Character):
     This class represents the player. It inherits from Character and implements the necessary abstract methods.
     """
     initial_health = 1_000.0
+    team = "player"
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, input_source: Optional[InputSource] = None, camera: Optional[Camera] = None,
+                 **kwargs):
         """
         Player class
+
+        :param input_source: source of mouse and keyboard input, reads the real mouse and keyboard by default
+        :param camera: Camera used to convert the mouse position to world coordinates
         """
+        self.input_source = input_source or InputSource()
+        self.camera = camera
         super().__init__(*args, **kwargs)
-        self.speed = 3
+        self.speed = 180
         # give the Player some initial weapons
         self.unlockable_weapons = []
         for weapon in [generate_wooden_sword(display=self.display, owner=self),
@@ -41,24 +51,28 @@ class Player(Character):
     def health(self, value: float):
         """Changes the Player's health
 
-        If the Player's state changes to KILLED, a PLAYER_KILLED_EVENT is fired to end the game (only on change so the
-        event isn't triggered more than once).
+        If the Player's state changes to KILLED, a PlayerKilledEvent is published to end the game (only on change so
+        the event isn't triggered more than once).
 
         :param value: new health
         """
         value = max(0.0, value)
         new_state = self._get_future_state_from_health(value)
         if new_state == CharacterState.KILLED and self.state != new_state:
-            pygame.event.post(pygame.event.Event(PLAYER_KILLED_EVENT))
+            if self.events is not None:
+                self.events.publish(PlayerKilledEvent(self))
         self.state = new_state
         self._health = value
 
     def _calculate_rotation(self) -> None:
         """Determines the Player's rotation from mouse position
 
-        Calculates the Player's image/aiming rotation based on the mouse position on screen using atan2.
+        Calculates the Player's image/aiming rotation based on the mouse position using atan2. The mouse position is
+        converted to world coordinates with the Player's camera, if it has one.
         """
-        mouse_pos = pygame.Vector2(pygame.mouse.get_pos())
+        mouse_pos = pygame.Vector2(self.input_source.get_mouse_pos())
+        if self.camera is not None:
+            mouse_pos = self.camera.to_world(mouse_pos)
         delta = mouse_pos - self.position
         rotation = (180 / pi) * -atan2(delta.y, delta.x)
         self.rotation = (0 - rotation) % 360
@@ -70,28 +84,33 @@ class Player(Character):
 
     def reset(self):
         super().reset()
+        for weapon in self.unlockable_weapons:
+            weapon.cull_projectiles("reset")
         self.weapons.empty()
         self._active_weapon_idx = 0
 
-    def move(self) -> None:
+    def move(self, dt: float) -> None:
         """Moves the player based on keyboard input
 
         Calculates a movement vector based on the user's input on the keyboard.
+
+        :param dt: length of the simulation step in seconds
         """
-        directions = self._get_movement_vector()
-        self.position += directions * self.speed
+        directions = self._get_movement_vector(self.input_source)
+        self.position += directions * self.speed * dt
 
     @staticmethod
-    def _get_movement_vector() -> pygame.Vector2:
+    def _get_movement_vector(input_source: InputSource) -> pygame.Vector2:
         """
         Derives a movement vector from the currently pressed keys
 
         Keyboard inputs are checked to create movement vector. This vector is normalized, so it can be multiplied with
         'speed' when moving the Player.
 
+        :param input_source: source of the keyboard state
         :return: Vector2 representing the movement directions
         """
-        keys = pygame.key.get_pressed()
+        keys = input_source.get_pressed()
         delta_x, delta_y = 0, 0
         if keys[K_LEFT] or keys[K_a]:
             delta_x -= 1
@@ -0,0 +1,302 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Sequence
+
+import pygame
+
+from game.utilities import FlowField, GameState
+from game.utilities.neighbour_grid import NEIGHBOUR_CELLS
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the SteeringSystem
+    np = None
+
+if TYPE_CHECKING:
+    from .enemy import Enemy
+    from game.game_objects.projectile import Projectile
+
+CELL_KEY = 1 << 32  # factor combining a cell's x and y coordinate into one key
+HIT_TEST_CELLS = 1 << 20  # maximum number of (projectile, Enemy) pairs tested at once in 'hits'
+
+
+class SteeringSystem:
+    """Batch steering for all Enemies of a wave
+
+    The positions, speeds and attack radii of all Enemies of a wave are stored in NumPy arrays. Once per simulation
+    step, 'step' computes the direction to the target, the distance, the rotation and whether an Enemy is in range to
+    attack for the whole wave. 'update_due' updates the Enemies that are due (in range to attack, hit or with
+    projectiles in flight) in Python. 'move' then moves all Enemies that aren't in range (along the FlowField, if it
+    has a direction), pushes Enemies that are too close apart and updates their rects, all in vectorized passes.
+    Enemies registered with a SteeringSystem are thin views over that state: their 'position', 'previous_position',
+    'rotation', 'rect' and 'on_screen' are read from the arrays, so the Enemies that aren't due cost no Python at all.
+
+    Slots are kept dense: when an Enemy is removed (e.g., when it despawns), the last slot is moved into its place, so
+    'step' only computes Enemies that are still on the map.
+    """
+
+    # per-Enemy arrays, moved together when a slot is freed
+    ARRAYS = ["position", "previous", "speed", "attack_radius", "direction", "distance", "rotation", "in_range",
+              "alive", "awake", "rects", "on_screen"]
+
+    def __init__(self, capacity: int = 64, separation_radius: float = 48, separation_weight: float = 1.5,
+                 max_candidates: int = 4):
+        """Batch steering for all Enemies of a wave
+
+        :param capacity: initial number of Enemies the arrays can hold, they grow when needed
+        :param separation_radius: Enemies closer than this push each other apart (pixels)
+        :param separation_weight: strength of the push compared to the pull towards the target
+        :param max_candidates: maximum number of Enemies per grid cell an Enemy is pushed by (with 9 cells, about the
+                               candidate budget of a NeighbourGrid), so the separation stays linear when Enemies pile up
+        """
+        if np is None:
+            raise ImportError("The SteeringSystem requires numpy (pip install numpy)")
+        self.count = 0
+        self.enemies: list[Enemy] = []  # registered Enemies by slot
+        self.separation_radius = separation_radius
+        self.separation_weight = separation_weight
+        self.max_candidates = max_candidates
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        """Creates (or grows) the arrays, keeping the registered Enemies' state"""
+        old = getattr(self, "position", None)
+        arrays = {
+            "position": np.zeros((capacity, 2)),
+            "previous": np.zeros((capacity, 2)),
+            "speed": np.zeros(capacity),
+            "attack_radius": np.zeros(capacity),
+            "direction": np.zeros((capacity, 2)),
+            "distance": np.zeros(capacity),
+            "rotation": np.zeros(capacity),
+            "in_range": np.zeros(capacity, dtype=bool),
+            "alive": np.zeros(capacity, dtype=bool),
+            "awake": np.zeros(capacity, dtype=bool),
+            "rects": np.zeros((capacity, 4), dtype=np.int64),
+            "on_screen": np.ones(capacity, dtype=bool),
+        }
+        for name, array in arrays.items():
+            if old is not None:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, enemy: Enemy) -> None:
+        """Registers an Enemy, moving its position, rotation and rect into the arrays
+
+        :param enemy: Enemy to steer
+        """
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        slot = self.count
+        self.position[slot] = enemy.position
+        self.previous[slot] = enemy.previous_position
+        self.speed[slot] = enemy.speed
+        self.attack_radius[slot] = enemy.active_weapon.hitbox_radius if enemy.active_weapon else 0.0
+        self.rotation[slot] = enemy.rotation
+        self.alive[slot] = enemy.is_alive
+        self.awake[slot] = True  # updated once in Python, so its state and weapon are set up
+        self.rects[slot] = enemy.rect
+        self.on_screen[slot] = True
+        self.count += 1
+        self.enemies.append(enemy)
+        enemy.steering = self
+        enemy.steering_slot = slot
+
+    def remove(self, enemy: Enemy) -> None:
+        """Unregisters an Enemy, moving its state back into the Enemy and the last slot into its place
+
+        :param enemy: registered Enemy
+        """
+        slot = enemy.steering_slot
+        self._detach(enemy)
+        last = self.count - 1
+        if slot != last:
+            for name in self.ARRAYS:
+                array = getattr(self, name)
+                array[slot] = array[last]
+            moved = self.enemies[slot] = self.enemies[last]
+            moved.steering_slot = slot
+        self.enemies.pop()
+        self.count = last
+
+    def _detach(self, enemy: Enemy) -> None:
+        slot = enemy.steering_slot
+        enemy.steering = None
+        enemy.steering_slot = None
+        enemy.position = pygame.Vector2(*self.position[slot])
+        enemy.previous_position = pygame.Vector2(*self.previous[slot])
+        enemy.rotation = float(self.rotation[slot])
+        enemy.rect = pygame.Rect(self.rects[slot].tolist())
+        enemy.on_screen = bool(self.on_screen[slot])
+
+    def set_attack_radius(self, slot: int, radius: float) -> None:
+        """Changes the attack radius of an Enemy, e.g., when it switches weapons"""
+        self.attack_radius[slot] = radius
+
+    def clear(self) -> None:
+        """Unregisters all Enemies"""
+        for enemy in self.enemies:
+            self._detach(enemy)
+        self.enemies = []
+        self.count = 0
+
+    def due(self) -> list[Enemy]:
+        """Returns the Enemies that have to be updated in Python: living ones in range to attack and awake ones"""
+        count = self.count
+        slots = np.flatnonzero((self.in_range[:count] & self.alive[:count]) | self.awake[:count])
+        return [self.enemies[slot] for slot in slots.tolist()]
+
+    def wake(self) -> None:
+        """Marks all Enemies as awake, so all of them are updated in Python in the next step (e.g., after a pause)"""
+        self.awake[:self.count] = True
+
+    def step(self, target_position: pygame.Vector2) -> None:
+        """Computes direction, distance, rotation and the in-range mask for all Enemies
+
+        Enemies standing exactly on the target get a zero direction instead of a division by zero.
+
+        :param target_position: position of the Enemies' target
+        """
+        count = self.count
+        delta = np.asarray(target_position, dtype=float) - self.position[:count]
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+        self.distance[:count] = distance
+        self.direction[:count] = delta / np.where(distance > 0, distance, 1.0)[:, None]
+        self.rotation[:count] = np.degrees(np.arctan2(delta[:, 1], delta[:, 0])) % 360
+        self.in_range[:count] = distance < self.attack_radius[:count]
+
+    def update_due(self, game_state: GameState, dt: float) -> int:
+        """Updates the due Enemies in Python (attacks, state changes and their weapons' projectiles)
+
+        An Enemy stays awake while its weapon has projectiles in flight.
+
+        :param game_state: current GameState
+        :param dt: length of the simulation step in seconds
+        :return: number of updated Enemies
+        """
+        due = self.due()
+        for enemy in due:
+            enemy.update(game_state, dt, update_weapon=enemy.on_screen)
+            if enemy.steering is self:
+                weapon = enemy.active_weapon
+                self.awake[enemy.steering_slot] = weapon is not None and len(weapon.fired_projectiles) > 0
+        return len(due)
+
+    def move(self, dt: float, flow_field: Optional[FlowField] = None, separation: bool = True,
+             view: Optional[pygame.Rect] = None) -> None:
+        """Moves all Enemies, updates their rects and marks the ones overlapping the view as on screen
+
+        Living Enemies that aren't in range walk towards the target, along the FlowField where it has a direction.
+        Living Enemies that are too close to each other are pushed apart.
+
+        :param dt: length of the simulation step in seconds
+        :param flow_field: FlowField towards the target
+        :param separation: push Enemies apart that are closer than 'separation_radius'
+        :param view: visible area (including a margin), all Enemies count as on screen without a view
+        """
+        count = self.count
+        position = self.position[:count]
+        self.previous[:count] = position
+        alive = self.alive[:count]
+        in_range = self.in_range[:count, None]
+        distance = np.where(alive, self.speed[:count] * dt, 0.0)
+        walk = self.direction[:count]
+        if flow_field is not None and flow_field.active:
+            field = self._field_directions(flow_field, position)
+            walk = np.where(field.any(axis=1)[:, None], field, walk)
+        position += np.where(in_range, 0.0, walk) * distance[:, None]
+        if separation:
+            position += self._separation(np.flatnonzero(alive)) * (distance * self.separation_weight)[:, None]
+        rects = self.rects[:count]
+        rects[:, :2] = position  # truncated like pygame.Rect
+        if view is None:
+            self.on_screen[:count] = True
+        else:
+            self.on_screen[:count] = ((rects[:, 0] < view.right) & (rects[:, 0] + rects[:, 2] > view.left)
+                                      & (rects[:, 1] < view.bottom) & (rects[:, 1] + rects[:, 3] > view.top))
+
+    def hits(self, projectiles: Sequence[Projectile]) -> list[tuple[Enemy, Projectile]]:
+        """Returns all pairs of an Enemy and a projectile whose rects collide
+
+        The projectiles' rects are tested against the rects of all Enemies at once, in chunks of projectiles.
+
+        :param projectiles: projectiles that might hit the Enemies
+        :return: list of (Enemy, projectile) tuples
+        """
+        count = self.count
+        if not count or not projectiles:
+            return []
+        rects = self.rects[:count]
+        left, top = rects[:, 0], rects[:, 1]
+        right, bottom = left + rects[:, 2], top + rects[:, 3]
+        boxes = np.array([projectile.rect for projectile in projectiles], dtype=np.int64).reshape(-1, 4)
+        pairs = []
+        chunk = max(1, HIT_TEST_CELLS // count)
+        for first in range(0, len(boxes), chunk):
+            box = boxes[first:first + chunk]
+            box_right, box_bottom = (box[:, 0] + box[:, 2])[:, None], (box[:, 1] + box[:, 3])[:, None]
+            hit = (left < box_right) & (right > box[:, 0, None]) & (top < box_bottom) & (bottom > box[:, 1, None])
+            for projectile, slot in zip(*np.nonzero(hit)):
+                pairs.append((self.enemies[slot], projectiles[first + projectile]))
+        return pairs
+
+    @staticmethod
+    def _field_directions(flow_field: FlowField, position: np.ndarray) -> np.ndarray:
+        """Looks up the FlowField's direction for every position, once per occupied tile"""
+        size = flow_field.tile_size
+        x = np.clip((position[:, 0] // size).astype(np.int64), 0, flow_field.columns - 1)
+        y = np.clip((position[:, 1] // size).astype(np.int64), 0, flow_field.rows - 1)
+        tiles, inverse = np.unique(y * flow_field.columns + x, return_inverse=True)
+        directions = np.array([tuple(flow_field.tile_direction(tile)) for tile in tiles.tolist()], dtype=float)
+        return directions.reshape(-1, 2)[inverse.reshape(-1)]
+
+    def _separation(self, slots: np.ndarray) -> np.ndarray:
+        """Direction away from the nearby Enemies for every slot, with a length of at most 1
+
+        The Enemies in 'slots' are sorted into a grid with cells of 'separation_radius' pixels. Every Enemy is pushed
+        by up to 'max_candidates' Enemies of its own and each of the eight surrounding cells that are within
+        'separation_radius', the closer, the stronger. The candidate pairs are generated with array operations, so
+        the cost is linear in the number of Enemies.
+
+        :param slots: slots of the Enemies that push and are pushed (e.g., the living ones)
+        :return: array with one push per slot (zero for slots that aren't in 'slots')
+        """
+        radius = self.separation_radius
+        push = np.zeros((self.count, 2))
+        if len(slots) < 2:
+            return push
+        cells = np.floor(self.position[slots] / radius).astype(np.int64)
+        keys = cells[:, 0] * CELL_KEY + cells[:, 1]
+        order = np.argsort(keys, kind="stable")  # everything below is in key order, so the lookups are sorted, too
+        keys, position = keys[order], self.position[slots[order]]
+        own, other = [], []
+        for offset_x, offset_y in NEIGHBOUR_CELLS:
+            neighbour_keys = keys + (offset_x * CELL_KEY + offset_y)
+            start = np.searchsorted(keys, neighbour_keys, side="left")
+            found = np.minimum(np.searchsorted(keys, neighbour_keys, side="right") - start, self.max_candidates)
+            total = int(found.sum())
+            if not total:
+                continue
+            first = np.cumsum(found) - found
+            own.append(np.repeat(np.arange(len(slots)), found))
+            other.append(np.repeat(start - first, found) + np.arange(total))
+        if not own:
+            return push
+        own, other = np.concatenate(own), np.concatenate(other)
+        x, y = position[:, 0].copy(), position[:, 1].copy()
+        offset_x, offset_y = x.take(own) - x.take(other), y.take(own) - y.take(other)
+        distance = offset_x * offset_x + offset_y * offset_y
+        close = (distance > 0) & (distance < radius * radius)
+        own, offset_x, offset_y, distance = own[close], offset_x[close], offset_y[close], np.sqrt(distance[close])
+        if not len(own):
+            return push
+        weight = (radius - distance) / (radius * distance)
+        local = np.stack([np.bincount(own, offset_x * weight, len(slots)),
+                          np.bincount(own, offset_y * weight, len(slots))], axis=1)
+        length = np.sqrt((local * local).sum(axis=1))
+        local /= np.maximum(length, 1.0)[:, None]
+        push[slots[order]] = local
+        return push
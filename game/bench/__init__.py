@@ -0,0 +1,5 @@
+"""Benchmarks for CircleClash
+
+Run them from the repository root with 'python -m game.bench'. All benchmarks run headless, so they work on machines
+without a display.
+"""
@@ -0,0 +1,126 @@
+import argparse
+
+from game.circleclashgame import RENDERERS, PROJECTILE_ENGINES, STEERING_ENGINES
+from .simulation import run_simulation_benchmark, print_simulation_report
+from .overlays import run_overlay_benchmark, print_overlay_report
+from .crowd import run_crowd_benchmark, print_crowd_report
+from .replay import run_replay, print_replay_report
+from .horde import run_horde_benchmark, print_horde_report
+from .pathing import run_pathing_check, print_pathing_report
+from .batch import WAVE_CONFIGS, BOTS, iter_batch, aggregate, print_batch_result, print_batch_report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m game.bench", description="Headless CircleClash benchmarks")
+    commands = parser.add_subparsers(dest="command")
+
+    simulation = commands.add_parser("simulation", help="run scripted waves as fast as possible (default)")
+    simulation.add_argument("--ticks", type=int, default=3_000, help="number of simulation steps")
+    simulation.add_argument("--waves", type=int, default=4, help="number of scripted waves")
+    simulation.add_argument("--enemies", type=int, default=30, help="enemies per wave")
+    simulation.add_argument("--no-render", action="store_true", help="skip rendering, only run the simulation")
+    simulation.add_argument("--renderer", choices=RENDERERS, default="full", help="renderer used by the game")
+    simulation.add_argument("--projectiles", choices=PROJECTILE_ENGINES, default="sprites",
+                            help="projectile engine used by the game")
+    simulation.add_argument("--steering", choices=STEERING_ENGINES, default="per_enemy",
+                            help="enemy steering engine used by the game")
+    simulation.add_argument("--no-lod", action="store_true", help="update all enemies on every tick")
+    simulation.add_argument("--profile", action="store_true", help="report the game's profiler scopes")
+    simulation.add_argument("--snapshot-every", type=int, default=0,
+                            help="take a game snapshot every n ticks and time it (0 to disable)")
+    simulation.add_argument("--reset-every", type=int, default=0,
+                            help="reset the game every n ticks to check resets (0 to only reset on win or death)")
+
+    overlays = commands.add_parser("overlays", help="compare per-frame overlay allocation with reused overlays")
+    overlays.add_argument("--frames", type=int, default=600, help="number of frames per variant")
+    overlays.add_argument("--width", type=int, default=1920, help="display width")
+    overlays.add_argument("--height", type=int, default=1080, help="display height")
+
+    crowd = commands.add_parser("crowd", help="per-frame cost of waves with and without crowd separation")
+    crowd.add_argument("--counts", type=int, nargs="+", default=[50, 500, 5_000], help="enemies per wave")
+    crowd.add_argument("--frames", type=int, default=60, help="number of simulation steps per wave")
+    crowd.add_argument("--steering", choices=STEERING_ENGINES, default="per_enemy",
+                       help="enemy steering engine used by the game")
+
+    replay = commands.add_parser("replay", help="play back a recorded session as fast as possible")
+    replay.add_argument("file", help="replay file recorded with 'run_game.py --record'")
+    replay.add_argument("--render", action="store_true", help="render a frame after every simulation step")
+    replay.add_argument("--no-profile", action="store_true", help="disable the game's profiler")
+    replay.add_argument("--profile-dump", help="file the profiler results are written to (.csv or .json)")
+    replay.add_argument("--renderer", choices=RENDERERS, default="full", help="renderer used by the game")
+    replay.add_argument("--projectiles", choices=PROJECTILE_ENGINES, default="sprites",
+                        help="projectile engine used by the game")
+    replay.add_argument("--steering", choices=STEERING_ENGINES, default="per_enemy",
+                        help="enemy steering engine used by the game")
+    replay.add_argument("--no-lod", action="store_true", help="update all enemies on every tick")
+
+    batch = commands.add_parser("batch", help="play many games with a bot in parallel to compare wave configurations")
+    batch.add_argument("--configs", nargs="+", default=["default"],
+                       help=f"wave configurations to play, wave files or one of {list(WAVE_CONFIGS)}")
+    batch.add_argument("--games", type=int, default=100, help="games per wave configuration")
+    batch.add_argument("--bot", choices=BOTS, default="scripted", help="bot playing the Player")
+    batch.add_argument("--max-ticks", type=int, default=36_000, help="maximum number of simulation steps per game")
+    batch.add_argument("--workers", type=int, help="number of worker processes (default: one per core)")
+    batch.add_argument("--seed", type=int, default=0, help="seed of the first game of every configuration")
+    batch.add_argument("--quiet", action="store_true", help="only print the summary, not every finished game")
+
+    horde = commands.add_parser("horde", help="play the endless mode and report the load it sustains")
+    horde.add_argument("--ticks", type=int, default=6_000, help="number of simulation steps")
+    horde.add_argument("--frame-budget", type=float, default=1_000 / 60, help="frame budget in milliseconds")
+    horde.add_argument("--no-render", action="store_true", help="skip rendering, only run the simulation")
+    horde.add_argument("--mortal", action="store_true", help="end the benchmark when the bot dies")
+    horde.add_argument("--passive", action="store_true", help="the bot doesn't attack, enemies pile up in wave 1")
+    horde.add_argument("--base-size", type=int, default=200, help="enemies of the first wave")
+    horde.add_argument("--growth", type=float, default=2.0, help="growth of the number of enemies per wave")
+    horde.add_argument("--max-size", type=int, default=20_000, help="maximum number of enemies of a wave")
+    horde.add_argument("--renderer", choices=RENDERERS, default="full", help="renderer used by the game")
+    horde.add_argument("--projectiles", choices=PROJECTILE_ENGINES, default="sprites",
+                       help="projectile engine used by the game")
+    horde.add_argument("--steering", choices=STEERING_ENGINES, default="per_enemy",
+                       help="enemy steering engine used by the game")
+    horde.add_argument("--no-lod", action="store_true", help="update all enemies on every tick")
+
+    pathing = commands.add_parser("pathing", help="check that an enemy walks around a wall instead of through it")
+    pathing.add_argument("--steering", choices=STEERING_ENGINES, default="per_enemy",
+                         help="enemy steering engine used by the game")
+
+    args = parser.parse_args()
+    if args.command in [None, "simulation"]:
+        if args.command is None:
+            args = simulation.parse_args([])
+        result = run_simulation_benchmark(ticks=args.ticks, num_waves=args.waves, enemies_per_wave=args.enemies,
+                                          render=not args.no_render, renderer=args.renderer,
+                                          projectile_engine=args.projectiles, steering_engine=args.steering,
+                                          lod=not args.no_lod, profile=args.profile,
+                                          snapshot_interval=args.snapshot_every, reset_interval=args.reset_every)
+        print_simulation_report(result)
+    elif args.command == "overlays":
+        print_overlay_report(run_overlay_benchmark(frames=args.frames, size=(args.width, args.height)))
+    elif args.command == "crowd":
+        print_crowd_report(run_crowd_benchmark(counts=tuple(args.counts), frames=args.frames,
+                                               steering_engine=args.steering))
+    elif args.command == "batch":
+        results = []
+        for result in iter_batch(configs=args.configs, games_per_config=args.games, bot=args.bot,
+                                 max_ticks=args.max_ticks, workers=args.workers, seed=args.seed):
+            results.append(result)
+            if not args.quiet:
+                print_batch_result(result)
+        print_batch_report(aggregate(results))
+    elif args.command == "horde":
+        print_horde_report(run_horde_benchmark(ticks=args.ticks, render=not args.no_render, renderer=args.renderer,
+                                               projectile_engine=args.projectiles, steering_engine=args.steering,
+                                               lod=not args.no_lod, frame_budget=args.frame_budget / 1_000,
+                                               immortal=not args.mortal, base_size=args.base_size,
+                                               growth=args.growth, max_size=args.max_size, passive=args.passive))
+    elif args.command == "pathing":
+        print_pathing_report(run_pathing_check(steering_engine=args.steering))
+    elif args.command == "replay":
+        print_replay_report(run_replay(args.file, render=args.render, profile=not args.no_profile,
+                                       profile_dump=args.profile_dump, renderer=args.renderer,
+                                       projectile_engine=args.projectiles, steering_engine=args.steering,
+                                       lod=not args.no_lod))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import multiprocessing
+import os
+import random
+from os import path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from time import perf_counter
+from typing import Iterator, Optional
+
+import pygame
+from pygame.locals import K_a, K_d, K_s, K_w
+
+from game import CircleClashGame
+from game.utilities import GameState, ScriptedInput
+from game.utilities.events import EnemyKilledEvent
+from game.waves import WaveManager
+from game.waves.generate_waves import generate_waves
+from .simulation import BenchBot, scripted_waves
+
+WAVE_CONFIGS = {  # wave configuration name: function creating the waves from the display and the Player
+    "default": generate_waves,
+    "rush": partial(generate_waves, file_path=path.join("resources", "waves", "rush.json")),
+    "scripted_10": partial(scripted_waves, num_waves=4, enemies_per_wave=10),
+    "scripted_30": partial(scripted_waves, num_waves=4, enemies_per_wave=30),
+}
+BOTS = ["scripted", "random"]
+
+
+class RandomBot(BenchBot):
+    """Player input that walks in random directions and attacks the closest Enemy
+
+    The bot picks a random set of movement keys every 'seconds_per_direction' seconds, using its own seeded random number
+    generator, so a game is reproducible from its seed.
+    """
+
+    def __init__(self, input_source: ScriptedInput, seed: int, seconds_per_direction: float = 0.5):
+        """Player input that walks in random directions and attacks the closest Enemy
+
+        :param input_source: ScriptedInput the Player reads from
+        :param seed: seed of the bot's random number generator
+        :param seconds_per_direction: time the bot walks in one direction before choosing a new one
+        """
+        super().__init__(input_source, seconds_per_direction)
+        self.rng = random.Random(seed)
+        self._turn = -1
+
+    def update(self, game: CircleClashGame, elapsed: float) -> None:
+        turn = int(elapsed / self.seconds_per_direction)
+        if turn != self._turn:
+            self._turn = turn
+            self.input_source.pressed = {key for key in [K_a, K_d, K_s, K_w] if self.rng.random() < 0.35}
+        enemies = [enemy for enemy in game.waves.active_wave.spawned_enemies if enemy.is_alive]
+        if enemies:
+            closest = min(enemies, key=lambda enemy: (enemy.position - game.player.position).length_squared())
+            self.input_source.mouse_pos = tuple(game.camera.to_screen(closest.rect.center))
+            game.player.attack()
+
+
+def _wave_factory(config: str):
+    """Returns the function creating the waves of a configuration name or wave file"""
+    return WAVE_CONFIGS.get(config) or partial(generate_waves, file_path=config)
+
+
+def play_game(config: str, seed: int, bot: str = "scripted", max_ticks: int = 36_000) -> dict:
+    """
+    Plays one headless game with a bot until the Player wins, dies or 'max_ticks' simulation steps have passed
+
+    Runs in a worker process of 'iter_batch'. Games aren't rendered. The pygame display of the worker process is kept
+    between games, so images are only decoded by the first game of a process.
+
+    :param config: name of the wave configuration in WAVE_CONFIGS or path of a wave file
+    :param seed: seed of the game's (and the bot's) random number generator
+    :param bot: one of BOTS
+    :param max_ticks: maximum number of simulation steps
+    :return: dictionary with the configuration, the seed, the outcome, the survival time in seconds, the kills per wave,
+             the damage taken by the Player and the simulation steps per second
+    """
+    input_source = ScriptedInput()
+    game = CircleClashGame(headless=True, input_source=input_source, seed=seed, profile_dump=None)
+    game.waves = WaveManager(target=game.player, display=game.display,
+                             waves=_wave_factory(config)(game.display, game.player), timers=game.timers,
+                             events=game.events, wave_args=game.wave_args)
+    game.state = GameState.RUNNING
+    player_bot = RandomBot(input_source, seed) if bot == "random" else BenchBot(input_source)
+    kills = [0] * len(game.waves.waves)
+
+    def count_kill(event: EnemyKilledEvent) -> None:
+        kills[game.waves.active_wave_index] += 1
+
+    game.events.subscribe(EnemyKilledEvent, count_kill)
+    damage = 0.0
+    ticks = 0
+    start = perf_counter()
+    while ticks < max_ticks and game.state == GameState.RUNNING:
+        player_bot.update(game, ticks * game.time_step)
+        health = game.player.health
+        game.simulate(game.time_step)
+        damage += max(0.0, health - game.player.health)
+        ticks += 1
+    duration = perf_counter() - start
+    return {
+        "config": config,
+        "seed": seed,
+        "outcome": {GameState.WIN: "win", GameState.GAME_OVER: "death"}.get(game.state, "timeout"),
+        "survival_time": ticks * game.time_step,
+        "waves_reached": game.waves.active_wave_index + 1,
+        "kills": kills,
+        "damage_taken": damage,
+        "score": game.score,
+        "ticks_per_second": ticks / duration if duration else 0.0,
+    }
+
+
+def _prepare() -> None:
+    """Creates one game in the parent process, so the map chunks are cut before the workers read them"""
+    CircleClashGame(headless=True, profile_dump=None)
+    pygame.quit()
+
+
+def iter_batch(configs: list[str], games_per_config: int = 100, bot: str = "scripted", max_ticks: int = 36_000,
+               workers: Optional[int] = None, seed: int = 0) -> Iterator[dict]:
+    """
+    Plays many headless games in parallel and yields their results as they finish
+
+    Games are distributed over a ProcessPoolExecutor with one process per core by default. Game i of a configuration
+    is seeded with 'seed + i', so every configuration is played on the same seeds.
+
+    :param configs: names of the wave configurations in WAVE_CONFIGS or paths of wave files
+    :param games_per_config: number of games per configuration
+    :param bot: one of BOTS
+    :param max_ticks: maximum number of simulation steps per game
+    :param workers: number of worker processes, os.cpu_count() by default
+    :param seed: seed of the first game of every configuration
+    :return: iterator of results of 'play_game', in the order the games finish
+    """
+    for config in configs:
+        if config not in WAVE_CONFIGS and not path.isfile(config):
+            raise ValueError(f"Unknown wave configuration '{config}', expected a wave file or one of "
+                             f"{list(WAVE_CONFIGS)}")
+    _prepare()
+    # SDL doesn't survive a fork, so workers are started fresh
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                             mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [executor.submit(play_game, config, seed + index, bot, max_ticks)
+                   for config in configs for index in range(games_per_config)]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def aggregate(results: list[dict]) -> dict[str, dict]:
+    """
+    Aggregates game results per wave configuration
+
+    :param results: results of 'play_game'
+    :return: dictionary with the number of games, the share of wins and deaths, the mean survival time, the mean kills
+             per wave, the mean damage taken and the mean simulation steps per second per configuration
+    """
+    by_config: dict[str, list[dict]] = {}
+    for result in results:
+        by_config.setdefault(result["config"], []).append(result)
+    summary = {}
+    for config, games in by_config.items():
+        num_waves = max(len(game["kills"]) for game in games)
+        summary[config] = {
+            "games": len(games),
+            "win_rate": sum(game["outcome"] == "win" for game in games) / len(games),
+            "death_rate": sum(game["outcome"] == "death" for game in games) / len(games),
+            "survival_time": sum(game["survival_time"] for game in games) / len(games),
+            "kills_per_wave": [sum(game["kills"][wave] for game in games if wave < len(game["kills"])) / len(games)
+                               for wave in range(num_waves)],
+            "damage_taken": sum(game["damage_taken"] for game in games) / len(games),
+            "ticks_per_second": sum(game["ticks_per_second"] for game in games) / len(games),
+        }
+    return summary
+
+
+def print_batch_result(result: dict) -> None:
+    """Prints the result of one game as a single line"""
+    print(f"{result['config']:<14}seed {result['seed']:<8}{result['outcome']:<9}"
+          f"{result['survival_time']:>8.1f} s  wave {result['waves_reached']}  kills {result['kills']}  "
+          f"damage {result['damage_taken']:.0f}  {result['ticks_per_second']:.0f} ticks/s")
+
+
+def print_batch_report(summary: dict[str, dict]) -> None:
+    """Prints the result of 'aggregate' as a table"""
+    print(f"{'config':<14}{'games':>7}{'win %':>8}{'death %':>9}{'survival s':>12}{'damage':>9}{'ticks/s':>10}  "
+          f"kills per wave")
+    for config, stats in summary.items():
+        print(f"{config:<14}{stats['games']:>7}{stats['win_rate'] * 100:>8.1f}{stats['death_rate'] * 100:>9.1f}"
+              f"{stats['survival_time']:>12.1f}{stats['damage_taken']:>9.1f}{stats['ticks_per_second']:>10.0f}  "
+              + " ".join(f"{kills:.1f}" for kills in stats["kills_per_wave"]))
@@ -0,0 +1,61 @@
+from time import perf_counter
+
+import pygame
+
+from game import CircleClashGame
+from game.actors.enemy import Enemy1
+from game.game_objects.melee.sword import generate_wooden_sword
+from game.utilities import GameState, SpatialHash
+from game.waves.wave import Wave
+from .stats import summarize
+
+
+def run_crowd_benchmark(counts: tuple[int, ...] = (50, 500, 5_000), frames: int = 60,
+                        steering_engine: str = "per_enemy") -> dict:
+    """
+    Measures the per-frame cost of updating a wave with and without crowd separation
+
+    For every enemy count, one wave is spawned and updated for a number of frames, once without and once with the
+    NeighbourGrid. The Player's projectiles are left out, so only steering, separation and the Enemies' own updates
+    are measured.
+
+    :param counts: numbers of enemies per wave
+    :param frames: number of simulation steps per wave
+    :param steering_engine: steering engine used by the game, one of STEERING_ENGINES
+    :return: dictionary with frame time statistics and neighbour grid statistics per enemy count and variant
+    """
+    game = CircleClashGame(headless=True, steering_engine=steering_engine)
+    no_projectiles = SpatialHash()
+    result = {}
+    for count in counts:
+        result[count] = {}
+        for variant in ["no_separation", "separation"]:
+            wave = Wave(display=game.display, target=game.player,
+                        enemies_to_spawn={Enemy1: (count, generate_wooden_sword)}, timers=game.timers,
+                        events=game.events, **game.wave_args)
+            if variant == "no_separation":
+                wave.crowd = None
+            wave.spawn_enemies()
+            frame_times = []
+            for _ in range(frames):
+                start = perf_counter()
+                wave.update(GameState.RUNNING, game.time_step, no_projectiles)
+                frame_times.append(perf_counter() - start)
+            result[count][variant] = summarize(frame_times)
+            if wave.crowd is not None and wave.steering is None:  # a SteeringSystem doesn't use the NeighbourGrid
+                stats = wave.crowd.stats()
+                result[count][variant]["candidates_per_query"] = \
+                    stats["candidates_checked"] / stats["queries"] if stats["queries"] else 0.0
+            wave.spawned_enemies.empty()
+    pygame.quit()
+    return result
+
+
+def print_crowd_report(result: dict) -> None:
+    """Prints the result of 'run_crowd_benchmark' as a table"""
+    print(f"{'enemies':>8}  {'variant':<15}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}{'cand/query':>12}")
+    for count, variants in result.items():
+        for variant, stats in variants.items():
+            candidates = stats.get("candidates_per_query")
+            print(f"{count:>8}  {variant:<15}{stats['mean_ms']:>10.3f}{stats['p50_ms']:>10.3f}{stats['p99_ms']:>10.3f}"
+                  + (f"{candidates:>12.1f}" if candidates is not None else f"{'-':>12}"))
@@ -0,0 +1,103 @@
+from time import perf_counter
+
+import pygame
+
+from game import CircleClashGame
+from game.utilities import GameState, ScriptedInput
+from game.utilities.events import HordeStatsEvent
+from game.waves.horde import Horde
+from .simulation import BenchBot, BOT_DIRECTIONS
+from .stats import summarize
+
+
+class PassiveBot(BenchBot):
+    """Scripted Player input that walks in a square without attacking, so no Enemy is ever killed"""
+
+    def update(self, game: CircleClashGame, elapsed: float) -> None:
+        direction = BOT_DIRECTIONS[int(elapsed / self.seconds_per_direction) % len(BOT_DIRECTIONS)]
+        self.input_source.pressed = {direction}
+
+
+def run_horde_benchmark(ticks: int = 6_000, render: bool = True, renderer: str = "full",
+                        projectile_engine: str = "sprites", steering_engine: str = "per_enemy", lod: bool = True,
+                        frame_budget: float = 1 / 60, immortal: bool = True, base_size: int = 200,
+                        growth: float = 2.0, max_size: int = 20_000, passive: bool = False) -> dict:
+    """
+    Runs a headless endless game with a scripted Player as fast as possible
+
+    The endless waves grow until the frame time reaches the budget, at which point the SpawnGovernor throttles spawning.
+    The load the game settles at (Enemies and projectiles on the map) is a measure of how far the engines scale. The
+    Horde is much bigger than the one of the game, so the load climbs to the frame budget within a few waves even
+    though the bot kills Enemies. A passive bot doesn't kill any Enemy, so the game stays in the first wave, whose
+    Enemies pile up (until the governor stops spawning, if 'base_size' is big enough).
+
+    :param ticks: number of ticks to run
+    :param render: render a frame after every simulation step
+    :param renderer: renderer used by the game, one of RENDERERS
+    :param projectile_engine: projectile engine used by the game, one of PROJECTILE_ENGINES
+    :param steering_engine: steering engine used by the game, one of STEERING_ENGINES
+    :param lod: schedule enemy updates by distance to the Player
+    :param frame_budget: frame time in seconds the spawn rate is adapted to
+    :param immortal: give the Player practically infinite health, so the benchmark isn't ended by the bot's death
+    :param base_size: number of Enemies of the first wave
+    :param growth: factor the number of Enemies grows by from wave to wave
+    :param max_size: maximum number of Enemies of a wave
+    :param passive: the bot doesn't attack
+    :return: dictionary with ticks per second, frame time statistics, the reached wave, the peak number of Enemies and
+             projectiles and the HordeStatsEvents published during the run
+    """
+    input_source = ScriptedInput()
+    bot = PassiveBot(input_source) if passive else BenchBot(input_source)
+    game = CircleClashGame(headless=True, input_source=input_source, renderer=renderer,
+                           projectile_engine=projectile_engine, steering_engine=steering_engine, lod=lod,
+                           profile_dump=None, endless=True)
+    game.waves.horde = Horde(base_size=base_size, growth=growth, max_size=max_size)
+    game.waves.governor.frame_budget = frame_budget
+    game.reset()  # restarts the endless waves with the Horde
+    if immortal:
+        game.player.health = 1e12
+
+    timeline: list[HordeStatsEvent] = []
+    game.events.subscribe(HordeStatsEvent, timeline.append)
+    frame_times = []
+    start = perf_counter()
+    for tick in range(ticks):
+        tick_start = perf_counter()
+        game.handle_events()
+        bot.update(game, tick * game.time_step)
+        game.simulate(game.time_step)
+        if render:
+            game.render()
+        frame_time = perf_counter() - tick_start
+        game.waves.record_frame_time(frame_time)
+        frame_times.append(frame_time)
+        if not game.running or game.state != GameState.RUNNING:
+            break
+    duration = perf_counter() - start
+    pygame.quit()
+
+    return {
+        "ticks": len(frame_times),
+        "ticks_per_second": len(frame_times) / duration if duration else 0.0,
+        "frame": summarize(frame_times),
+        "frame_budget_ms": frame_budget * 1_000,
+        "waves": game.waves.active_wave_index + 1,
+        "peak_enemies": max((stats.enemies for stats in timeline), default=0),
+        "peak_projectiles": max((stats.projectiles for stats in timeline), default=0),
+        "min_spawn_scale": min((stats.spawn_scale for stats in timeline), default=1.0),
+        "timeline": timeline,
+    }
+
+
+def print_horde_report(result: dict) -> None:
+    """Prints the result of 'run_horde_benchmark' as a table"""
+    frame = result["frame"]
+    print(f"ticks: {result['ticks']}  ticks/s: {result['ticks_per_second']:.1f}  waves: {result['waves']}  "
+          f"peak enemies: {result['peak_enemies']}  peak projectiles: {result['peak_projectiles']}  "
+          f"min spawn scale: {result['min_spawn_scale']:.2f}")
+    print(f"frame budget: {result['frame_budget_ms']:.2f} ms  mean: {frame['mean_ms']:.3f} ms  "
+          f"p50: {frame['p50_ms']:.3f} ms  p99: {frame['p99_ms']:.3f} ms")
+    print(f"{'wave':>6}{'enemies':>10}{'pending':>10}{'projectiles':>13}{'frame ms':>10}{'scale':>8}")
+    for stats in result["timeline"]:
+        print(f"{stats.wave + 1:>6}{stats.enemies:>10}{stats.pending:>10}{stats.projectiles:>13}"
+              f"{stats.frame_time * 1_000:>10.3f}{stats.spawn_scale:>8.2f}")
@@ -0,0 +1,90 @@
+import os
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator
+
+import pygame
+
+from game.ui.overlay import Overlay
+
+
+def _allocate_per_frame(display: pygame.Surface) -> None:
+    """Draws an overlay the way the menus did before Overlay existed"""
+    overlay = pygame.Surface(display.get_size())
+    overlay.fill((0, 0, 0))
+    overlay.set_alpha(220)
+    display.blit(overlay, (0, 0))
+
+
+@contextmanager
+def count_surfaces() -> Iterator[dict[str, int]]:
+    """Counts the Surfaces constructed with 'pygame.Surface' while the context is active
+
+    'pygame.Surface' is temporarily replaced by a subclass that counts its instances and the size of their pixel
+    buffers (pitch * height, as allocated by SDL).
+
+    :return: dictionary with the number of 'surfaces' and their 'pixel_bytes', updated while the context is active
+    """
+    counts = {"surfaces": 0, "pixel_bytes": 0}
+    surface_cls = pygame.Surface
+
+    class CountingSurface(surface_cls):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            counts["surfaces"] += 1
+            counts["pixel_bytes"] += self.get_pitch() * self.get_height()
+
+    pygame.Surface = CountingSurface
+    try:
+        yield counts
+    finally:
+        pygame.Surface = surface_cls
+
+
+def run_overlay_benchmark(frames: int = 600, size: tuple[int, int] = (1920, 1080)) -> dict:
+    """
+    Compares allocating a full-size overlay on every frame with a reused Overlay
+
+    Constructed Surfaces and the size of their pixel buffers (allocated by SDL) are counted with 'count_surfaces',
+    Python-side allocations are measured with tracemalloc.
+
+    :param frames: number of frames to draw per variant
+    :param size: display size
+    :return: dictionary with time per frame, allocated Surfaces and allocated bytes for both variants
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.init()
+    display = pygame.display.set_mode(size)
+    cached = Overlay(alpha=220)
+
+    variants = {
+        "per_frame": lambda: _allocate_per_frame(display),
+        "cached": lambda: cached.draw(display, size),
+    }
+    result = {}
+    for name, draw in variants.items():
+        with count_surfaces() as surfaces:
+            tracemalloc.start()
+            start = perf_counter()
+            for _ in range(frames):
+                draw()
+            duration = perf_counter() - start
+            _, python_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        result[name] = {
+            "ms_per_frame": duration / frames * 1_000,
+            "surfaces_allocated": surfaces["surfaces"],
+            "pixel_bytes_allocated": surfaces["pixel_bytes"],
+            "python_peak_bytes": python_peak,
+        }
+    pygame.quit()
+    return result
+
+
+def print_overlay_report(result: dict) -> None:
+    """Prints the result of 'run_overlay_benchmark' as a table"""
+    print(f"{'variant':<12}{'ms/frame':>10}{'surfaces':>10}{'pixel MB':>12}{'python KB':>12}")
+    for name, stats in result.items():
+        print(f"{name:<12}{stats['ms_per_frame']:>10.3f}{stats['surfaces_allocated']:>10}"
+              f"{stats['pixel_bytes_allocated'] / 1024 ** 2:>12.1f}{stats['python_peak_bytes'] / 1024:>12.1f}")
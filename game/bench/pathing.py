@@ -0,0 +1,59 @@
+import pygame
+
+from game import CircleClashGame
+from game.actors.enemy import Enemy1
+from game.game_objects.melee.sword import generate_wooden_sword
+from game.utilities import GameState, SpatialHash, FlowField
+from game.waves.wave import Wave
+
+TILE_SIZE = 64
+GRID = (20, 12)  # columns and rows of the test map
+WALL = {(10, y) for y in range(10)}  # wall between Enemy and Player, with a gap below it
+ENEMY_TILE = (2, 3)
+PLAYER_TILE = (17, 3)
+
+
+def run_pathing_check(steering_engine: str = "per_enemy", max_ticks: int = 3_000) -> dict:
+    """
+    Lets an Enemy walk to the Player around a wall and counts the simulation steps it spends inside the wall
+
+    The wall stands directly between the Enemy and the Player, so the straight line leads through it and the Enemy has
+    to follow the FlowField through the gap below the wall. An Enemy that walks around the wall never enters a blocked
+    tile.
+
+    :param steering_engine: steering engine used by the game, one of STEERING_ENGINES
+    :param max_ticks: number of simulation steps after which the Enemy is considered stuck
+    :return: dictionary with the number of steps, the steps inside the wall and whether the Enemy reached the Player
+    """
+    game = CircleClashGame(headless=True, steering_engine=steering_engine)
+    flow_field = FlowField(size=(GRID[0] * TILE_SIZE, GRID[1] * TILE_SIZE), tile_size=TILE_SIZE, blocked=WALL)
+    wave_args = dict(game.wave_args, flow_field=flow_field)
+    wave = Wave(display=game.display, target=game.player, enemies_to_spawn={Enemy1: (1, generate_wooden_sword)},
+                timers=game.timers, events=game.events, **wave_args)
+    wave.crowd = None
+    wave.spawn_enemies()
+    enemy = wave.spawned_enemies.sprites()[0]
+    enemy.position = pygame.Vector2(ENEMY_TILE) * TILE_SIZE + pygame.Vector2(TILE_SIZE / 2)
+    game.player.position = pygame.Vector2(PLAYER_TILE) * TILE_SIZE + pygame.Vector2(TILE_SIZE / 2)
+    game.player.health = 1e12
+
+    no_projectiles = SpatialHash()
+    in_wall = 0
+    ticks = 0
+    reached = False
+    while ticks < max_ticks and not reached:
+        flow_field.update(game.player.position)
+        wave.update(GameState.RUNNING, game.time_step, no_projectiles)
+        ticks += 1
+        if flow_field.tile(enemy.position) in flow_field.blocked:
+            in_wall += 1
+        reached = (game.player.position - enemy.position).length() < enemy.active_weapon.hitbox_radius
+    pygame.quit()
+    return {"ticks": ticks, "ticks_in_wall": in_wall, "reached": reached}
+
+
+def print_pathing_report(result: dict) -> None:
+    """Prints the result of 'run_pathing_check'"""
+    status = "ok" if result["reached"] and not result["ticks_in_wall"] else "FAILED"
+    print(f"{status}: reached the player: {result['reached']}  ticks: {result['ticks']}  "
+          f"ticks inside the wall: {result['ticks_in_wall']}")
@@ -0,0 +1,67 @@
+from time import perf_counter
+from typing import Optional
+
+import pygame
+
+from game import CircleClashGame
+from game.utilities import ReplayPlayer
+from .simulation import print_profile_report
+
+
+def run_replay(file_path: str, render: bool = False, profile: bool = True, profile_dump: Optional[str] = None,
+               renderer: str = "full", projectile_engine: str = "sprites", steering_engine: str = "per_enemy",
+               lod: bool = True) -> dict:
+    """
+    Plays back a recorded session headless and as fast as possible
+
+    The game is created with the replay's seed, simulation rate, display size and endless mode and simulated step by
+    step until all recorded steps are played (or the recorded session quit). The renderer doesn't change the simulated
+    outcome, so a session can be replayed with other renderers to compare them. The vectorized engines can change the
+    outcome slightly (e.g., the "numpy" steering pushes all enemies apart at once), so replays with them drift from the
+    recorded session.
+
+    :param file_path: path of the replay file
+    :param render: render a frame after every simulation step
+    :param profile: enable the game's Profiler
+    :param profile_dump: file the profiler results are written to, None to skip writing them
+    :param renderer: renderer used by the game, one of RENDERERS
+    :param projectile_engine: projectile engine used by the game, one of PROJECTILE_ENGINES
+    :param steering_engine: steering engine used by the game, one of STEERING_ENGINES
+    :param lod: schedule enemy updates by distance to the Player
+    :return: dictionary with the number of played steps, the speed-up compared to real time, the final score and
+             wave and the Profiler's statistics of the last steps
+    """
+    player = ReplayPlayer(file_path)
+    game = CircleClashGame(simulation_rate=player.simulation_rate, headless=True, input_source=player,
+                           renderer=renderer, projectile_engine=projectile_engine, steering_engine=steering_engine,
+                           lod=lod, profile=profile, seed=player.seed, display_size=player.display_size,
+                           endless=player.endless)
+    start = perf_counter()
+    while game.running:
+        with game.profiler.scope("simulate"):
+            game.simulate(game.time_step)
+        if render:
+            with game.profiler.scope("render"):
+                game.render()
+    duration = perf_counter() - start
+    if profile_dump:
+        game.profiler.dump(profile_dump)
+    pygame.quit()
+
+    simulated = player.ticks * game.time_step
+    return {
+        "ticks": player.ticks,
+        "ticks_per_second": player.ticks / duration if duration else 0.0,
+        "speedup": simulated / duration if duration else 0.0,
+        "score": game.score,
+        "wave": game.waves.active_wave_index + 1,
+        "profile": game.profiler.summary(),
+    }
+
+
+def print_replay_report(result: dict) -> None:
+    """Prints the result of 'run_replay' as a table"""
+    print(f"ticks: {result['ticks']}  ticks/s: {result['ticks_per_second']:.1f}  "
+          f"speed-up: {result['speedup']:.1f}x  score: {result['score']}  wave: {result['wave']}")
+    if result["profile"]:
+        print_profile_report(result["profile"])
@@ -0,0 +1,187 @@
+from time import perf_counter
+
+import pygame
+from pygame.locals import K_a, K_d, K_s, K_w
+
+from game import CircleClashGame
+from game.actors.enemy import Enemy1, Enemy2, Enemy3
+from game.actors.player import Player
+from game.game_objects import ProjectilePool
+from game.game_objects.melee.axe import generate_single_edged_axe
+from game.game_objects.melee.sword import generate_prime_sword, generate_wooden_sword
+from game.utilities import GameState, ScriptedInput
+from game.waves import WaveManager
+from game.waves.wave_config import WaveSpec
+from .stats import summarize
+
+BOT_DIRECTIONS = [K_d, K_s, K_a, K_w]
+
+
+class BenchBot:
+    """Scripted Player input for benchmarks
+
+    The bot walks in a square, always aims at the closest living Enemy and attacks as often as its weapon allows.
+    """
+
+    def __init__(self, input_source: ScriptedInput, seconds_per_direction: float = 1.0):
+        """Scripted Player input for benchmarks
+
+        :param input_source: ScriptedInput the Player reads from
+        :param seconds_per_direction: time the bot walks in one direction before turning
+        """
+        self.input_source = input_source
+        self.seconds_per_direction = seconds_per_direction
+
+    def update(self, game: CircleClashGame, elapsed: float) -> None:
+        """Sets the input for the next simulation step
+
+        :param game: game the bot plays
+        :param elapsed: simulated time in seconds
+        """
+        direction = BOT_DIRECTIONS[int(elapsed / self.seconds_per_direction) % len(BOT_DIRECTIONS)]
+        self.input_source.pressed = {direction}
+        enemies = [enemy for enemy in game.waves.active_wave.spawned_enemies if enemy.is_alive]
+        if enemies:
+            closest = min(enemies, key=lambda enemy: (enemy.position - game.player.position).length_squared())
+            self.input_source.mouse_pos = tuple(game.camera.to_screen(closest.rect.center))
+            game.player.attack()
+
+
+def scripted_waves(display: pygame.Surface, player: Player, num_waves: int, enemies_per_wave: int) -> list[WaveSpec]:
+    """
+    Creates waves with a fixed number of enemies, split evenly between the three regular Enemy classes
+
+    :param display: pygame.display used for rendering
+    :param player: target of the enemies
+    :param num_waves: number of waves
+    :param enemies_per_wave: number of enemies in every wave
+    :return: list of WaveSpecs
+    """
+    enemy_types = [(Enemy1, generate_wooden_sword), (Enemy2, generate_prime_sword), (Enemy3, generate_single_edged_axe)]
+    waves = []
+    for _ in range(num_waves):
+        enemies_to_spawn = {}
+        for index, (enemy_cls, weapon_fun) in enumerate(enemy_types):
+            count = enemies_per_wave // len(enemy_types) + (index < enemies_per_wave % len(enemy_types))
+            if count:
+                enemies_to_spawn[enemy_cls] = (count, weapon_fun)
+        waves.append(WaveSpec(enemies=enemies_to_spawn))
+    return waves
+
+
+def run_simulation_benchmark(ticks: int = 3_000, num_waves: int = 4, enemies_per_wave: int = 30,
+                             render: bool = True, renderer: str = "full", projectile_engine: str = "sprites",
+                             steering_engine: str = "per_enemy", lod: bool = True, profile: bool = False,
+                             snapshot_interval: int = 0, reset_interval: int = 0) -> dict:
+    """
+    Runs a headless game with scripted waves and a scripted Player as fast as possible
+
+    Every tick consists of handling events, one simulation step and (optionally) rendering a frame. The game is reset
+    whenever the Player wins or dies, so the benchmark always runs for the requested number of ticks. With
+    'reset_interval', the game is also reset regularly, which checks that the bot and the game survive resets (e.g.,
+    the Player has no weapon until the first simulation step after a reset).
+
+    :param ticks: number of ticks to run
+    :param num_waves: number of scripted waves
+    :param enemies_per_wave: number of enemies in every wave
+    :param render: render a frame after every simulation step
+    :param renderer: renderer used by the game, one of RENDERERS
+    :param projectile_engine: projectile engine used by the game, one of PROJECTILE_ENGINES
+    :param steering_engine: steering engine used by the game, one of STEERING_ENGINES
+    :param lod: schedule enemy updates by distance to the Player
+    :param profile: enable the game's Profiler to measure the stages inside the simulation step and the frame
+    :param snapshot_interval: take a snapshot of the game every n ticks (0 to never take one), the snapshots are timed
+                              as their own subsystem
+    :param reset_interval: reset the game every n ticks (0 to only reset when the Player wins or dies)
+    :return: dictionary with ticks per second, frame time statistics, per-subsystem time statistics, the mean
+             number of enemies per LOD band and tick and the Profiler's statistics of the last ticks
+    """
+    input_source = ScriptedInput()
+    bot = BenchBot(input_source)
+    game = CircleClashGame(headless=True, input_source=input_source, renderer=renderer,
+                           projectile_engine=projectile_engine, steering_engine=steering_engine, lod=lod,
+                           profile=profile)
+    waves = scripted_waves(game.display, game.player, num_waves, enemies_per_wave)
+    game.waves = WaveManager(target=game.player, display=game.display, waves=waves, timers=game.timers,
+                             events=game.events, wave_args=game.wave_args)
+    game.state = GameState.RUNNING
+
+    subsystems = {"events": [], "simulation": [], "render": []}
+    if snapshot_interval:
+        subsystems["snapshot"] = []
+    snapshot_bytes = 0
+    frame_times = []
+    lod_counts = {}
+    resets = 0
+    start = perf_counter()
+    for tick in range(ticks):
+        tick_start = perf_counter()
+        game.handle_events()
+        bot.update(game, tick * game.time_step)
+        events_done = perf_counter()
+        game.simulate(game.time_step)
+        simulation_done = perf_counter()
+        if render:
+            game.render()
+        render_done = perf_counter()
+
+        subsystems["events"].append(events_done - tick_start)
+        subsystems["simulation"].append(simulation_done - events_done)
+        subsystems["render"].append(render_done - simulation_done)
+        if snapshot_interval and tick % snapshot_interval == 0:
+            snapshot = game.snapshot()
+            subsystems["snapshot"].append(perf_counter() - render_done)
+            snapshot_bytes = len(snapshot)
+        frame_times.append(render_done - tick_start)
+        if game.lod_scheduler is not None:
+            for name, count in game.lod_scheduler.counts.items():
+                lod_counts[name] = lod_counts.get(name, 0) + count
+        if game.state in [GameState.WIN, GameState.GAME_OVER] or \
+                (reset_interval and (tick + 1) % reset_interval == 0):
+            game.reset()
+            resets += 1
+        if not game.running:
+            break
+    duration = perf_counter() - start
+    pygame.quit()
+
+    return {
+        "ticks": len(frame_times),
+        "ticks_per_second": len(frame_times) / duration if duration else 0.0,
+        "resets": resets,
+        "frame": summarize(frame_times),
+        "subsystems": {name: summarize(times) for name, times in subsystems.items()},
+        "projectile_pools": ProjectilePool.all_stats(),
+        "projectile_system": game.projectile_system.stats() if game.projectile_system is not None else {},
+        "lod": {name: count / len(frame_times) for name, count in lod_counts.items()},
+        "profile": game.profiler.summary(),
+        "snapshot_bytes": snapshot_bytes,
+    }
+
+
+def print_simulation_report(result: dict) -> None:
+    """Prints the result of 'run_simulation_benchmark' as a table"""
+    print(f"ticks: {result['ticks']}  ticks/s: {result['ticks_per_second']:.1f}  resets: {result['resets']}")
+    print(f"{'stage':<12}{'total ms':>12}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    rows = list(result["subsystems"].items()) + [("frame", result["frame"])]
+    for name, stats in rows:
+        print(f"{name:<12}{stats['total_ms']:>12.1f}{stats['mean_ms']:>10.3f}{stats['p50_ms']:>10.3f}"
+              f"{stats['p99_ms']:>10.3f}")
+    for name, stats in result["projectile_pools"].items():
+        print(f"pool {name}: " + ", ".join(f"{key}={value}" for key, value in stats.items()))
+    if result["projectile_system"]:
+        print("projectile system: " + ", ".join(f"{key}={value}" for key, value in result["projectile_system"].items()))
+    if result["snapshot_bytes"]:
+        print(f"last snapshot: {result['snapshot_bytes']} bytes")
+    if result["lod"]:
+        print("enemies per tick: " + ", ".join(f"{name}={count:.1f}" for name, count in result["lod"].items()))
+    if result["profile"]:
+        print_profile_report(result["profile"])
+
+
+def print_profile_report(profile: dict) -> None:
+    """Prints the statistics of the Profiler's scopes as a table"""
+    print(f"{'scope':<12}{'samples':>12}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, stats in profile.items():
+        print(f"{name:<12}{stats['samples']:>12}{stats['mean_ms']:>10.3f}{stats['p50_ms']:>10.3f}"
+              f"{stats['p99_ms']:>10.3f}")
@@ -0,0 +1,17 @@
+from game.utilities.helper_functions import percentile
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    """
+    Summarizes a list of durations in seconds as milliseconds
+
+    :param values: list of durations in seconds
+    :return: dictionary with total, mean, p50 and p99 in milliseconds
+    """
+    total = sum(values)
+    return {
+        "total_ms": total * 1_000,
+        "mean_ms": total / len(values) * 1_000 if values else 0.0,
+        "p50_ms": percentile(values, 50) * 1_000,
+        "p99_ms": percentile(values, 99) * 1_000,
+    }
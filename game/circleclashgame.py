@@ -1,22 +1,40 @@
+import os
+import random
+from os import path
+from time import perf_counter
+from typing import Optional
+
 import pygame
 from pygame.locals import *
 
-from .utilities import GameState
+from .utilities import GameState, SpatialHash, InputSource, RecordingSurface, DirtyRectRenderer, TimerWheel, \
+    EventBus, Camera, Profiler, ReplayRecorder, asset_cache, rotation_cache, all_subclasses, dump_snapshot, \
+    load_snapshot
 from .utilities.events import *
 from .actors import Player
-from .ui import Map, Life, Settings, Score, Start, Win, Lose, WeaponBar, Wave_ui, UpperBar
+from .actors.character import CharacterState
+from .ui import Map, Life, Settings, Score, Start, Win, Lose, WeaponBar, Wave_ui, UpperBar, ProfilerOverlay
 from .waves import WaveManager
+from .waves.lod import LODScheduler
 from .actors.enemy import Enemy
+from .game_objects import Projectile, ProjectilePool, ProjectileSystem
 from .waves.generate_waves import generate_waves
 
 # game settings
 WINDOW_NAME = "Circle Clash"
 BACKGROUND_MUSIC = "resources/sounds/Blade_Runner_Arcade_Music.mp3"
+SIMULATION_RATE = 60  # simulation steps per second
+MAX_FPS = 60  # upper limit for rendered frames per second, 0 means uncapped
+MAX_CATCH_UP_STEPS = 5  # maximum number of simulation steps per frame, when rendering falls behind
+HEADLESS_DISPLAY_SIZE = (1280, 720)  # size of the off-screen display in headless mode
+RENDERERS = ["full", "dirty"]  # "full" redraws the whole screen every frame, "dirty" only the changed regions
+PROJECTILE_ENGINES = ["sprites", "numpy"]  # "numpy" simulates all projectiles in a vectorized ProjectileSystem
+STEERING_ENGINES = ["per_enemy", "numpy"]  # "numpy" steers all enemies of a wave in a vectorized SteeringSystem
+PROFILE_DUMP_PATH = "profile.csv"  # file the profiler results are written to on exit (".json" for JSON)
 
 DEBUG_EVENT = pygame.USEREVENT + 100
 
 
-
 class CircleClashGame:
     """Class containing the logic for the game
 
@@ -24,14 +42,115 @@ class CircleClashGame:
     depends on the game's GameState (i.e., READY, RUNNING, WIN, GAME_OVER and PAUSED). It sets up all the necessary
     pygame objects, manages the game loop with all objects inside it, keeps track of the Player's score and updates
     the UI.
+
+    The game loop uses a fixed timestep: the simulation always advances in steps of 1 / simulation_rate seconds, no
+    matter how fast frames are rendered. Rendering interpolates between the last two simulation steps. Despawns, attack
+    cooldowns and wave spawns run on a TimerWheel that only advances while the game is running. Game logic events are
+    published on an EventBus and delivered at the end of every simulation step, the SDL event queue only carries OS
+    input.
+
+    All game objects live in world coordinates. The Camera follows the Player and converts world to screen coordinates
+    when drawing; objects outside its view aren't drawn.
+
+    In headless mode, SDL's dummy video and audio drivers are used, so the game can run without a display (e.g., for
+    benchmarks). The frame rate is uncapped and input should be provided by a scripted InputSource.
+
+    All randomness comes from one random number generator seeded with 'seed', and the simulation only reads input at
+    the start of every step, so a session can be recorded with 'record' and replayed step by step with a ReplayPlayer.
+
+    In endless mode, the WaveManager generates escalating waves until the Player dies, adapting the spawn rate to the
+    frame time. Its HordeStatsEvents are kept in 'horde_stats'.
+
+    The whole simulation state can be saved to an in-memory snapshot and restored ('snapshot' and 'restore', [F5] and
+    [F9] in game).
+
+    With the "dirty" renderer, only the regions of the screen that changed since the last frame are pushed to the
+    screen (see DirtyRectRenderer), the screen is scrolled instead of redrawn when the camera moves.
+
+    With the "numpy" projectile engine, projectiles aren't Sprites but rows in the arrays of a ProjectileSystem, which is
+    moved, culled and collided with vectorized operations (requires numpy).
+
+    With the "numpy" steering engine, every wave steers and moves its enemies in a SteeringSystem with vectorized
+    operations, only the enemies that attack, are hit or have projectiles in flight are updated in Python (requires
+    numpy).
+
+    With 'lod' enabled, a LODScheduler updates distant enemies less often and skips drawing and weapon updates of
+    off-screen enemies.
+
+    Every stage of the game loop runs in a named Profiler scope. The profiler is disabled by default; [F3] toggles an
+    overlay with the rolling average and p99 of every stage (and enables the profiler). The results are written to
+    'profile_dump' when the game quits.
     """
 
-    def __init__(self):
-        """Class containing the logic for the game"""
+    def __init__(self, simulation_rate: int = SIMULATION_RATE, max_fps: int = MAX_FPS, headless: bool = False,
+                 input_source: Optional[InputSource] = None, renderer: str = "full",
+                 projectile_engine: str = "sprites", steering_engine: str = "per_enemy", lod: bool = True,
+                 profile: bool = False, profile_dump: Optional[str] = PROFILE_DUMP_PATH, seed: Optional[int] = None,
+                 record: Optional[str] = None, display_size: Optional[tuple[int, int]] = None, endless: bool = False):
+        """Class containing the logic for the game
+
+        :param simulation_rate: simulation steps per second
+        :param max_fps: upper limit for rendered frames per second, 0 means uncapped
+        :param headless: run without a window and without sound
+        :param input_source: source of mouse and keyboard input, reads the real mouse and keyboard by default
+        :param renderer: one of RENDERERS
+        :param projectile_engine: one of PROJECTILE_ENGINES
+        :param steering_engine: one of STEERING_ENGINES
+        :param lod: schedule enemy updates by distance to the Player (see LODScheduler)
+        :param profile: measure the stages of the game loop from the start (see Profiler)
+        :param profile_dump: file the profiler results are written to on exit, None to skip writing them
+        :param seed: seed of the random number generator used for spawn positions and enemy speeds, random by default
+        :param record: path of a replay file the input of every simulation step is recorded to (see ReplayRecorder)
+        :param display_size: size of the off-screen display in headless mode, HEADLESS_DISPLAY_SIZE by default
+        :param endless: play endless escalating waves instead of the waves of the wave file
+        """
+        if renderer not in RENDERERS:
+            raise ValueError(f"Unknown renderer '{renderer}', expected one of {RENDERERS}")
+        if projectile_engine not in PROJECTILE_ENGINES:
+            raise ValueError(f"Unknown projectile engine '{projectile_engine}', expected one of {PROJECTILE_ENGINES}")
+        if steering_engine not in STEERING_ENGINES:
+            raise ValueError(f"Unknown steering engine '{steering_engine}', expected one of {STEERING_ENGINES}")
+        self.time_step = 1 / simulation_rate
+        self.headless = headless
+        self.max_fps = 0 if headless else max_fps
+        self.display_size = display_size or HEADLESS_DISPLAY_SIZE
+        self.endless = endless
+        self.horde_stats: Optional[HordeStatsEvent] = None
+        self.input_source = input_source or InputSource()
+        self.profiler = Profiler(enabled=profile)
+        self.profile_dump = profile_dump
         self._setup_pygame()
+        self.seed = seed if seed is not None else random.randrange(2 ** 63)
+        self.rng = random.Random(self.seed)
+        self.recorder = None
+        if record:
+            self.recorder = ReplayRecorder(record, seed=self.seed, simulation_rate=simulation_rate,
+                                           display_size=self.display.get_size(), source=self.input_source,
+                                           endless=endless)
+            self.input_source = self.recorder
+        self.dirty_renderer = None
+        if renderer == "dirty":
+            self.display = RecordingSurface(self.display)
+            self.dirty_renderer = DirtyRectRenderer(self.display)
+        self.projectile_system = ProjectileSystem(self.display) if projectile_engine == "numpy" else None
+        self.lod_scheduler = LODScheduler() if lod else None
+        self.timers = TimerWheel(tick_length=self.time_step)
+        self.events = EventBus()
+        self._subscribe_events()
+        self._preload_assets()
+        self.map = Map(display=self.display)
+        self.camera = Camera(size=self.display.get_size(), world_size=self.map.size)
+        self.world_bounds = pygame.Rect((0, 0), self.map.size)
+        if self.projectile_system is not None:
+            self.projectile_system.bounds = self.world_bounds
+        self.flow_field = self.map.flow_field()
+        # services of this game passed on to the Waves (and their Enemies), instead of class attributes shared by all
+        # games in the process
+        self.wave_args = {"rng": self.rng, "flow_field": self.flow_field, "world_bounds": self.world_bounds,
+                          "lod_scheduler": self.lod_scheduler, "vectorized_steering": steering_engine == "numpy",
+                          "projectile_system": self.projectile_system}
         self._set_initial_state()
 
-        self.map = Map(display=self.display)
         self.life = Life(display=self.display)
         self.settings = Settings(display=self.display)
         self.scoreUI = Score(display=self.display)
@@ -41,12 +160,21 @@ class CircleClashGame:
         self.weaponBar = WeaponBar(display=self.display, weapons=self.player.unlockable_weapons)
         self.wave_ui = Wave_ui(display=self.display)
         self.upperBar = UpperBar(display=self.display, height=33)
+        self.quick_snapshot: Optional[bytes] = None
+        self.profiler_overlay = ProfilerOverlay(display=self.display, profiler=self.profiler)
 
     def _setup_pygame(self) -> None:
         """Sets up pygame and the game window"""
         self.running = True
+        if self.headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
         self.clock = pygame.time.Clock()
+        self.music_running = False
+        if self.headless:
+            self.display = pygame.display.set_mode(self.display_size)
+            return
         # self.display = pygame.display.set_mode((1024, 768))
         screen_info = pygame.display.Info()
         self.display = pygame.display.set_mode((screen_info.current_w, screen_info.current_h), pygame.FULLSCREEN)
@@ -57,7 +185,29 @@ class CircleClashGame:
         pygame.mixer.music.play(-1)
         self.music_running = True
 
+    @staticmethod
+    def _preload_assets() -> None:
+        """Decodes all Character and Projectile images, so spawning and attacking never reads from disk
+
+        The default Character images are also rotated into all angle buckets of the RotationCache, since they are
+        rotated on every tick.
+        """
+        assets = []
+        character_defaults = []
+        for character_cls in [Player, *all_subclasses(Enemy)]:
+            image_paths = character_cls.image_paths()
+            if path.exists(image_paths[CharacterState.DEFAULT]):
+                assets += [(image_path, None) for image_path in image_paths.values() if image_path]
+                character_defaults.append(image_paths[CharacterState.DEFAULT])
+        for projectile_cls in [Projectile, *all_subclasses(Projectile)]:
+            assets += projectile_cls.assets()
+        asset_cache.preload(assets)
+        for image_path in character_defaults:
+            rotation_cache.prewarm(asset_cache.get_image(image_path))
+
     def _toggle_music(self):
+        if self.headless:
+            return
         if self.music_running:
             pygame.mixer.music.pause()
             self.music_running = False
@@ -69,118 +219,328 @@ class CircleClashGame:
         """Sets attributes related to the game's initial state"""
         self.score = 0
         self.state = GameState.READY
-        self.player = Player(display=self.display)
-        waves = generate_waves(self.display, self.player)
-        self.waves = WaveManager(target=self.player, display=self.display, waves=waves)
+        self.player = Player(display=self.display, input_source=self.input_source, camera=self.camera,
+                             timers=self.timers, events=self.events, projectile_system=self.projectile_system,
+                             world_bounds=self.world_bounds)
+        waves = [] if self.endless else generate_waves(self.display, self.player)
+        self.waves = WaveManager(target=self.player, display=self.display, waves=waves, timers=self.timers,
+                                 endless=self.endless, frame_budget=1 / (self.max_fps or MAX_FPS),
+                                 events=self.events, wave_args=self.wave_args)
+        self.player_projectiles = SpatialHash()
+        self.enemy_projectiles = SpatialHash()
+
+    def _subscribe_events(self) -> None:
+        """Subscribes the game's handlers to the EventBus and maps SDL event types to input handlers"""
+        self.events.subscribe(PlayerKilledEvent, self._on_player_killed)
+        self.events.subscribe(WinEvent, self._on_win)
+        self.events.subscribe(EnemyKilledEvent, self._on_enemy_killed)
+        self.events.subscribe(HordeStatsEvent, self._on_horde_stats)
+        self._input_handlers = {
+            QUIT: self._on_quit,
+            pygame.KEYDOWN: self._on_key_down,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_button_down,
+            pygame.MOUSEWHEEL: self._on_mouse_wheel,
+            DEBUG_EVENT: self._on_debug_event,
+        }
 
-    def _on_enemy_killed(self, enemy: Enemy) -> None:
+    def _on_enemy_killed(self, event: EnemyKilledEvent) -> None:
         """Runs necessary actions when an enemy is killed"""
-        self.score += enemy.points
-
-    def _check_events(self) -> None:
-        """Checks which events have been triggered"""
-
-        def react_key_event(e: pygame.event.Event) -> None:
-            """
-            Reacts to keys being pressed
-
-            Reacts to key events for buttons that are not held down but only shortly pressed.
-            """
-            if e.key == pygame.K_m:
-                self._toggle_music()
-            elif e.key == pygame.K_p:
-                if self.state == GameState.RUNNING:
-                    self.state = GameState.PAUSED
-                elif self.state == GameState.PAUSED:
-                    self.state = GameState.RUNNING
-
-            elif e.key == pygame.K_SPACE and self.state in [
-                GameState.GAME_OVER,
-                GameState.WIN,
-            ]:
+        self.score += event.killed.points
+
+    def _on_horde_stats(self, event: HordeStatsEvent) -> None:
+        """Keeps the latest load report of the endless mode"""
+        self.horde_stats = event
+
+    def _on_player_killed(self, event: PlayerKilledEvent) -> None:
+        """Changes the game's state to GAME_OVER, if it isn't GAME_OVER already"""
+        if self.state != GameState.GAME_OVER:
+            self.state = GameState.GAME_OVER
+
+    def _on_win(self, event: WinEvent) -> None:
+        """Changes the game's state to WIN, when the WaveManager completed the last wave"""
+        self.state = GameState.WIN
+
+    def _on_quit(self, event: pygame.event.Event) -> None:
+        """Quits the game"""
+        self.running = False
+
+    def _on_key_down(self, event: pygame.event.Event) -> None:
+        """
+        Reacts to keys being pressed
+
+        Reacts to key events for buttons that are not held down but only shortly pressed.
+        """
+        if event.key == pygame.K_m:
+            self._toggle_music()
+        elif event.key == pygame.K_p:
+            if self.state == GameState.RUNNING:
+                self.state = GameState.PAUSED
+            elif self.state == GameState.PAUSED:
+                self.state = GameState.RUNNING
+
+        elif event.key == pygame.K_SPACE and self.state in [
+            GameState.GAME_OVER,
+            GameState.WIN,
+        ]:
+            self.reset()
+        elif event.key == pygame.K_i:
+            self.waves.clear_current_wave()
+            self.waves.spawn_next_wave()
+        elif event.key == pygame.K_F3:
+            self.profiler_overlay.toggle()
+        elif event.key == pygame.K_F5:
+            self.quick_snapshot = self.snapshot()
+        elif event.key == pygame.K_F9 and self.quick_snapshot is not None:
+            self.restore(self.quick_snapshot)
+        elif event.key == pygame.K_ESCAPE:
+            pygame.event.post(pygame.event.Event(QUIT))
+
+    def _on_mouse_button_down(self, event: pygame.event.Event) -> None:
+        """On left click, attacks with the Player or clicks on a button"""
+        if event.button == 1:
+            self.player.attack()
+            self.state = self.settings.toggleState(self.state, event.pos)
+            self.state = self.startUI.toggleState(self.state, event.pos)
+            self.state = self.winUI.toggleState(self.state, event.pos)
+            self.state = self.loseUI.toggleState(self.state, event.pos)
+            if self.state is None:
                 self.reset()
-            elif e.key == pygame.K_i:
-                self.waves.clear_current_wave()
-                self.waves.spawn_next_wave()
-            elif e.key == pygame.K_ESCAPE:
-                pygame.event.post(pygame.event.Event(QUIT))
+            if self.state is GameState.QUIT:
+                self.running = False
 
+    def _on_mouse_wheel(self, event: pygame.event.Event) -> None:
+        """Changes the Player's active weapon
+
+        A MOUSEWHEEL event stores the wheel turn direction in y property as -1 (down) or 1 (up).
+        """
+        self.player.active_weapon_idx += event.y
+
+    def _on_debug_event(self, event: pygame.event.Event) -> None:
+        # don't mind me, I'm just used for debugging
+        if self.player.health <= 10:
+            self.player.health = 0
+        else:
+            self.player.health *= 0.3
+
+    def handle_events(self) -> None:
+        """Handles the OS input events on the SDL event queue
+
+        Every event type is looked up in a table of handlers, game logic events are delivered by the EventBus at the
+        end of every simulation step instead. The InputSource observes every event, so it can be recorded.
+        """
         for event in pygame.event.get():
-            if event.type == QUIT:  # quit game on QUIT event
-                self.running = False
-            elif event.type == pygame.KEYDOWN:  # if a key is pressed, react to the corresponding event
-                react_key_event(event)
-            elif (
-                # change game's state to GAME_OVER, when a PLAYER_KILLED_EVENT is received and the state isn't
-                # GAME_OVER already.
-                event.type == PLAYER_KILLED_EVENT and self.state != GameState.GAME_OVER
-            ):
-                self.state = GameState.GAME_OVER
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # on left click, attack with the Player or click on button
-                    self.player.attack()
-                    self.state = self.settings.toggleState(self.state)
-                    self.state = self.startUI.toggleState(self.state)
-                    self.state = self.winUI.toggleState(self.state)
-                    self.state = self.loseUI.toggleState(self.state)
-                    if self.state is None:
-                        self.reset()
-                    if self.state is GameState.QUIT:
-                        self.running = False
-            elif event.type == pygame.MOUSEWHEEL:
-                # a MOUSEWHEEL event stores the wheel turn direction in y property as -1 (down) or 1 (up)
-                # this is used to change the Player's 'active_weapon_idx'
-                self.player.active_weapon_idx += event.y
-            elif event.type == WIN_EVENT:
-                # change the game's state to WIN, when a WIN_EVENT is received from the WaveManager
-                self.state = GameState.WIN
-            elif event.type == ENEMY_KILLED_EVENT:
-                # react to an enemy being killed
-                self._on_enemy_killed(event.killed)
-            elif event.type == ENEMY_DESPAWN_EVENT:
-                # despawn Enemies from the map when an ENEMY_DESPAWN_EVENT is received
-                event.killed.kill()
-            elif event.type == SPAWN_WAVE_EVENT:
-                pass
-            elif event.type == DEBUG_EVENT:
-                # don't mind me, I'm just used for debugging
-                if self.player.health <= 10:
-                    self.player.health = 0
-                else:
-                    self.player.health *= 0.3
+            self.input_source.observe(event)
+            self._handle_event(event)
+
+    def _handle_event(self, event: pygame.event.Event) -> None:
+        """Calls the input handler of an OS input event, if there is one"""
+        handler = self._input_handlers.get(event.type)
+        if handler is not None:
+            handler(event)
+
+    def _check_collisions(self) -> None:
+        """Applies projectile damage to the Player and indexes the Player's projectiles
+
+        The projectiles of both sides are sorted into SpatialHash grids, so only projectiles near a Character are tested
+        for collisions. The Enemies are tested against the Player's projectiles when the current wave is updated.
+        """
+        self.enemy_projectiles.rebuild(
+            projectile
+            for enemy in self.waves.active_wave.spawned_enemies if enemy.active_weapon is not None
+            for projectile in enemy.active_weapon.fired_projectiles
+        )
+        for player, projectile in self.enemy_projectiles.candidate_pairs([self.player]):
+            player.take_hit(projectile)
+        self.player_projectiles.rebuild(self.player.active_weapon.fired_projectiles)
+
+    def _check_projectile_system_collisions(self) -> None:
+        """Applies the damage of projectiles in the ProjectileSystem to the Player and the Enemies"""
+        damage = self.projectile_system.collide([self.player.rect], team=Enemy.team)[0]
+        if damage:
+            self.player.health -= damage
+        wave = self.waves.active_wave
+        if wave.steering is not None:  # the rects are in the SteeringSystem's arrays already
+            enemies = list(wave.steering.enemies)
+            rects = wave.steering.rects[:len(wave.steering)]
+        else:
+            enemies = wave.spawned_enemies.sprites()
+            rects = [enemy.rect for enemy in enemies]
+        for enemy, damage in zip(enemies, self.projectile_system.collide(rects, team=self.player.team)):
+            if damage:
+                enemy.health -= damage
+
+    def simulate(self, dt: float) -> None:
+        """Advances the simulation by one step
+
+        The InputSource is stepped first and the input events it returns (e.g., from a replay) are handled. The camera
+        is centered on the Player's simulated position, so converting the mouse position to the world doesn't depend
+        on how frames are rendered. In endless mode, the spawn scale is passed through the InputSource as well, as it
+        depends on the measured frame time (a replay stores and restores it).
+
+        :param dt: length of the simulation step in seconds
+        """
+        profiler = self.profiler
+        for event in self.input_source.step():
+            self._handle_event(event)
+        if self.endless:
+            governor = self.waves.governor
+            governor.scale = self.input_source.spawn_scale(governor.scale)
+        self.camera.follow(self.player.position + pygame.Vector2(self.player.size) / 2)
+        if self.state == GameState.RUNNING:
+            with profiler.scope("timers"):
+                self.timers.tick()
+        with profiler.scope("player"):
+            self.player.update(game_state=self.state, dt=dt, score=self.score)
+        if self.projectile_system is None:  # otherwise, no projectile is a Sprite and both hashes stay empty
+            with profiler.scope("collisions"):
+                self._check_collisions()
+        with profiler.scope("flow_field"):
+            self.flow_field.update(self.player.position)
+        with profiler.scope("waves"):
+            self.waves.update(game_state=self.state, dt=dt, projectiles=self.player_projectiles,
+                              view=self.camera.rect)
+        if self.projectile_system is not None:
+            with profiler.scope("projectiles"):
+                self.projectile_system.step(dt, running=self.state == GameState.RUNNING)
+                self._check_projectile_system_collisions()
+        with profiler.scope("dispatch"):
+            self.events.dispatch()
+
+    def render(self, alpha: float = 1.0) -> None:
+        """Renders a frame
+
+        :param alpha: fraction of a simulation step that has passed since the last step (0 to 1)
+        """
+        profiler = self.profiler
+        self.camera.follow(self.player.render_position(alpha) + pygame.Vector2(self.player.size) / 2)
+        with profiler.scope("map"):
+            if self.dirty_renderer:
+                self.dirty_renderer.begin_frame(self.camera.offset,
+                                                draw_background=lambda: self.map.update(camera=self.camera),
+                                                restore_background=lambda rects: self.map.restore(rects, self.camera))
+            else:
+                self.map.update(camera=self.camera)
+        with profiler.scope("draw"):
+            self.upperBar.update(state=self.state)
+            self.player.draw(alpha, self.camera)
+            self.waves.draw(alpha, self.camera)
+            if self.projectile_system is not None:
+                self.projectile_system.draw(alpha, self.camera)
+        with profiler.scope("ui"):
+            self.weaponBar.update(score=self.score)
+            self.settings.update(state=self.state, score=self.score)
+            self.startUI.update(state=self.state)
+            self.winUI.update(state=self.state, score=self.score)
+            self.loseUI.update(state=self.state, score=self.score)
+            self.life.update(player=self.player, state=self.state)
+            self.wave_ui.update(wave=self.waves.active_wave_index + 1, state=self.state)
+            self.scoreUI.update(score=self.score, state=self.state)
+            self.profiler_overlay.update()
+        with profiler.scope("display"):
+            if self.dirty_renderer:
+                self.dirty_renderer.end_frame()
+            else:
+                pygame.display.update()
 
     def reset(self) -> None:
         """Resets the game
 
-        Resets the Player, the WaveManager and the player's score.
+        Resets the timers, the queued events, the Player, the WaveManager and the player's score.
         """
+        self.timers.clear()
+        self.events.clear()
         self.player.reset()
         self.waves.clear_current_wave()
+        if self.projectile_system is not None:
+            self.projectile_system.clear()
         self.score = 0
         self.state = GameState.RUNNING
         self.waves.reset()
 
+    def _shared_objects(self) -> dict:
+        """Returns the objects snapshots reference by name instead of storing them"""
+        shared = {"game": self, "display": self.display, "camera": self.camera, "events": self.events,
+                  "timers": self.timers, "input_source": self.input_source, "flow_field": self.flow_field,
+                  "projectile_system": self.projectile_system, "map": self.map, "rng": self.rng,
+                  "lod_scheduler": self.lod_scheduler, "world_bounds": self.world_bounds}
+        if self.dirty_renderer:
+            shared["surface"] = self.display.surface
+        for pool in ProjectilePool.all_pools():
+            shared[f"pool:{pool.projectile_cls.__module__}.{pool.projectile_cls.__qualname__}"] = pool
+        return shared
+
+    def snapshot(self) -> bytes:
+        """Serializes the simulation state to an in-memory buffer
+
+        The snapshot contains the score, the GameState, the Player, the WaveManager with all waves, Enemies, Weapons and
+        live projectiles, the pending timers, the state of the random number generator and the ProjectileSystem's
+        arrays. Surfaces are referenced by asset key, shared services (e.g., the display or the EventBus) by name.
+
+        :return: snapshot that can be passed to 'restore'
+        """
+        state = {"score": self.score, "state": self.state, "player": self.player, "waves": self.waves,
+                 "timers": self.timers.__dict__, "rng": self.rng.getstate()}
+        if self.projectile_system is not None:
+            state["projectile_system"] = self.projectile_system.__dict__
+        return dump_snapshot(state, self._shared_objects())
+
+    def restore(self, snapshot: bytes) -> None:
+        """Restores the simulation state from a snapshot created by 'snapshot'
+
+        The TimerWheel and the ProjectileSystem are restored in place, since Characters and Weapons reference them.
+        Queued events are dropped.
+
+        :param snapshot: snapshot of this game
+        """
+        state = load_snapshot(snapshot, self._shared_objects())
+        self.score = state["score"]
+        self.state = state["state"]
+        self.player = state["player"]
+        self.waves = state["waves"]
+        self.timers.__dict__.update(state["timers"])
+        self.rng.setstate(state["rng"])
+        if self.projectile_system is not None:
+            self.projectile_system.__dict__.update(state["projectile_system"])
+        self.events.clear()
+        for weapon_image, weapon in zip(self.weaponBar.weapons, self.player.unlockable_weapons):
+            weapon_image.weapon = weapon
+        if self.dirty_renderer:
+            self.dirty_renderer.invalidate()
+
     def run(self) -> None:
-        """Main game loop"""
+        """Main game loop
+
+        The time that passed since the last frame is added to an accumulator, which is then used up in fixed simulation
+        steps. If rendering is too slow, at most MAX_CATCH_UP_STEPS steps are simulated per frame and the remaining
+        time is dropped, so a slow frame can't stall the game.
+
+        When the game quits, the profiler results are written to 'profile_dump', if anything was measured, and the
+        replay being recorded is closed.
+        """
         # self.player.health = 0
         # pygame.time.set_timer(DEBUG_EVENT, 1_000, False)
+        accumulator = 0.0
+        profiler = self.profiler
+        self.clock.tick()
         while self.running:
-            self._check_events()
-            self.map.update(player=self.player)
-            self.upperBar.update(state=self.state)
-            self.player.update(game_state=self.state, score=self.score)
-            for enemy in self.waves.active_wave.spawned_enemies:
-                if enemy.active_weapon is not None:
-                    self.player.calc_new_health(projectiles=enemy.active_weapon.fired_projectiles)
-            self.waves.update(game_state=self.state, projectiles=self.player.active_weapon.fired_projectiles)
-            self.weaponBar.update(score=self.score)
-            self.settings.update(state=self.state, score=self.score)
-            self.startUI.update(state=self.state)
-            self.winUI.update(state=self.state, score=self.score)
-            self.loseUI.update(state=self.state, score=self.score)
-            self.life.update(player=self.player, state=self.state)
-            self.wave_ui.update(wave=self.waves.active_wave_index + 1, state=self.state)
-            self.scoreUI.update(score=self.score, state=self.state)
-            pygame.display.update()
-            self.clock.tick(60)
+            accumulator += self.clock.tick(self.max_fps) / 1_000
+            frame_start = perf_counter()
+            with profiler.scope("frame"):
+                with profiler.scope("events"):
+                    self.handle_events()
+                steps = 0
+                while accumulator >= self.time_step and steps < MAX_CATCH_UP_STEPS:
+                    with profiler.scope("simulate"):
+                        self.simulate(self.time_step)
+                    accumulator -= self.time_step
+                    steps += 1
+                if accumulator >= self.time_step:
+                    accumulator %= self.time_step
+                with profiler.scope("render"):
+                    self.render(alpha=accumulator / self.time_step)
+            self.waves.record_frame_time(perf_counter() - frame_start)
+        if self.profile_dump and self.profiler.summary():
+            self.profiler.dump(self.profile_dump)
+        if self.recorder is not None:
+            self.recorder.close()
         pygame.quit()
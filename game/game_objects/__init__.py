@@ -1,4 +1,6 @@
 from .weapon import Weapon
 from .projectile import Projectile
+from .projectile_pool import ProjectilePool
+from .projectile_system import ProjectileSystem
 from .ranged import RangedWeapon
 from .melee import generate_prime_sword, generate_wooden_sword
@@ -22,10 +22,15 @@ class Axe(MeleeWeapon):
         num_projectiles = self.hitbox_angle // 60
         num_projectiles_per_side = (num_projectiles - 1) // 2
         shooting_angle = angle - num_projectiles_per_side * 60  # initial shooting angle
-        start_position = pygame.Vector2(self.owner.actor.centerx, self.owner.actor.centery)
+        start_position = pygame.Vector2(self.owner.rect.centerx, self.owner.rect.centery)
+        hitbox = None
         for _ in range(num_projectiles):
-            hitbox = self.projectile(start_pos=start_position, angle=shooting_angle, display=self.display)
-            self.fired_projectiles.add(hitbox)
+            if self.projectile_system is not None:
+                self._spawn(start_position, shooting_angle)
+            else:
+                hitbox = self.projectile_pool.acquire(start_pos=start_position, angle=shooting_angle,
+                                                      display=self.display)
+                self._add_projectile(hitbox)
             shooting_angle += 60
         return hitbox
 
@@ -42,7 +47,7 @@ def generate_single_edged_axe(display: pygame.Surface, owner: Character):
                hitbox_radius=100,
                display=display,
                owner=owner,
-               fire_rate=10)
+               fire_rate=0.17)
 
 
 def generate_double_edged_axe(display: pygame.Surface, owner: Character):
@@ -52,6 +57,6 @@ def generate_double_edged_axe(display: pygame.Surface, owner: Character):
                      hitbox_radius=100,
                      display=display,
                      owner=owner,
-                     fire_rate=10)
+                     fire_rate=0.17)
 
 
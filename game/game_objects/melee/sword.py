@@ -25,7 +25,7 @@ def generate_wooden_sword(display: pygame.Surface, owner: Character):
                        hitbox_radius=35,
                        display=display,
                        owner=owner,
-                       fire_rate=10)
+                       fire_rate=0.17)
 
 
 def generate_prime_sword(display: pygame.Surface, owner: Character):
@@ -34,5 +34,5 @@ def generate_prime_sword(display: pygame.Surface, owner: Character):
                       hitbox_radius=70,
                       display=display,
                       owner=owner,
-                      fire_rate=10)
+                      fire_rate=0.17)
 
@@ -1,10 +1,13 @@
 from abc import ABC
 import math
 from os import path
+from typing import Optional
 
 import pygame
 
-from game.utilities.helper_functions import read_image, rotate_image
+from game.utilities.assets import asset_cache
+from game.utilities.rotation_cache import rotation_cache
+from game.utilities.camera import Camera
 from game.utilities.gamestate import GameState
 
 
@@ -15,47 +18,98 @@ class Projectile(pygame.sprite.Sprite, ABC):
     angle_offset = 0
     attack_range = 10_000.0
     damage_points = 20
-    speed = 10
+    speed = 600
+    """Speed in pixels per second"""
+    max_lifetime: Optional[float] = None
+    """Time in seconds after which the Projectile is culled, None for no limit"""
 
     def __init__(self, start_pos, angle, display):
         super().__init__()
+        self.base_image = None
         if isinstance(self.image_path, str):
-            self.image = read_image(self.image_path, self.size)
+            self.base_image = asset_cache.get_image(self.image_path, self.size)
             self.images = None
         elif isinstance(self.image_path, list):
-            self.images = [read_image(file_path, self.size) for file_path in self.image_path]
-            self.current_image_idx = 0
+            self.images = [asset_cache.get_image(file_path, self.size) for file_path in self.image_path]
         self.points = 10
+        self.pool = None
+        self.reset(start_pos, angle, display)
+
+    def reset(self, start_pos, angle, display) -> None:
+        """Prepares the Projectile for being fired (again)
+
+        Resets position, angle and animation, so Projectile instances can be recycled by a ProjectilePool.
+
+        :param start_pos: position the Projectile is fired from
+        :param angle: direction the Projectile flies in
+        :param display: pygame.display used for rendering
+        """
+        self.image = self.base_image
+        self.current_image_idx = 0 if self.images else None
         self.start_pos = start_pos
         self.angle = angle
         self.current_pos = start_pos.copy()
+        self.previous_pos = start_pos.copy()
         self.rect = None
         self.rotated = False
+        self.age = 0.0
         self.aim()
         self.display = display
 
-    def draw(self):
-        self.display.blit(self.image, (self.current_pos[0] - int(self.image.get_width() / 2),
-                                       self.current_pos[1] - int(self.image.get_height() / 2)))
+    def kill(self) -> None:
+        """Removes the Projectile from all groups and returns it to its ProjectilePool"""
+        was_alive = self.alive()
+        super().kill()
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
+
+    @classmethod
+    def assets(cls) -> list[tuple[str, tuple[int, int]]]:
+        """Returns the (path, size) pairs of all images used by this Projectile class"""
+        image_paths = [cls.image_path] if isinstance(cls.image_path, str) else cls.image_path
+        return [(image_path, cls.size) for image_path in image_paths]
+
+    def draw(self, alpha: float = 1.0, camera: Optional[Camera] = None):
+        """Renders the Projectile at its position interpolated between the last two simulation steps
+
+        Projectiles outside the camera's view aren't drawn.
+
+        :param alpha: fraction of a simulation step that has passed since the last step (0 to 1)
+        :param camera: Camera used for the world-to-screen transform, without one world and screen are the same
+        """
+        position = self.previous_pos.lerp(self.current_pos, max(0.0, min(1.0, alpha)))
+        if camera is not None:
+            if not camera.is_visible(self.image.get_rect(center=position)):
+                return
+            position = camera.to_screen(position)
+        self.display.blit(self.image, (position[0] - int(self.image.get_width() / 2),
+                                       position[1] - int(self.image.get_height() / 2)))
 
     def aim(self):
         angle = (360 - self.angle - self.angle_offset) % 360
         if self.images:
-            img = self.images[self.current_image_idx].copy()
-            self.image = rotate_image(img, angle)
+            self.image = rotation_cache.rotate(self.images[self.current_image_idx], angle)
         elif self.rotated is False:
-            img = self.image.copy()
-            self.image = rotate_image(img, angle)
+            self.image = rotation_cache.rotate(self.image, angle)
             self.rotated = True
 
         self.rect = self.image.get_rect(center=(self.current_pos[0], self.current_pos[1]))
 
-    def move(self):
-        self.current_pos[0] += self.speed * math.cos(math.radians(self.angle))
-        self.current_pos[1] += self.speed * math.sin(math.radians(self.angle))
+    def move(self, dt: float):
+        self.current_pos[0] += self.speed * dt * math.cos(math.radians(self.angle))
+        self.current_pos[1] += self.speed * dt * math.sin(math.radians(self.angle))
         self.rect = self.image.get_rect(center=(self.current_pos[0], self.current_pos[1]))
 
-    def update(self, game_state: GameState):
+    def update(self, game_state: GameState, dt: float, world_bounds: Optional[pygame.Rect] = None):
+        """Method to run on every simulation step
+
+        Culls the Projectile when it exceeds its range or lifetime or leaves 'world_bounds' (the map), otherwise it is
+        moved.
+
+        :param game_state: current GameState
+        :param dt: length of the simulation step in seconds
+        :param world_bounds: area the Projectile is culled outside of, None for no limit
+        """
         # Punkt P: current pos
         # Punkt O: start pos
         # OP = P - O
@@ -68,18 +122,32 @@ class Projectile(pygame.sprite.Sprite, ABC):
             if travelled_distance > self.current_image_idx * dist_per_img and self.current_image_idx < num_images -1:
                 self.current_image_idx += 1
 
+        self.previous_pos = self.current_pos.copy()
         if travelled_distance >= self.attack_range:
-            self.kill()
+            self.cull("range")
+        elif world_bounds is not None and not world_bounds.colliderect(self.rect):
+            self.cull("bounds")
+        elif self.max_lifetime is not None and self.age >= self.max_lifetime:
+            self.cull("lifetime")
         if game_state == GameState.RUNNING:
+            self.age += dt
             self.aim()
-            self.move()
-        self.draw()
+            self.move(dt)
+
+    def cull(self, reason: str) -> None:
+        """Kills the Projectile and counts the reason in its pool's statistics
+
+        :param reason: why the Projectile was culled ("range", "bounds", "lifetime", "cap", "despawn" or "reset")
+        """
+        if self.alive() and self.pool is not None:
+            self.pool.culled[reason] = self.pool.culled.get(reason, 0) + 1
+        self.kill()
 
 
 class MeleeProjectile(Projectile):
     attack_range = 30.0
     angle_offset = -135
-    speed = 3
+    speed = 180
 
     def is_enemy_hit(self, enemy):
         distance_to_enemy = math.hypot(enemy.x - self.start_pos[0], enemy.y - self.start_pos[1])
@@ -122,6 +190,7 @@ class DoubleAxeProjectileEndboss(MeleeProjectile):
 class RangedProjectile(Projectile):
     size: tuple[int, int] = (50, 50)
     angle_offset = 90
+    max_lifetime = 5.0
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
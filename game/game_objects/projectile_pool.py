@@ -0,0 +1,96 @@
+from __future__ import annotations
+from typing import Optional
+
+import pygame
+
+from game.game_objects.projectile import Projectile
+
+
+class ProjectilePool:
+    """Recycles Projectile instances of one Projectile class
+
+    Instead of creating a new Projectile for every attack and leaving the killed ones to the garbage collector, killed
+    Projectiles are returned to the pool of their class and reset when they are fired again. A pool keeps at most
+    'capacity' unused Projectiles; Projectiles released into a full pool are dropped.
+
+    There is one shared pool per Projectile class, which is returned by 'ProjectilePool.for_class'.
+    """
+
+    default_capacity = 256
+    _pools: dict[type, ProjectilePool] = {}
+
+    def __init__(self, projectile_cls: type[Projectile], capacity: Optional[int] = None):
+        """Recycles Projectile instances of one Projectile class
+
+        :param projectile_cls: class of the pooled Projectiles
+        :param capacity: maximum number of unused Projectiles kept in the pool
+        """
+        self.projectile_cls = projectile_cls
+        self.capacity = self.default_capacity if capacity is None else capacity
+        self._free: list[Projectile] = []
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.dropped = 0
+        self.culled: dict[str, int] = {}
+
+    @classmethod
+    def for_class(cls, projectile_cls: type[Projectile]) -> ProjectilePool:
+        """Returns the shared pool of a Projectile class, creating it if necessary
+
+        :param projectile_cls: class of the pooled Projectiles
+        :return: shared ProjectilePool
+        """
+        if projectile_cls not in cls._pools:
+            cls._pools[projectile_cls] = cls(projectile_cls)
+        return cls._pools[projectile_cls]
+
+    @classmethod
+    def all_pools(cls) -> list[ProjectilePool]:
+        """Returns all shared pools"""
+        return list(cls._pools.values())
+
+    @classmethod
+    def all_stats(cls) -> dict[str, dict[str, int]]:
+        """Returns the statistics of all shared pools by Projectile class name"""
+        return {projectile_cls.__name__: pool.stats() for projectile_cls, pool in cls._pools.items()}
+
+    def acquire(self, start_pos: pygame.Vector2, angle: float, display: pygame.Surface) -> Projectile:
+        """Returns a ready-to-fire Projectile, recycling an unused one if possible
+
+        :param start_pos: position the Projectile is fired from
+        :param angle: direction the Projectile flies in
+        :param display: pygame.display used for rendering
+        :return: Projectile that isn't in any group yet
+        """
+        if self._free:
+            projectile = self._free.pop()
+            projectile.reset(start_pos, angle, display)
+            self.reused += 1
+        else:
+            projectile = self.projectile_cls(start_pos=start_pos, angle=angle, display=display)
+            projectile.pool = self
+            self.created += 1
+        return projectile
+
+    def release(self, projectile: Projectile) -> None:
+        """Returns a killed Projectile to the pool
+
+        :param projectile: Projectile that isn't in any group anymore
+        """
+        if len(self._free) < self.capacity:
+            self._free.append(projectile)
+            self.released += 1
+        else:
+            self.dropped += 1
+
+    @property
+    def live(self) -> int:
+        """Number of Projectiles of the pool's class that were fired and not killed yet"""
+        return self.created + self.reused - self.released - self.dropped
+
+    def stats(self) -> dict[str, int]:
+        """Returns the pool's counters, the number of live and unused Projectiles and the culled Projectiles by reason"""
+        return {"created": self.created, "reused": self.reused, "released": self.released, "dropped": self.dropped,
+                "free": len(self._free), "capacity": self.capacity, "live": self.live,
+                **{f"culled_{reason}": count for reason, count in self.culled.items()}}
@@ -0,0 +1,250 @@
+from typing import Optional, Sequence
+
+import pygame
+
+from game.game_objects.projectile import Projectile
+from game.utilities.assets import asset_cache
+from game.utilities.rotation_cache import rotation_cache
+from game.utilities.camera import Camera
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the ProjectileSystem
+    np = None
+
+COLLISION_TEST_PAIRS = 1 << 20  # maximum number of (projectile, rect) pairs tested at once in 'collide'
+
+
+class ProjectileSystem:
+    """Structure-of-arrays projectile engine backed by NumPy
+
+    Instead of one Sprite per Projectile, all live projectiles are stored in NumPy arrays (position, velocity, start
+    position, range, damage, team, ...). Moving, culling at the end of their range and collision tests are done with
+    vectorized operations for all projectiles at once. Sprites are never created; when drawing, only the projectiles
+    inside the camera's view are blitted, using the images and the rotation cache of their Projectile class.
+
+    Projectile classes keep describing how a projectile looks and behaves (images, size, speed, attack range, damage),
+    they are registered as "kinds" on first use. Every projectile can belong to an owner (e.g., a Weapon, see
+    'register_owner'), which limits its number of live projectiles and culls them when it is removed from the game.
+    """
+
+    def __init__(self, display: pygame.Surface, capacity: int = 1_024):
+        """Structure-of-arrays projectile engine backed by NumPy
+
+        :param display: pygame.display used for rendering
+        :param capacity: initial number of projectiles the arrays can hold, they grow when needed
+        """
+        if np is None:
+            raise ImportError("The ProjectileSystem requires numpy (pip install numpy)")
+        self.display = display
+        self.count = 0
+        self.teams: list[str] = []
+        self.kinds: list[type[Projectile]] = []
+        self._kind_images: list[list[pygame.Surface]] = []
+        self.bounds: Optional[pygame.Rect] = None  # projectiles leaving this area (the map) are culled
+        self.culled: dict[str, int] = {"range": 0, "bounds": 0, "lifetime": 0, "cap": 0}
+        self._next_owner = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        """Creates (or grows) the arrays, keeping the live projectiles"""
+        old = getattr(self, "position", None)
+        arrays = {
+            "position": np.zeros((capacity, 2)),
+            "previous": np.zeros((capacity, 2)),
+            "velocity": np.zeros((capacity, 2)),
+            "start": np.zeros((capacity, 2)),
+            "half_size": np.zeros((capacity, 2)),
+            "attack_range": np.zeros(capacity),
+            "age": np.zeros(capacity),
+            "max_lifetime": np.zeros(capacity),
+            "damage": np.zeros(capacity),
+            "angle": np.zeros(capacity),
+            "frame": np.zeros(capacity, dtype=np.int32),
+            "kind": np.zeros(capacity, dtype=np.int32),
+            "team": np.zeros(capacity, dtype=np.int32),
+            "owner": np.full(capacity, -1, dtype=np.int64),
+        }
+        for name, array in arrays.items():
+            if old is not None:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        """Removes all projectiles"""
+        self.count = 0
+
+    def _kind_index(self, projectile_cls: type[Projectile]) -> int:
+        """Returns the kind index of a Projectile class, registering the class on first use"""
+        if projectile_cls not in self.kinds:
+            self.kinds.append(projectile_cls)
+            self._kind_images.append([asset_cache.get_image(image_path, size)
+                                      for image_path, size in projectile_cls.assets()])
+        return self.kinds.index(projectile_cls)
+
+    def _team_index(self, team: str) -> int:
+        """Returns the index of a team name, registering it on first use"""
+        if team not in self.teams:
+            self.teams.append(team)
+        return self.teams.index(team)
+
+    def register_owner(self) -> int:
+        """Returns a new owner key, which is an integer so it survives snapshots of both the owner and the arrays"""
+        self._next_owner += 1
+        return self._next_owner
+
+    def spawn(self, projectile_cls: type[Projectile], start_pos: pygame.Vector2, angle: float, team: str,
+              owner: int = -1, max_live: Optional[int] = None) -> None:
+        """Fires a projectile
+
+        :param projectile_cls: Projectile class describing the projectile
+        :param start_pos: position the projectile is fired from
+        :param angle: direction the projectile flies in
+        :param team: team of the projectile's owner, projectiles never hit Characters of their own team
+        :param owner: owner key of the projectile (see 'register_owner'), -1 if it has no owner
+        :param max_live: maximum number of live projectiles of the owner, its oldest one is culled when exceeded
+        """
+        if max_live is not None and owner >= 0:
+            owned = np.flatnonzero(self.owner[:self.count] == owner)
+            if len(owned) >= max_live:  # projectiles are kept in spawn order, so the first ones are the oldest
+                keep = np.ones(self.count, dtype=bool)
+                keep[owned[:len(owned) - max_live + 1]] = False
+                self.culled["cap"] += len(owned) - max_live + 1
+                self._keep(keep)
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        index = self.count
+        radians = np.radians(angle)
+        self.position[index] = start_pos
+        self.previous[index] = start_pos
+        self.start[index] = start_pos
+        self.velocity[index] = (projectile_cls.speed * np.cos(radians), projectile_cls.speed * np.sin(radians))
+        self.half_size[index] = (projectile_cls.size[0] / 2, projectile_cls.size[1] / 2)
+        self.attack_range[index] = projectile_cls.attack_range
+        self.age[index] = 0.0
+        self.max_lifetime[index] = np.inf if projectile_cls.max_lifetime is None else projectile_cls.max_lifetime
+        self.damage[index] = projectile_cls.damage_points
+        self.angle[index] = (360 - angle - projectile_cls.angle_offset) % 360
+        self.frame[index] = 0
+        self.kind[index] = self._kind_index(projectile_cls)
+        self.team[index] = self._team_index(team)
+        self.owner[index] = owner
+        self.count += 1
+
+    def _keep(self, keep) -> None:
+        """Removes all projectiles whose entry in the boolean mask 'keep' is False"""
+        remaining = int(keep.sum())
+        if remaining == self.count:
+            return
+        for name in ["position", "previous", "velocity", "start", "half_size", "attack_range", "age", "max_lifetime",
+                     "damage", "angle", "frame", "kind", "team", "owner"]:
+            array = getattr(self, name)
+            array[:remaining] = array[:self.count][keep]
+        self.count = remaining
+
+    def step(self, dt: float, running: bool = True) -> int:
+        """Moves all projectiles and removes the ones that exceeded their attack range or lifetime or left the bounds
+
+        :param dt: length of the simulation step in seconds
+        :param running: projectiles only move while the game is running
+        :return: number of removed projectiles
+        """
+        count = self.count
+        self.previous[:count] = self.position[:count]
+        position = self.position[:count]
+        in_range = np.linalg.norm(position - self.start[:count], axis=1) < self.attack_range[:count]
+        in_bounds = np.ones(count, dtype=bool)
+        if self.bounds is not None:
+            half_size = self.half_size[:count]
+            in_bounds = (position[:, 0] + half_size[:, 0] > self.bounds.left) & \
+                        (position[:, 0] - half_size[:, 0] < self.bounds.right) & \
+                        (position[:, 1] + half_size[:, 1] > self.bounds.top) & \
+                        (position[:, 1] - half_size[:, 1] < self.bounds.bottom)
+        in_lifetime = self.age[:count] < self.max_lifetime[:count]
+        self.culled["range"] += int(np.count_nonzero(~in_range))
+        self.culled["bounds"] += int(np.count_nonzero(in_range & ~in_bounds))
+        self.culled["lifetime"] += int(np.count_nonzero(in_range & in_bounds & ~in_lifetime))
+        if running:
+            self.position[:count] += self.velocity[:count] * dt
+            self.age[:count] += dt
+            self.frame[:count] += 1
+        self._keep(in_range & in_bounds & in_lifetime)
+        return count - self.count
+
+    def cull_owner(self, owner: int, reason: str) -> None:
+        """Removes all projectiles of an owner
+
+        :param owner: owner key of the projectiles (see 'register_owner')
+        :param reason: why the projectiles were culled, counted in 'culled'
+        """
+        keep = self.owner[:self.count] != owner
+        self.culled[reason] = self.culled.get(reason, 0) + self.count - int(keep.sum())
+        self._keep(keep)
+
+    def stats(self) -> dict[str, int]:
+        """Returns the number of live projectiles and the culled projectiles by reason"""
+        return {"live": self.count, **{f"culled_{reason}": count for reason, count in self.culled.items()}}
+
+    def collide(self, rects: Sequence[pygame.Rect], team: str) -> list[float]:
+        """Removes all projectiles of a team that hit one of the given rects
+
+        Every projectile can only hit once, projectiles overlapping several rects hit the first one. The projectiles
+        are tested against all rects at once, in chunks of projectiles, so the cost doesn't grow with the number of
+        rects while no projectile of the team is live.
+
+        :param rects: hitboxes of the Characters to test, Rects or an array with one (x, y, width, height) row per
+                      hitbox (e.g., the rects of a SteeringSystem)
+        :param team: team of the projectiles to test (i.e., the opposing team of the Characters)
+        :return: damage dealt to each rect
+        """
+        if not self.count or not len(rects) or team not in self.teams:
+            return [0.0] * len(rects)
+        count = self.count
+        active = np.flatnonzero(self.team[:count] == self.teams.index(team))
+        if not len(active):
+            return [0.0] * len(rects)
+        boxes = np.asarray(rects, dtype=float).reshape(-1, 4)
+        left, top = boxes[:, 0], boxes[:, 1]
+        right, bottom = left + boxes[:, 2], top + boxes[:, 3]
+        position = self.position[active]
+        half_size = self.half_size[active]
+        low, high = position - half_size, position + half_size
+        target = np.full(len(active), -1)
+        chunk = max(1, COLLISION_TEST_PAIRS // len(boxes))
+        for first in range(0, len(active), chunk):
+            rows = slice(first, first + chunk)
+            overlap = (high[rows, 0, None] > left) & (low[rows, 0, None] < right) & \
+                      (high[rows, 1, None] > top) & (low[rows, 1, None] < bottom)
+            target[rows] = np.where(overlap.any(axis=1), overlap.argmax(axis=1), -1)
+        hit = target >= 0
+        damage = np.bincount(target[hit], weights=self.damage[active][hit], minlength=len(boxes))
+        keep = np.ones(count, dtype=bool)
+        keep[active[hit]] = False
+        self._keep(keep)
+        return damage.tolist()
+
+    def draw(self, alpha: float = 1.0, camera: Optional[Camera] = None) -> None:
+        """Renders all projectiles inside the camera's view
+
+        :param alpha: fraction of a simulation step that has passed since the last step (0 to 1)
+        :param camera: Camera used for culling and the world-to-screen transform, without one the whole display is
+                       visible and world and screen are the same
+        """
+        if not self.count:
+            return
+        view = camera.rect if camera is not None else self.display.get_rect()
+        count = self.count
+        position = self.previous[:count] + (self.position[:count] - self.previous[:count]) * max(0.0, min(1.0, alpha))
+        visible = (position[:, 0] + self.half_size[:count, 0] > view.left) & \
+                  (position[:, 0] - self.half_size[:count, 0] < view.right) & \
+                  (position[:, 1] + self.half_size[:count, 1] > view.top) & \
+                  (position[:, 1] - self.half_size[:count, 1] < view.bottom)
+        for index in np.flatnonzero(visible):
+            images = self._kind_images[self.kind[index]]
+            image = rotation_cache.rotate(images[min(self.frame[index], len(images) - 1)], self.angle[index])
+            self.display.blit(image, (position[index, 0] - view.left - image.get_width() // 2,
+                                      position[index, 1] - view.top - image.get_height() // 2))
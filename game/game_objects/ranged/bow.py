@@ -20,4 +20,4 @@ def generate_bow(display: pygame.Surface, owner: Character):
                hitbox_radius=180,
                display=display,
                owner=owner,
-               fire_rate=10)
+               fire_rate=0.17)
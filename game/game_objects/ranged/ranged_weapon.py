@@ -4,7 +4,8 @@ from game.game_objects.projectile import RangedProjectile
 
 class RangedWeapon(Weapon):
     projectile = RangedProjectile
+    max_live_projectiles = 24
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.speed = 10
+        self.speed = 600
@@ -21,4 +21,4 @@ def generate_wand(display: pygame.Surface, owner: Character):
                hitbox_radius=180,
                display=display,
                owner=owner,
-               fire_rate=15)
\ No newline at end of file
+               fire_rate=0.25)
\ No newline at end of file
@@ -1,12 +1,14 @@
 from __future__ import annotations
 from abc import ABC
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 import math
 
 import pygame
 
-from game.utilities import read_image, GameState, rotate_image
+from game.utilities import GameState, Camera, asset_cache, rotation_cache
 from game.game_objects.projectile import Projectile
+from game.game_objects.projectile_pool import ProjectilePool
+from game.game_objects.projectile_system import ProjectileSystem
 
 if TYPE_CHECKING:
     from game.actors import Character
@@ -15,10 +17,21 @@ if TYPE_CHECKING:
 class Weapon(pygame.sprite.Sprite, ABC):
     projectile = Projectile
     unlock_score = 0
+    max_live_projectiles: Optional[int] = None
+    """Maximum number of the Weapon's projectiles alive at the same time, the oldest one is culled when exceeded"""
 
-    def __init__(self, image_path, damage_points, hitbox_radius, display, owner: Character, fire_rate: int):
+    def __init__(self, image_path, damage_points, hitbox_radius, display, owner: Character, fire_rate: float):
+        """Base class for all weapons
+
+        :param image_path: path to the Weapon's image
+        :param damage_points: damage dealt by the Weapon
+        :param hitbox_radius: distance from which the Weapon is used by Enemies
+        :param display: pygame.display used for rendering
+        :param owner: Character carrying the Weapon
+        :param fire_rate: minimum time between two attacks in seconds
+        """
         super().__init__()
-        self.image = read_image(image_path)
+        self.image = asset_cache.get_image(image_path)
         self.damage_points = damage_points
         self.display = display
         self.owner = owner
@@ -26,23 +39,89 @@ class Weapon(pygame.sprite.Sprite, ABC):
         self.hitbox_radius = hitbox_radius
         self.fired_projectiles = pygame.sprite.Group()
         self.fire_rate = fire_rate
+        self.projectile_pool = ProjectilePool.for_class(self.projectile)
+        self.projectile_owner: Optional[int] = None  # owner key of the Weapon's projectiles in the ProjectileSystem
+
+    @property
+    def projectile_system(self) -> Optional[ProjectileSystem]:
+        """The owner's ProjectileSystem, if set, attacks spawn projectiles in it instead of creating Sprites"""
+        return self.owner.projectile_system
+
+    @staticmethod
+    def _hold_angle(angle: float) -> float:
+        """Converts the owner's rotation into the Weapon's rotation"""
+        return (360 - angle) % 360 - 135
+
+    def _hold_rect(self, owner_rect: pygame.Rect, angle: float) -> pygame.Rect:
+        """Returns the area covered by the Weapon when it is held by an owner at owner_rect"""
+        x = math.cos(self._hold_angle(angle))
+        return self.image.get_rect(topleft=(owner_rect.x + x, owner_rect.y))
 
-    def draw(self, angle: int):
+    def draw(self, angle: float, alpha: float = 1.0, camera: Optional[Camera] = None):
+        """Renders the Weapon in its owner's hand and all of its fired projectiles
+
+        The Weapon itself is only drawn if its owner was drawn (i.e., the owner's 'actor' is set).
+
+        :param angle: rotation of the owner
+        :param alpha: fraction of a simulation step that has passed since the last step (0 to 1)
+        :param camera: Camera used for the world-to-screen transform of the projectiles
+        """
         # TODO: rotate weapon based on owner's rotation
-        angle = (360 - angle) % 360 - 135
-        img = rotate_image(self.image.copy(), angle)
-        x = math.cos(angle)
-        y = math.sin(angle)
-        draw_pos = (self.owner.actor.x + x, self.owner.actor.y)
-        self.rect = self.display.blit(img, draw_pos)
+        if self.owner.actor is not None:
+            img = rotation_cache.rotate(self.image, self._hold_angle(angle))
+            self.display.blit(img, self._hold_rect(self.owner.actor, angle))
+        for projectile in self.fired_projectiles:
+            projectile.draw(alpha, camera)
+
+    def update(self, game_state: GameState, dt: float, angle: float):
+        """Method to run on every simulation step
+
+        :param game_state: current GameState
+        :param dt: length of the simulation step in seconds
+        :param angle: rotation of the owner
+        """
+        self.update_projectiles(game_state, dt)
+        self.rect = self._hold_rect(self.owner.rect, angle)
 
-    def update(self, game_state: GameState, angle: int):
-        self.fired_projectiles.update(game_state)
-        self.draw(angle=angle)
+    def update_projectiles(self, game_state: GameState, dt: float):
+        """Moves and culls the fired projectiles without positioning the Weapon (e.g., while its owner is off screen)
+
+        :param game_state: current GameState
+        :param dt: length of the simulation step in seconds
+        """
+        self.fired_projectiles.update(game_state, dt, self.owner.world_bounds)
+
+    def cull_projectiles(self, reason: str) -> None:
+        """Culls all projectiles the Weapon fired, e.g., when its owner is removed from the game
+
+        :param reason: why the projectiles were culled (see Projectile.cull)
+        """
+        for projectile in self.fired_projectiles.sprites():
+            projectile.cull(reason)
+        if self.projectile_system is not None and self.projectile_owner is not None:
+            self.projectile_system.cull_owner(self.projectile_owner, reason)
 
     def attack(self, angle):
         # Fire a new projectile
+        if self.rect is None:
+            self.rect = self._hold_rect(self.owner.rect, angle)
         start_position = pygame.Vector2(self.rect.centerx, self.rect.centery)
-        projectile = self.projectile(start_pos=start_position, angle=angle, display=self.display)
-        self.fired_projectiles.add(projectile)
+        if self.projectile_system is not None:
+            self._spawn(start_position, angle)
+            return None
+        projectile = self.projectile_pool.acquire(start_pos=start_position, angle=angle, display=self.display)
+        self._add_projectile(projectile)
         return projectile
+
+    def _spawn(self, start_position: pygame.Vector2, angle: float) -> None:
+        """Fires a projectile in the ProjectileSystem, which enforces the Weapon's 'max_live_projectiles'"""
+        if self.projectile_owner is None:
+            self.projectile_owner = self.projectile_system.register_owner()
+        self.projectile_system.spawn(self.projectile, start_position, angle, self.owner.team,
+                                     owner=self.projectile_owner, max_live=self.max_live_projectiles)
+
+    def _add_projectile(self, projectile: Projectile) -> None:
+        """Adds a fired Projectile, culling the oldest one if the Weapon has too many live projectiles"""
+        if self.max_live_projectiles is not None and len(self.fired_projectiles) >= self.max_live_projectiles:
+            self.fired_projectiles.sprites()[0].cull("cap")
+        self.fired_projectiles.add(projectile)
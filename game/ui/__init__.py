@@ -8,3 +8,4 @@ from .lose import Lose
 from .weapon_bar import WeaponBar
 from .wave_ui import Wave_ui
 from .upper_bar import UpperBar
+from .profiler_overlay import ProfilerOverlay
@@ -0,0 +1,38 @@
+from typing import Any, Callable, Optional
+
+import pygame
+
+
+class CachedLayer:
+    """Pre-rendered Surface of a UI widget
+
+    The Surface is created by a render function from a bound value (e.g., the Player's health) and only re-rendered
+    when that value changes. On all other frames, the cached Surface is blitted as is, so fonts aren't rasterized on
+    steady frames.
+    """
+
+    def __init__(self, render: Callable[[Any], pygame.Surface]):
+        """Pre-rendered Surface of a UI widget
+
+        :param render: function creating the widget's Surface from its bound value
+        """
+        self._render = render
+        self._value = None
+        self.surface: Optional[pygame.Surface] = None
+        self.renders = 0
+
+    def get(self, value: Any) -> pygame.Surface:
+        """Returns the widget's Surface for a value, re-rendering it only if the value changed
+
+        :param value: current bound value
+        :return: pre-rendered Surface
+        """
+        if self.surface is None or value != self._value:
+            self.surface = self._render(value)
+            self._value = value
+            self.renders += 1
+        return self.surface
+
+    def invalidate(self) -> None:
+        """Forces the Surface to be re-rendered on the next call of 'get'"""
+        self.surface = None
@@ -5,6 +5,7 @@ import pygame
 from game.actors import Player
 from game.utilities.helper_functions import read_image
 from game.utilities.gamestate import GameState
+from game.ui.hud import CachedLayer
 
 
 class Life:
@@ -16,6 +17,21 @@ class Life:
         self.img = pygame.transform.scale(self.img, (30, 30))
         self.display = display
         self.font = pygame.font.SysFont('comicsansms', 20)
+        self.layer = CachedLayer(self._render_layer)
+
+    def _render_layer(self, health: int) -> pygame.Surface:
+        """
+        Renders the heart icon and the health value onto one Surface.
+
+        :param health: health value to display
+        :return: Surface containing the icon and the text
+        """
+        life_text = self.font.render(f'{health}', True, (255, 0, 0))
+        layer = pygame.Surface((40 + life_text.get_width(), max(self.img.get_height(), life_text.get_height())),
+                               pygame.SRCALPHA)
+        layer.blit(self.img, (0, 0))
+        layer.blit(life_text, (40, 0))
+        return layer
 
     def draw(self, player: Player) -> None:
         """
@@ -24,9 +40,7 @@ class Life:
         :param player: Player instance used for placing the background correctly
         :return:
         """
-        self.display.blit(self.img, (0, 1))
-        life_text = self.font.render(f'{int(player.health)}', True, (255, 0, 0))
-        self.display.blit(life_text, (40, 1))
+        self.display.blit(self.layer.get(int(player.health)), (0, 1))
 
 
     def update(self, player: Player, state: GameState) -> None:
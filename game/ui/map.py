@@ -1,43 +1,90 @@
 from os import path
+from typing import Optional
 
 import pygame
 
-from game.actors import Player
-from game.utilities.helper_functions import read_image
+from game.utilities.camera import Camera
+from game.utilities.flow_field import FlowField
+from .map_chunks import ChunkStore
 
 
 class Map:
     """Map Class
 
-    Stores a map background as a surface that is read from the 'resources' folder.
+    Stores a map background that is read from the 'resources' folder. The background is cut into chunks (see
+    ChunkStore), only the chunks that are visible are drawn and chunks far away from the visible area are unloaded.
+    Areas of the map that can't be walked on are stored as Rects (in map coordinates) in 'obstacles'.
     """
 
-    def __init__(self, display: pygame.Surface):
-        """Map Class"""
-        self.img = read_image(path.join("resources", "maps", "new_map.jpg"))
+    def __init__(self, display: pygame.Surface, obstacles: Optional[list[pygame.Rect]] = None,
+                 chunk_size: int = 512):
+        """Map Class
+
+        :param display: pygame.display used for rendering
+        :param obstacles: areas of the map that can't be walked on
+        :param chunk_size: edge length of a background chunk in pixels
+        """
+        self.chunks = ChunkStore(path.join("resources", "maps", "new_map.jpg"), chunk_size=chunk_size,
+                                 max_resident=ChunkStore.budget(display.get_size(), chunk_size))
+        self.size = self.chunks.size
         self.display = display
+        self.obstacles = obstacles or []
+
+    def blocked_tiles(self, tile_size: int) -> set[tuple[int, int]]:
+        """
+        Returns the tiles of a tile grid over the map that are (partially) covered by an obstacle.
+
+        :param tile_size: edge length of a tile in pixels
+        :return: set of (x, y) tile coordinates
+        """
+        blocked = set()
+        for obstacle in self.obstacles:
+            for x in range(obstacle.left // tile_size, (obstacle.right - 1) // tile_size + 1):
+                for y in range(obstacle.top // tile_size, (obstacle.bottom - 1) // tile_size + 1):
+                    blocked.add((x, y))
+        return blocked
+
+    def flow_field(self, tile_size: int = 64) -> FlowField:
+        """
+        Creates a FlowField over the map, with the tiles covered by obstacles blocked.
+
+        :param tile_size: edge length of a tile in pixels
+        :return: FlowField covering the whole map
+        """
+        return FlowField(size=self.size, tile_size=tile_size, blocked=self.blocked_tiles(tile_size))
 
-    def draw(self, player: Player) -> None:
+    def draw(self, camera: Camera) -> None:
         """
-        Draws the background.
+        Draws the part of the background inside the camera's view.
 
-        The maps position is determined based on the Player's position. As the Player's position in the game windows
-        is fixed, the map has to move behind it.
+        Only the chunks that intersect the view are blitted, chunks far away from it are unloaded.
 
-        :param player: Player instance used for placing the background correctly
+        :param camera: Camera providing the visible area and the world-to-screen transform
         :return:
         """
-        win_size = self.display.get_size()
-        map_size = self.img.get_size()
-        x = -max(0, min(map_size[0] - win_size[0], player.actor.x))
-        y = -max(0, min(map_size[1] - win_size[1], player.actor.y))
-        self.display.blit(self.img, (x, y))
+        for chunk, chunk_rect in self.chunks.chunks_in(camera.rect):
+            self.display.blit(self.chunks.get(chunk), camera.rect_to_screen(chunk_rect))
+        self.chunks.evict(camera.rect)
+
+    def restore(self, rects: list[pygame.Rect], camera: Camera) -> None:
+        """
+        Draws the background in the given regions of the screen only.
+
+        :param rects: regions of the screen to restore
+        :param camera: Camera providing the world-to-screen transform
+        """
+        for rect in rects:
+            area = rect.move(camera.rect.topleft)
+            for chunk, chunk_rect in self.chunks.chunks_in(area):
+                clipped = area.clip(chunk_rect)
+                self.display.blit(self.chunks.get(chunk), camera.rect_to_screen(clipped),
+                                  area=clipped.move(-chunk_rect.left, -chunk_rect.top))
 
-    def update(self, player: Player) -> None:
+    def update(self, camera: Camera) -> None:
         """
-        Updates the map based on the Player.
+        Updates the map based on the camera.
 
-        :param player: Player instance used for placing the background correctly
+        :param camera: Camera providing the visible area and the world-to-screen transform
         :return:
         """
-        self.draw(player=player)
+        self.draw(camera=camera)
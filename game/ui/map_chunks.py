@@ -0,0 +1,206 @@
+import json
+import os
+from collections import OrderedDict
+from os import path
+from typing import Iterator, Optional
+
+import pygame
+
+from game.utilities.helper_functions import read_image
+
+CHUNK_CACHE_DIR = ".map_chunks"  # directory the pre-cut chunks are stored in (next to the map image)
+USER_CACHE_DIR = path.join(os.environ.get("XDG_CACHE_HOME") or path.join(path.expanduser("~"), ".cache"),
+                           "circleclash", "map_chunks")  # used if the directory of the map image isn't writable
+
+
+class ChunkStore:
+    """Map background cut into square chunks that are loaded on demand
+
+    The first time a map is used (or after the map image changed), the image is decoded once and cut into chunks of
+    'chunk_size' pixels, which are written to CHUNK_CACHE_DIR next to the image. Afterwards, only the chunks that are
+    actually needed are read from disk. Loaded chunks are kept in an LRU cache; chunks far away from the visible area
+    can be evicted with 'evict' and are reloaded lazily when they are needed again. If a chunk is missing or can't be
+    read, the image is cut again.
+
+    If the chunks can't be written next to the image (e.g., on a read-only installation), they are written to
+    USER_CACHE_DIR instead. If that fails as well, all chunks are kept in memory.
+
+    The memory budget only pays off for maps with more chunks than the view and the kept margin around it can touch
+    (see 'budget'); smaller maps, like the 4x3 chunks of the default map at 1280x720, stay resident completely.
+    """
+
+    def __init__(self, image_path: str, chunk_size: int = 512, max_resident: int = 64,
+                 cache_dir: Optional[str] = None):
+        """Map background cut into square chunks that are loaded on demand
+
+        :param image_path: path to the map image
+        :param chunk_size: edge length of a chunk in pixels
+        :param max_resident: maximum number of chunks kept in memory
+        :param cache_dir: directory the chunks are stored in, defaults to CHUNK_CACHE_DIR in the directory of the image,
+                          with USER_CACHE_DIR as fallback
+        """
+        self.image_path = image_path
+        self.chunk_size = chunk_size
+        self.max_resident = max_resident
+        name = path.splitext(path.basename(image_path))[0]
+        cache_dirs = [cache_dir] if cache_dir is not None else \
+            [path.join(path.dirname(path.abspath(image_path)), CHUNK_CACHE_DIR), USER_CACHE_DIR]
+        self._directories = [path.join(directory, f"{name}_{chunk_size}") for directory in cache_dirs]
+        self.directory: Optional[str] = self._directories[0]  # None if the chunks are only kept in memory
+        self._chunks: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()
+        self._in_memory: dict[tuple[int, int], pygame.Surface] = {}
+        self.loads = 0
+        self.evictions = 0
+        self.size = self._prepare()
+        self.columns = -(-self.size[0] // chunk_size)
+        self.rows = -(-self.size[1] // chunk_size)
+
+    @staticmethod
+    def budget(view_size: tuple[int, int], chunk_size: int, margin: int = 1) -> int:
+        """Returns the number of chunks a view and the chunks kept around it by 'evict' can touch at most
+
+        :param view_size: size of the visible area in pixels
+        :param chunk_size: edge length of a chunk in pixels
+        :param margin: number of chunks kept around the view, see 'evict'
+        :return: number of chunks, e.g., to be used as 'max_resident'
+        """
+        columns = (view_size[0] - 1) // chunk_size + 2 + 2 * margin
+        rows = (view_size[1] - 1) // chunk_size + 2 + 2 * margin
+        return columns * rows
+
+    def _manifest_path(self) -> str:
+        return path.join(self.directory, "manifest.json")
+
+    def _chunk_path(self, chunk: tuple[int, int]) -> str:
+        return path.join(self.directory, f"{chunk[0]}_{chunk[1]}.png")
+
+    def _prepare(self) -> tuple[int, int]:
+        """Cuts the map image into chunks, unless up-to-date chunks exist already in one of the cache directories
+
+        :return: size of the whole map in pixels
+        """
+        for directory in self._directories:
+            self.directory = directory
+            size = self._cached_size()
+            if size is not None:
+                return size
+        return self._cut()
+
+    def _cached_size(self) -> Optional[tuple[int, int]]:
+        """Returns the size of the map if the cache directory holds up-to-date chunks of it, None otherwise"""
+        try:
+            with open(self._manifest_path()) as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if manifest["modified"] != path.getmtime(self.image_path) or manifest["chunk_size"] != self.chunk_size:
+            return None
+        size = tuple(manifest["size"])
+        chunks = [(x, y) for x in range(-(-size[0] // self.chunk_size)) for y in range(-(-size[1] // self.chunk_size))]
+        return size if all(path.exists(self._chunk_path(chunk)) for chunk in chunks) else None
+
+    def _cut(self) -> tuple[int, int]:
+        """Cuts the map image into chunks and writes them to the first writable cache directory
+
+        If no cache directory is writable, the chunks are kept in memory.
+
+        :return: size of the whole map in pixels
+        """
+        image = read_image(self.image_path)
+        for directory in self._directories:
+            self.directory = directory
+            try:
+                self._write(image)
+                return image.get_size()
+            except (OSError, pygame.error):
+                continue
+        self.directory = None
+        for x in range(0, image.get_width(), self.chunk_size):
+            for y in range(0, image.get_height(), self.chunk_size):
+                area = pygame.Rect(x, y, self.chunk_size, self.chunk_size).clip(image.get_rect())
+                self._in_memory[(x // self.chunk_size, y // self.chunk_size)] = image.subsurface(area).copy()
+        return image.get_size()
+
+    def _write(self, image: pygame.Surface) -> None:
+        """Writes the chunks of the map image and the manifest to the cache directory
+
+        Every file is written to a temporary file first and then renamed, so an interrupted run doesn't leave partially
+        written chunks behind.
+
+        :param image: decoded map image
+        """
+        modified = path.getmtime(self.image_path)
+        os.makedirs(self.directory, exist_ok=True)
+        if path.exists(self._manifest_path()):
+            os.remove(self._manifest_path())
+        size = image.get_size()
+        for x in range(0, size[0], self.chunk_size):
+            for y in range(0, size[1], self.chunk_size):
+                area = pygame.Rect(x, y, self.chunk_size, self.chunk_size).clip(image.get_rect())
+                chunk_path = self._chunk_path((x // self.chunk_size, y // self.chunk_size))
+                temporary = path.splitext(chunk_path)[0] + ".part.png"
+                pygame.image.save(image.subsurface(area), temporary)
+                os.replace(temporary, chunk_path)
+        with open(self._manifest_path() + ".part", "w") as file:
+            json.dump({"modified": modified, "chunk_size": self.chunk_size, "size": size}, file)
+        os.replace(self._manifest_path() + ".part", self._manifest_path())
+
+    def __len__(self) -> int:
+        """Returns the number of resident chunks"""
+        return len(self._chunks)
+
+    def get(self, chunk: tuple[int, int]) -> pygame.Surface:
+        """Returns a chunk, loading it if it isn't resident
+
+        :param chunk: (x, y) coordinates of the chunk
+        :return: Surface of the chunk
+        """
+        surface = self._chunks.get(chunk)
+        if surface is not None:
+            self._chunks.move_to_end(chunk)
+            return surface
+        if self.directory is None:
+            return self._in_memory[chunk]
+        try:
+            surface = read_image(self._chunk_path(chunk))
+        except (pygame.error, OSError):
+            # the chunk was deleted or damaged after the manifest was checked, so the image is cut again
+            self._cut()
+            if self.directory is None:
+                return self._in_memory[chunk]
+            surface = read_image(self._chunk_path(chunk))
+        self._chunks[chunk] = surface
+        self.loads += 1
+        while len(self._chunks) > self.max_resident:
+            self._chunks.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def chunks_in(self, area: pygame.Rect) -> Iterator[tuple[tuple[int, int], pygame.Rect]]:
+        """Yields all chunks that intersect an area of the map
+
+        :param area: area in map coordinates
+        :return: iterator of ((x, y) chunk coordinates, chunk Rect in map coordinates) tuples
+        """
+        size = self.chunk_size
+        for x in range(max(0, area.left // size), min(self.columns, (area.right - 1) // size + 1)):
+            for y in range(max(0, area.top // size), min(self.rows, (area.bottom - 1) // size + 1)):
+                yield (x, y), pygame.Rect(x * size, y * size, size, size)
+
+    def evict(self, area: pygame.Rect, margin: int = 1) -> None:
+        """Unloads all chunks farther than 'margin' chunks away from an area
+
+        :param area: area in map coordinates that is (about to be) visible
+        :param margin: number of chunks around the area that are kept
+        """
+        size = self.chunk_size
+        left, top = area.left // size - margin, area.top // size - margin
+        right, bottom = (area.right - 1) // size + margin, (area.bottom - 1) // size + margin
+        far = [chunk for chunk in self._chunks if not (left <= chunk[0] <= right and top <= chunk[1] <= bottom)]
+        for chunk in far:
+            del self._chunks[chunk]
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """Returns the number of resident chunks, loads and evictions"""
+        return {"resident": len(self._chunks), "loads": self.loads, "evictions": self.evictions}
@@ -0,0 +1,50 @@
+from typing import Callable, Optional
+
+import pygame
+
+
+class Overlay:
+    """Translucent overlay with static labels
+
+    The overlay's background and its labels are built once and reused on every frame. They are only rebuilt, when the
+    requested size changes (e.g., because the display's resolution changed).
+    """
+
+    def __init__(self, alpha: int, color: tuple[int, int, int] = (0, 0, 0),
+                 build_labels: Optional[Callable[[tuple[int, int]], list[tuple[pygame.Surface, tuple[int, int]]]]] = None):
+        """Translucent overlay with static labels
+
+        :param alpha: transparency of the background (0 to 255)
+        :param color: color of the background
+        :param build_labels: optional function that renders the static labels for an overlay size, returns a list of
+                             (Surface, position) tuples
+        """
+        self.alpha = alpha
+        self.color = color
+        self.build_labels = build_labels
+        self.background: Optional[pygame.Surface] = None
+        self.labels: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        self.builds = 0
+
+    def _build(self, size: tuple[int, int]) -> None:
+        """Creates the background and the labels for an overlay size"""
+        self.background = pygame.Surface(size)
+        self.background.fill(self.color)
+        self.background.set_alpha(self.alpha)
+        self.labels = self.build_labels(size) if self.build_labels else []
+        self.builds += 1
+
+    def draw(self, display: pygame.Surface, size: tuple[int, int], position: tuple[int, int] = (0, 0)) -> None:
+        """
+        Draws the overlay and its labels, rebuilding them if the size changed.
+
+        :param display: Surface to draw on
+        :param size: size of the overlay
+        :param position: position of the overlay's top left corner
+        :return:
+        """
+        if self.background is None or self.background.get_size() != tuple(size):
+            self._build(tuple(size))
+        display.blit(self.background, position)
+        for label, label_position in self.labels:
+            display.blit(label, label_position)
@@ -0,0 +1,58 @@
+import pygame
+
+from game.ui.hud import CachedLayer
+from game.utilities.profiler import Profiler
+
+
+class ProfilerOverlay:
+    """On-screen table of the Profiler's rolling averages and p99 per scope
+
+    The table is rendered into a CachedLayer and only re-rendered every 'refresh_frames' frames, so the overlay neither
+    sorts the samples nor rasterizes fonts on every frame.
+    """
+
+    def __init__(self, display: pygame.Surface, profiler: Profiler, refresh_frames: int = 30):
+        """On-screen table of the Profiler's rolling averages and p99 per scope
+
+        :param display: pygame.display used for rendering
+        :param profiler: Profiler whose results are shown
+        :param refresh_frames: number of frames between two updates of the table
+        """
+        self.display = display
+        self.profiler = profiler
+        self.refresh_frames = refresh_frames
+        self.visible = False
+        self.frames = 0
+        self.font = pygame.font.SysFont('couriernew', 14)
+        self.layer = CachedLayer(lambda _: self._render())
+
+    def toggle(self) -> None:
+        """Shows or hides the overlay, the Profiler is enabled when the overlay is shown"""
+        self.visible = not self.visible
+        if self.visible:
+            self.profiler.enabled = True
+            self.layer.invalidate()
+
+    def _render(self) -> pygame.Surface:
+        """Renders the table of all scopes"""
+        lines = [f"{'scope':<12}{'avg ms':>9}{'p99 ms':>9}"]
+        lines += [f"{name:<12}{stats['mean_ms']:>9.3f}{stats['p99_ms']:>9.3f}"
+                  for name, stats in self.profiler.summary().items()]
+        labels = [self.font.render(line, True, (255, 255, 255)) for line in lines]
+        surface = pygame.Surface((max(label.get_width() for label in labels) + 12,
+                                  sum(label.get_height() for label in labels) + 12))
+        surface.fill((0, 0, 0))
+        surface.set_alpha(180)
+        y = 6
+        for label in labels:
+            surface.blit(label, (6, y))
+            y += label.get_height()
+        return surface
+
+    def update(self) -> None:
+        """Draws the overlay, if it is visible"""
+        if not self.visible:
+            return
+        self.frames += 1
+        surface = self.layer.get(self.frames // self.refresh_frames)
+        self.display.blit(surface, (self.display.get_width() - surface.get_width() - 10, 43))
@@ -2,6 +2,7 @@ import pygame
 
 from game.actors import Player
 from game.utilities.gamestate import GameState
+from game.ui.hud import CachedLayer
 
 class Score:
     """Score Class"""
@@ -10,6 +11,7 @@ class Score:
         """Map Class"""
         self.display = display
         self.font = pygame.font.SysFont('comicsansms', 20)
+        self.layer = CachedLayer(lambda score: self.font.render(f'Score: {score}', True, (255, 255, 255)))
 
     def draw(self, score: int) -> None:
         """
@@ -18,8 +20,7 @@ class Score:
         :param score: score
         :return:
         """
-        score_text = self.font.render(f'Score: {score}', True, (255, 255, 255))
-        self.display.blit(score_text, (200, 1))
+        self.display.blit(self.layer.get(score), (200, 1))
 
     def update(self, score: int, state: GameState) -> None:
         """
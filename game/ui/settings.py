@@ -3,6 +3,8 @@ from os import path
 import pygame
 from game.utilities.helper_functions import read_image
 from game.utilities import GameState
+from game.ui.hud import CachedLayer
+from game.ui.overlay import Overlay
 
 
 class Settings:
@@ -16,36 +18,38 @@ class Settings:
         self.font = pygame.font.SysFont('comicsansms', 30)
         self.font_bigger = pygame.font.SysFont('comicsansms', 40)
 
-        middle = ((self.display.get_width() // 2) - 85, (self.display.get_height() // 2))
+        self._set_coordinates(self.display.get_size())
+        self.overlay = Overlay(alpha=220, build_labels=self._build_labels)
+        self.score_layer = CachedLayer(lambda score: self.font_bigger.render(f'YOUR SCORE: {score}', True,
+                                                                             (255,255,255)))
+
+    def _set_coordinates(self, size: tuple[int, int]) -> None:
+        """Places the texts and buttons based on the display size"""
+        middle = ((size[0] // 2) - 85, (size[1] // 2))
         self.reset_cor = (middle[0], middle[1] + 70)
         self.cont_cor = (middle[0], middle[1])
         self.score_cor = (middle[0] - 100, middle[1] - 200)
         self.quit_cor = (middle[0], middle[1] + 140)
 
+    def _build_labels(self, size: tuple[int, int]) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """Renders the static texts of the pause screen for a display size"""
+        self._set_coordinates(size)
+        return [
+            (self.font.render('Reset', True, (255, 255, 255)), self.reset_cor),
+            (self.font.render("Continue", True, (255, 255, 255)), self.cont_cor),
+            (self.font.render("Quit", True, (255, 0, 0)), self.quit_cor),
+        ]
+
     def draw(self, state, score) -> None:
         if state is GameState.PAUSED:
-            overlay = pygame.Surface(self.display.get_size())
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(220)
-            self.display.blit(overlay, (0, 0))
-
-            text = self.font.render('Reset', True, (255, 255, 255))
-            self.display.blit(text, self.reset_cor)
-
-            text = self.font.render("Continue", True, (255, 255, 255))
-            self.display.blit(text, self.cont_cor)
-
-            text = self.font.render("Quit", True, (255, 0, 0))
-            self.display.blit(text, self.quit_cor)
-
-            text = self.font_bigger.render(f'YOUR SCORE: {score}', True, (255,255,255))
-            self.display.blit(text, self.score_cor)
+            self.overlay.draw(self.display, self.display.get_size())
+            self.display.blit(self.score_layer.get(score), self.score_cor)
 
         self.display.blit(self.img, (self.display.get_width() - 30, 4))
 
 
-    def toggleState(self, state) -> GameState or None:
-        mouse = pygame.mouse.get_pos()
+    def toggleState(self, state, mouse: tuple[int, int] = None) -> GameState or None:
+        mouse = mouse or pygame.mouse.get_pos()
         if 970 + 20 > mouse[0] > 970 and 25 > mouse[1] > 2:
             if state == GameState.RUNNING:
                 return GameState.PAUSED
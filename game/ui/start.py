@@ -1,5 +1,6 @@
 import pygame
 from game.utilities import GameState
+from game.ui.overlay import Overlay
 
 
 class Start:
@@ -12,35 +13,35 @@ class Start:
         self.font_bigger = pygame.font.SysFont('comicsansms', 40)
         self.font_smaller = pygame.font.SysFont('comicsansms', 10)
 
-        middle = ((self.display.get_width() // 2) - 50, (self.display.get_height() // 2))
+        self._set_coordinates(self.display.get_size())
+        self.overlay = Overlay(alpha=220, build_labels=self._build_labels)
+
+    def _set_coordinates(self, size: tuple[int, int]) -> None:
+        """Places the texts and buttons based on the display size"""
+        middle = ((size[0] // 2) - 50, (size[1] // 2))
         self.start_cor = (middle[0], middle[1])
         self.welcome_cor = (middle[0] - 180, middle[1] - 200)
         self.quit_cor = (middle[0], middle[1] + 120)
-        self.names_cor = (5, self.display.get_height() - 30)
-
+        self.names_cor = (5, size[1] - 30)
+
+    def _build_labels(self, size: tuple[int, int]) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """Renders the static texts of the start screen for a display size"""
+        self._set_coordinates(size)
+        return [
+            (self.font.render('Start', True, (0, 255, 0)), self.start_cor),
+            (self.font.render('Quit', True, (255, 0, 0)), self.quit_cor),
+            (self.font_bigger.render('Welcome to Circle Clash', True, (255,255,30)), self.welcome_cor),
+            (self.font_smaller.render('Arbesser, Aldrian, Bartholomäus, Deutsch, Höck, Hirsch', True, (255,255,255)),
+             self.names_cor),
+        ]
 
     def draw(self, state) -> None:
         if state is GameState.READY:
-            overlay = pygame.Surface(self.display.get_size())
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(220)
-            self.display.blit(overlay, (0, 0))
-
-            text = self.font.render('Start', True, (0, 255, 0))
-            self.display.blit(text, self.start_cor)
-
-            text = self.font.render('Quit', True, (255, 0, 0))
-            self.display.blit(text, self.quit_cor)
-
-            text = self.font_bigger.render('Welcome to Circle Clash', True, (255,255,30))
-            self.display.blit(text, self.welcome_cor)
-
-            text = self.font_smaller.render('Arbesser, Aldrian, Bartholomäus, Deutsch, Höck, Hirsch', True, (255,255,255))
-            self.display.blit(text, self.names_cor)
+            self.overlay.draw(self.display, self.display.get_size())
 
-    def toggleState(self, state) -> GameState:
+    def toggleState(self, state, mouse: tuple[int, int] = None) -> GameState:
         if state is GameState.READY:
-            mouse = pygame.mouse.get_pos()
+            mouse = mouse or pygame.mouse.get_pos()
             if self.start_cor[0] + 90 > mouse[0] > self.start_cor[0] and self.start_cor[1] + 40 > mouse[1] > self.start_cor[1]:
                 return GameState.RUNNING
 
@@ -1,5 +1,6 @@
 import pygame
 from game.utilities import GameState
+from game.ui.overlay import Overlay
 
 class UpperBar:
     """UpperBar Class"""
@@ -8,6 +9,7 @@ class UpperBar:
         """UpperBar Class"""
         self.display = display
         self.height = height
+        self.overlay = Overlay(alpha=220)
 
 
     def draw(self) -> None:
@@ -15,11 +17,7 @@ class UpperBar:
         Draws the UpperBar.
         :return:
         """
-        overlay = pygame.Surface((self.display.get_width(), self.height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(220)
-
-        self.display.blit(overlay, (0, 0))
+        self.overlay.draw(self.display, (self.display.get_width(), self.height))
 
     def update(self, state: GameState) -> None:
         """
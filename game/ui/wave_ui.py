@@ -1,5 +1,6 @@
 import pygame
 from game.utilities.gamestate import GameState
+from game.ui.hud import CachedLayer
 
 
 class Wave_ui:
@@ -9,6 +10,7 @@ class Wave_ui:
         """Wave Class"""
         self.display = display
         self.font = pygame.font.SysFont('comicsansms', 20)
+        self.layer = CachedLayer(lambda wave: self.font.render(f'WAVE {wave}', True, (255, 255, 255)))
 
         self.wave_cor = (self.display.get_width() // 2 - 40, 2)
 
@@ -19,8 +21,7 @@ class Wave_ui:
         :param player: Player instance used for placing the background correctly
         :return:
         """
-        life_text = self.font.render(f'WAVE {wave}', True, (255, 255, 255))
-        self.display.blit(life_text, self.wave_cor)
+        self.display.blit(self.layer.get(wave), self.wave_cor)
 
 
     def update(self, wave: int, state: GameState) -> None:
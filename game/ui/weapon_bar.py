@@ -2,6 +2,7 @@ import pygame
 
 from game.ui.weapon_image import Weapon_img
 from game.game_objects.weapon import Weapon
+from game.ui.overlay import Overlay
 
 
 class WeaponBar:
@@ -16,17 +17,14 @@ class WeaponBar:
         self.length = len(weapons) * 60
         self.cord = (display.get_width() // 2 - self.length // 2, display.get_height() - 90)
         self.font = pygame.font.SysFont('comicsansms', 12)
+        self.overlay = Overlay(alpha=120)
 
     def draw(self, score: int) -> None:
         """
         Draws the Weapons.
         :return:
         """
-        overlay = pygame.Surface((self.length, 80))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(120)
-
-        self.display.blit(overlay, self.cord)
+        self.overlay.draw(self.display, (self.length, 80), self.cord)
         for index, weapon in enumerate(self.weapons):
             weapon.update(score, (self.cord[0] + 20 + 60 * index, self.cord[1] + 10))
 
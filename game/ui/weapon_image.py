@@ -4,6 +4,7 @@ import pygame
 
 from game.game_objects.weapon import Weapon
 from game.utilities.helper_functions import read_image
+from game.ui.hud import CachedLayer
 
 
 class Weapon_img:
@@ -17,23 +18,33 @@ class Weapon_img:
         self.img = pygame.transform.scale(weapon.image, (30, 30))
         self.display = display
         self.font = pygame.font.SysFont('comicsansms', 8)
+        self.layer = CachedLayer(self._render_layer)
+
+    def _render_layer(self, content: tuple) -> pygame.Surface:
+        """
+        Renders the icon and the weapon's stats onto one Surface.
+
+        The texts are drawn 10 pixels left of the icon, so the layer's origin is 10 pixels left of the icon's position.
+
+        :param content: tuple of (icon, radius, damage)
+        :return: Surface containing the icon and the texts
+        """
+        img, radius, damage = content
+        texts = [self.font.render(text, True, (255, 255, 255)) for text in ['Damage', f'{damage}', 'Radius', f'{radius}']]
+        width = max([img.get_width() + 10] + [text.get_width() for text in texts])
+        height = max([img.get_height()] + [10 * (index + 1) + text.get_height() for index, text in enumerate(texts)])
+        layer = pygame.Surface((width, height), pygame.SRCALPHA)
+        layer.blit(img, (10, 0))
+        for index, text in enumerate(texts):
+            layer.blit(text, (0, 10 * (index + 1)))
+        return layer
 
     def draw(self, img, radius, damage , cord: (int, int)) -> None:
         """
         Draws the Weapon_img.
         :return:
         """
-        self.display.blit(img, cord)
-
-        damage_text = self.font.render('Damage', True, (255, 255, 255))
-        self.display.blit(damage_text, (cord[0] - 10, cord[1] + 10))
-        damage_value = self.font.render(f'{damage}', True, (255, 255, 255))
-        self.display.blit(damage_value, (cord[0] - 10, cord[1] + 20))
-
-        radius_text = self.font.render('Radius', True, (255, 255, 255))
-        self.display.blit(radius_text, (cord[0] - 10, cord[1] + 30))
-        radius_value = self.font.render(f'{radius}', True, (255, 255, 255))
-        self.display.blit(radius_value, (cord[0] - 10, cord[1] + 40))
+        self.display.blit(self.layer.get((img, radius, damage)), (cord[0] - 10, cord[1]))
 
     def update(self, score: int, cord: (int, int)) -> None:
         """
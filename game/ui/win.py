@@ -1,5 +1,7 @@
 import pygame
 from game.utilities import GameState
+from game.ui.hud import CachedLayer
+from game.ui.overlay import Overlay
 
 
 class Win:
@@ -11,34 +13,36 @@ class Win:
         self.font = pygame.font.SysFont('comicsansms', 30)
         self.font_bigger = pygame.font.SysFont('comicsansms', 40)
 
-        middle = ((self.display.get_width() // 2) - 50, (self.display.get_height() // 2))
+        self._set_coordinates(self.display.get_size())
+        self.overlay = Overlay(alpha=220, build_labels=self._build_labels)
+        self.score_layer = CachedLayer(lambda score: self.font_bigger.render(f'YOUR SCORE: {score}', True,
+                                                                             (255,255,255)))
+
+    def _set_coordinates(self, size: tuple[int, int]) -> None:
+        """Places the texts and buttons based on the display size"""
+        middle = ((size[0] // 2) - 50, (size[1] // 2))
         self.reset_cor = (middle[0], middle[1])
         self.win_cor = (middle[0]-150, middle[1] -250)
         self.score_cor = (middle[0] - 150, middle[1] - 200)
         self.quit_cor = (middle[0], middle[1] + 120)
 
+    def _build_labels(self, size: tuple[int, int]) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """Renders the static texts of the win screen for a display size"""
+        self._set_coordinates(size)
+        return [
+            (self.font_bigger.render('YOU WON!!!', True, (0, 255, 0)), self.win_cor),
+            (self.font.render("Reset", True, (255,255,255)), self.reset_cor),
+            (self.font.render("Quit", True, (255, 0, 0)), self.quit_cor),
+        ]
+
     def draw(self, state, score) -> None:
         if state is GameState.WIN:
-            overlay = pygame.Surface(self.display.get_size())
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(220)
-            self.display.blit(overlay, (0, 0))
-
-            text = self.font_bigger.render('YOU WON!!!', True, (0, 255, 0))
-            self.display.blit(text, self.win_cor)
-
-            text = self.font.render("Reset", True, (255,255,255))
-            self.display.blit(text, self.reset_cor)
-
-            text = self.font.render("Quit", True, (255, 0, 0))
-            self.display.blit(text, self.quit_cor)
-
-            text = self.font_bigger.render(f'YOUR SCORE: {score}', True, (255,255,255))
-            self.display.blit(text, self.score_cor)
+            self.overlay.draw(self.display, self.display.get_size())
+            self.display.blit(self.score_layer.get(score), self.score_cor)
 
 
-    def toggleState(self, state) -> GameState or None:
-        mouse = pygame.mouse.get_pos()
+    def toggleState(self, state, mouse: tuple[int, int] = None) -> GameState or None:
+        mouse = mouse or pygame.mouse.get_pos()
 
         if state is GameState.WIN:
             if self.reset_cor[0] + 70 > mouse[0] > self.reset_cor[0] and self.reset_cor[1] + 40 > mouse[1] > self.reset_cor[1]:
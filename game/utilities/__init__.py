@@ -1,2 +1,15 @@
 from .gamestate import GameState
-from .helper_functions import read_image, rotate_image
+from .helper_functions import read_image, rotate_image, all_subclasses, percentile
+from .assets import AssetCache, asset_cache
+from .rotation_cache import RotationCache, rotation_cache
+from .spatial_hash import SpatialHash
+from .neighbour_grid import NeighbourGrid
+from .flow_field import FlowField
+from .timers import Timer, TimerWheel
+from .events import EventBus
+from .camera import Camera
+from .snapshot import dump_snapshot, load_snapshot
+from .profiler import Profiler
+from .input import InputSource, ScriptedInput
+from .replay import ReplayRecorder, ReplayPlayer
+from .dirty_rects import RecordingSurface, DirtyRectRenderer
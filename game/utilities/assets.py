@@ -0,0 +1,73 @@
+from typing import Iterable, Optional
+
+import pygame
+
+from .helper_functions import read_image
+
+
+class AssetCache:
+    """Process-wide registry for decoded images
+
+    Every (path, size) pair is read, scaled and converted exactly once. All later requests for the same pair return the
+    same shared pygame Surface, so callers must never draw onto a Surface they got from the cache (copy it first).
+    Since converting a Surface requires a display mode, images can only be loaded after 'pygame.display.set_mode' was
+    called. 'preload' can be used to decode all known assets up front (e.g., while the start screen is shown), so no
+    image has to be read from disk while the game is running.
+    """
+
+    def __init__(self):
+        """Process-wide registry for decoded images"""
+        self._images: dict[tuple[str, Optional[tuple[int, int]]], pygame.Surface] = {}
+        self._keys: dict[pygame.Surface, tuple[str, Optional[tuple[int, int]]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_image(self, filepath: str, size: Optional[tuple[int, int]] = None) -> pygame.Surface:
+        """Returns the shared Surface for an image, reading it from disk if it isn't cached yet
+
+        :param filepath: path to image
+        :param size: target size (width, height)
+        :return: shared pygame.Surface created from image
+        """
+        key = (filepath, tuple(size) if size else None)
+        image = self._images.get(key)
+        if image is None:
+            self.misses += 1
+            image = read_image(filepath, size)
+            self._images[key] = image
+            self._keys[image] = key
+        else:
+            self.hits += 1
+        return image
+
+    def preload(self, assets: Iterable[tuple[str, Optional[tuple[int, int]]]]) -> None:
+        """Decodes a batch of images so they are cached before they are needed
+
+        Preloading doesn't count as a hit or miss.
+
+        :param assets: iterable of (path, size) pairs, size can be None to keep the image's original size
+        """
+        for filepath, size in assets:
+            key = (filepath, tuple(size) if size else None)
+            if key not in self._images:
+                self._images[key] = read_image(filepath, size)
+                self._keys[self._images[key]] = key
+
+    def key_of(self, image: pygame.Surface) -> Optional[tuple[str, Optional[tuple[int, int]]]]:
+        """Returns the (path, size) pair a shared Surface was loaded from, None if it isn't from the cache"""
+        return self._keys.get(image)
+
+    def clear(self) -> None:
+        """Drops all cached images and resets the counters"""
+        self._images.clear()
+        self._keys.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Returns the cache's hit/miss counters and the number of cached images"""
+        return {"hits": self.hits, "misses": self.misses, "images": len(self._images)}
+
+
+asset_cache = AssetCache()
+"""Shared AssetCache instance used by all game objects"""
@@ -0,0 +1,55 @@
+from typing import Optional
+
+import pygame
+
+
+class Camera:
+    """World-to-screen transform and visible area
+
+    Game objects live in world coordinates (pixels on the map). The camera's 'rect' is the part of the world that is
+    visible on screen; a world position is drawn at its offset to the rect's top left corner. Draw methods ask the
+    camera whether an object's world rect is visible before rotating or blitting anything, so objects outside the view
+    cost nothing to draw.
+    """
+
+    def __init__(self, size: tuple[int, int], world_size: Optional[tuple[int, int]] = None):
+        """World-to-screen transform and visible area
+
+        :param size: size of the screen in pixels
+        :param world_size: size of the world in pixels, the camera never shows anything outside of it
+        """
+        self.rect = pygame.Rect((0, 0), size)
+        self.world_size = world_size
+
+    @property
+    def offset(self) -> tuple[int, int]:
+        """Position of the world's origin on screen"""
+        return -self.rect.x, -self.rect.y
+
+    def follow(self, position: pygame.Vector2) -> None:
+        """Centers the view on a world position, as far as the world's borders allow
+
+        :param position: world position to center on
+        """
+        x = int(position[0]) - self.rect.width // 2
+        y = int(position[1]) - self.rect.height // 2
+        if self.world_size is not None:
+            x = max(0, min(self.world_size[0] - self.rect.width, x))
+            y = max(0, min(self.world_size[1] - self.rect.height, y))
+        self.rect.topleft = (x, y)
+
+    def to_screen(self, position: pygame.Vector2) -> pygame.Vector2:
+        """Converts a world position to a screen position"""
+        return pygame.Vector2(position[0] - self.rect.x, position[1] - self.rect.y)
+
+    def to_world(self, position: pygame.Vector2) -> pygame.Vector2:
+        """Converts a screen position (e.g., of the mouse) to a world position"""
+        return pygame.Vector2(position[0] + self.rect.x, position[1] + self.rect.y)
+
+    def rect_to_screen(self, rect: pygame.Rect) -> pygame.Rect:
+        """Converts a Rect in world coordinates to screen coordinates"""
+        return rect.move(-self.rect.x, -self.rect.y)
+
+    def is_visible(self, rect: pygame.Rect) -> bool:
+        """Returns True if a Rect in world coordinates overlaps the view"""
+        return self.rect.colliderect(rect)
@@ -0,0 +1,115 @@
+from typing import Callable
+
+import pygame
+
+
+class RecordingSurface:
+    """Proxy for the display Surface that records the area of every blit
+
+    All attributes are forwarded to the wrapped Surface. While 'recording' is True, the Rect returned by every 'blit'
+    is stored in 'rects'. Game objects draw onto the proxy like onto the display itself, so every Character, Weapon,
+    Projectile and UI element reports the regions it changed without knowing about the renderer.
+    """
+
+    def __init__(self, surface: pygame.Surface):
+        """Proxy for the display Surface that records the area of every blit
+
+        :param surface: Surface to draw on (usually the display)
+        """
+        self.surface = surface
+        self.recording = False
+        self.rects: list[pygame.Rect] = []
+
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags: int = 0) -> pygame.Rect:
+        rect = self.surface.blit(source, dest, area, special_flags)
+        if self.recording:
+            self.rects.append(rect)
+        return rect
+
+    def __getattr__(self, name: str):
+        return getattr(self.surface, name)
+
+
+class DirtyRectRenderer:
+    """Renderer that only restores and updates the regions of the screen that changed
+
+    Every frame, the background is restored under all regions that were drawn in the previous frame. Then all objects
+    are drawn (and recorded) and only the regions of the previous and the current frame are pushed to the screen.
+
+    When the background scrolls (i.e., its offset changes, e.g., because the camera follows the Player), the previous
+    frame is shifted with 'Surface.scroll' instead of redrawing the whole background: only the newly exposed strips at
+    the screen's edges and the (shifted) regions drawn in the previous frame are restored. The whole screen changed, so
+    it is pushed completely. Only when 'invalidate' was called (or the first frame, or a jump by more than the screen's
+    size) the whole background is redrawn.
+
+    Restoring many small regions one by one costs more than drawing the whole background in one go, so with more than
+    'max_restore_rects' regions, the whole background is drawn instead. That doesn't change any pixel outside the
+    regions, so only the regions are pushed to the screen anyway.
+    """
+
+    def __init__(self, display: RecordingSurface, max_restore_rects: int = 32):
+        """Renderer that only restores and updates the regions of the screen that changed
+
+        :param display: RecordingSurface wrapping the display
+        :param max_restore_rects: maximum number of regions restored one by one instead of drawing the whole background
+        """
+        self.display = display
+        self.max_restore_rects = max_restore_rects
+        self._previous_rects: list[pygame.Rect] = []
+        self._background_offset = None
+        self._full_redraw = True
+        self._full_update = True
+
+    def invalidate(self) -> None:
+        """Forces a full redraw on the next frame"""
+        self._full_redraw = True
+
+    def _exposed_strips(self, dx: int, dy: int) -> list[pygame.Rect]:
+        """Returns the regions of the screen that are uncovered when its content is shifted by (dx, dy)"""
+        width, height = self.display.get_size()
+        strips = []
+        if dx:
+            strips.append(pygame.Rect(0 if dx > 0 else width + dx, 0, abs(dx), height))
+        if dy:
+            strips.append(pygame.Rect(0, 0 if dy > 0 else height + dy, width, abs(dy)))
+        return strips
+
+    def begin_frame(self, background_offset: tuple[int, int],
+                    draw_background: Callable[[], None],
+                    restore_background: Callable[[list[pygame.Rect]], None]) -> None:
+        """Prepares the display for drawing a frame and starts recording
+
+        :param background_offset: current offset of the background, a changed offset scrolls the screen
+        :param draw_background: callback drawing the whole background
+        :param restore_background: callback drawing the background in the given regions only
+        """
+        previous_offset = self._background_offset
+        self._background_offset = background_offset
+        self._full_update = self._full_redraw
+        if not self._full_redraw and background_offset != previous_offset:
+            dx, dy = background_offset[0] - previous_offset[0], background_offset[1] - previous_offset[1]
+            width, height = self.display.get_size()
+            if abs(dx) < width and abs(dy) < height and len(self._previous_rects) <= self.max_restore_rects:
+                self.display.scroll(dx, dy)
+                restore_background([rect.move(dx, dy) for rect in self._previous_rects]
+                                   + self._exposed_strips(dx, dy))
+                self._full_update = True
+            else:
+                self._full_redraw = self._full_update = True
+        if self._full_redraw or len(self._previous_rects) > self.max_restore_rects:
+            draw_background()
+        elif not self._full_update:
+            restore_background(self._previous_rects)
+        self.display.rects = []
+        self.display.recording = True
+
+    def end_frame(self) -> None:
+        """Stops recording and pushes the changed regions to the screen"""
+        self.display.recording = False
+        rects = self.display.rects
+        if self._full_update:
+            pygame.display.update()
+        else:
+            pygame.display.update(self._previous_rects + rects)
+        self._previous_rects = rects
+        self._full_redraw = False
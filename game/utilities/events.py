@@ -1,10 +1,160 @@
-from pygame import USEREVENT
-
-WIN_EVENT = USEREVENT + 1
-SPAWN_WAVE_EVENT = USEREVENT + 2
-# probably not necessary:
-# PLAYER_HIT_EVENT = USEREVENT + 3
-# PLAYER_HEALTH_CRITICAL_EVENT = USEREVENT + 4
-PLAYER_KILLED_EVENT = USEREVENT + 5
-ENEMY_KILLED_EVENT = USEREVENT + 6
-ENEMY_DESPAWN_EVENT = USEREVENT + 7
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from game.actors.enemy import Enemy
+    from game.actors.player import Player
+
+
+class GameEvent:
+    """Base class of all events published on the EventBus"""
+
+
+class WinEvent(GameEvent):
+    """The last wave was completed"""
+
+
+class SpawnWaveEvent(GameEvent):
+    """A new wave was spawned"""
+
+    def __init__(self, index: int):
+        """A new wave was spawned
+
+        :param index: index of the spawned wave
+        """
+        self.index = index
+
+
+class PlayerKilledEvent(GameEvent):
+    """The Player was killed"""
+
+    def __init__(self, player: "Player"):
+        """The Player was killed
+
+        :param player: the killed Player
+        """
+        self.player = player
+
+
+class EnemyKilledEvent(GameEvent):
+    """An Enemy was killed"""
+
+    def __init__(self, killed: "Enemy"):
+        """An Enemy was killed
+
+        :param killed: the killed Enemy
+        """
+        self.killed = killed
+
+
+class EnemyDespawnEvent(GameEvent):
+    """A killed Enemy was removed from the map"""
+
+    def __init__(self, killed: "Enemy"):
+        """A killed Enemy was removed from the map
+
+        :param killed: the removed Enemy
+        """
+        self.killed = killed
+
+
+class HordeStatsEvent(GameEvent):
+    """Periodic load report of the endless mode"""
+
+    def __init__(self, wave: int, enemies: int, pending: int, projectiles: int, frame_time: float,
+                 spawn_scale: float):
+        """Periodic load report of the endless mode
+
+        :param wave: index of the active wave
+        :param enemies: number of Enemies on the map (including killed ones that weren't removed yet)
+        :param pending: number of Enemies of the active wave that weren't spawned yet
+        :param projectiles: number of live projectiles
+        :param frame_time: moving average of the frame time in seconds
+        :param spawn_scale: factor the spawn rate is currently scaled with (0 to 1)
+        """
+        self.wave = wave
+        self.enemies = enemies
+        self.pending = pending
+        self.projectiles = projectiles
+        self.frame_time = frame_time
+        self.spawn_scale = spawn_scale
+
+
+E = TypeVar("E", bound=GameEvent)
+
+
+class EventBus:
+    """Typed publish/subscribe bus for game logic events
+
+    Handlers subscribe to an event class (the topic). Published events are queued and delivered in one batch per
+    simulation step when 'dispatch' is called, to the handlers of exactly their class, so delivering an event costs one
+    dictionary lookup plus one call per handler. Events published by handlers during dispatch are delivered in the
+    same batch.
+
+    Only game logic uses the bus, the SDL event queue is left to real OS input.
+    """
+
+    def __init__(self):
+        """Typed publish/subscribe bus for game logic events"""
+        self._handlers: defaultdict[type[GameEvent], list[Callable[[GameEvent], None]]] = defaultdict(list)
+        self._queue: list[GameEvent] = []
+        self.published = 0
+        self.delivered = 0
+
+    def __len__(self) -> int:
+        """Returns the number of queued events"""
+        return len(self._queue)
+
+    def subscribe(self, event_type: type[E], handler: Callable[[E], None]) -> None:
+        """Calls a handler for every event of a class
+
+        :param event_type: GameEvent subclass to subscribe to
+        :param handler: function called with the event
+        """
+        self._handlers[event_type].append(handler)
+
+    def unsubscribe(self, event_type: type[E], handler: Callable[[E], None]) -> None:
+        """Removes a handler
+
+        :param event_type: GameEvent subclass the handler was subscribed to
+        :param handler: handler to remove
+        """
+        if handler in self._handlers.get(event_type, []):
+            self._handlers[event_type].remove(handler)
+
+    def publish(self, event: GameEvent) -> None:
+        """Queues an event for the next 'dispatch'
+
+        :param event: event to publish
+        """
+        self._queue.append(event)
+        self.published += 1
+
+    def dispatch(self) -> int:
+        """Delivers all queued events to their handlers
+
+        :return: number of delivered events
+        """
+        delivered = 0
+        while self._queue:
+            queue, self._queue = self._queue, []
+            for event in queue:
+                for handler in self._handlers.get(type(event), ()):
+                    handler(event)
+                delivered += 1
+        self.delivered += delivered
+        return delivered
+
+    def clear(self, handlers: bool = False) -> None:
+        """Drops all queued events
+
+        :param handlers: also remove all handlers
+        """
+        self._queue.clear()
+        if handlers:
+            self._handlers.clear()
+
+    def stats(self) -> dict:
+        """Returns the number of published, delivered and queued events"""
+        return {"published": self.published, "delivered": self.delivered, "queued": len(self._queue)}
+
@@ -0,0 +1,183 @@
+from collections import deque
+from typing import Iterable, Optional
+
+import pygame
+
+NEIGHBOURS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+DIRECTIONS = NEIGHBOURS + [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+ZERO = pygame.Vector2()
+
+
+class FlowField:
+    """Direction field towards a target over a grid of tiles
+
+    The world is divided into square tiles of 'tile_size' pixels, some of which can be blocked (e.g., by obstacles of
+    the map). A breadth-first search from the target's tile computes the distance (in tiles) of every reachable tile to
+    the target. A tile's direction points to its neighbour that is closest to the target, diagonal steps aren't allowed
+    to cut the corners of blocked tiles.
+
+    The search is only rerun when the target moves to another tile, over neighbour lists that are built once. The
+    directions are computed lazily, for the tiles that are looked up with 'direction', and cached until the next search,
+    so a recompute costs one search plus a direction per tile with Characters on it. Without blocked tiles, the straight
+    line is always the shortest path and the field isn't computed at all.
+
+    Characters that ended up on a blocked tile (e.g., by spawning inside an obstacle or by being pushed into one) are
+    led out of the obstacle: onto the walkable neighbour closest to the target or, inside big obstacles, along the
+    shortest way out, which only depends on the grid and is computed once.
+    """
+
+    def __init__(self, size: tuple[int, int], tile_size: int = 64, blocked: Iterable[tuple[int, int]] = ()):
+        """Direction field towards a target over a grid of tiles
+
+        :param size: size of the world in pixels
+        :param tile_size: edge length of a tile in pixels
+        :param blocked: (x, y) coordinates of the tiles that can't be walked on
+        """
+        self.tile_size = tile_size
+        self.columns = -(-size[0] // tile_size)
+        self.rows = -(-size[1] // tile_size)
+        self.blocked = set(blocked)
+        self.target_tile: Optional[tuple[int, int]] = None
+        self._distances: list[Optional[int]] = []
+        self._directions: dict[int, pygame.Vector2] = {}
+        self._neighbours = self._build_neighbours(NEIGHBOURS)
+        self._moves = self._build_neighbours(DIRECTIONS)
+        self._exits = self._build_exits()
+        self.recomputes = 0
+
+    @property
+    def active(self) -> bool:
+        """True once the field has been computed (i.e., there are blocked tiles and 'update' was called)"""
+        return bool(self._distances)
+
+    def tile(self, position: pygame.Vector2) -> tuple[int, int]:
+        """Returns the coordinates of the tile containing a position, clamped to the grid"""
+        return (max(0, min(self.columns - 1, int(position[0] // self.tile_size))),
+                max(0, min(self.rows - 1, int(position[1] // self.tile_size))))
+
+    def _walkable(self, x: int, y: int) -> bool:
+        return 0 <= x < self.columns and 0 <= y < self.rows and (x, y) not in self.blocked
+
+    def _build_neighbours(self, offsets: list[tuple[int, int]]) -> list[list[tuple[int, pygame.Vector2]]]:
+        """Returns, per tile index, the walkable neighbours reachable with the given offsets
+
+        :param offsets: (x, y) steps to a neighbour, diagonal steps that cut the corner of a blocked tile are left out
+        :return: list of (tile index, normalized direction) pairs per tile index (blocked tiles have neighbours too,
+                 the target can stand on a partially blocked tile)
+        """
+        columns = self.columns
+        neighbours: list[list[tuple[int, pygame.Vector2]]] = [[] for _ in range(columns * self.rows)]
+        if not self.blocked:
+            return neighbours
+        for y in range(self.rows):
+            for x in range(columns):
+                for offset_x, offset_y in offsets:
+                    next_x, next_y = x + offset_x, y + offset_y
+                    if not self._walkable(next_x, next_y):
+                        continue
+                    if offset_x and offset_y and not (self._walkable(x + offset_x, y)
+                                                      and self._walkable(x, y + offset_y)):
+                        continue  # don't cut corners
+                    neighbours[y * columns + x].append((next_y * columns + next_x,
+                                                        pygame.Vector2(offset_x, offset_y).normalize()))
+        return neighbours
+
+    def _build_exits(self) -> dict[int, pygame.Vector2]:
+        """Returns the first step out of the obstacle for blocked tiles without a walkable neighbour
+
+        Breadth-first search over the blocked tiles, starting at the ones next to a walkable tile.
+
+        :return: dictionary: key = tile index, value = direction to the neighbour closer to the obstacle's edge
+        """
+        columns = self.columns
+        exits: dict[int, pygame.Vector2] = {}
+        edge = [y * columns + x for x, y in self.blocked if self._moves[y * columns + x]]
+        reached = set(edge)
+        queue = deque(edge)
+        while queue:
+            index = queue.popleft()
+            x, y = index % columns, index // columns
+            for offset_x, offset_y in NEIGHBOURS:
+                next_x, next_y = x + offset_x, y + offset_y
+                next_index = next_y * columns + next_x
+                if (next_x, next_y) in self.blocked and next_index not in reached:
+                    reached.add(next_index)
+                    exits[next_index] = pygame.Vector2(-offset_x, -offset_y)
+                    queue.append(next_index)
+        return exits
+
+    def update(self, target_position: pygame.Vector2) -> bool:
+        """Recomputes the field if the target moved to another tile
+
+        :param target_position: position of the target
+        :return: True if the field was recomputed
+        """
+        if not self.blocked:
+            return False
+        target_tile = self.tile(target_position)
+        if target_tile == self.target_tile:
+            return False
+        self.target_tile = target_tile
+        self._compute_distances()
+        self._directions = {}
+        self.recomputes += 1
+        return True
+
+    def _compute_distances(self) -> None:
+        """Breadth-first search from the target's tile"""
+        neighbours = self._neighbours
+        distances: list[Optional[int]] = [None] * (self.columns * self.rows)
+        start = self.target_tile[1] * self.columns + self.target_tile[0]
+        distances[start] = 0
+        queue = deque([start])
+        while queue:
+            index = queue.popleft()
+            distance = distances[index] + 1
+            for next_index, _ in neighbours[index]:
+                if distances[next_index] is None:
+                    distances[next_index] = distance
+                    queue.append(next_index)
+        self._distances = distances
+
+    def _compute_direction(self, index: int) -> pygame.Vector2:
+        """Returns the direction from a tile to its neighbour closest to the target
+
+        Blocked tiles aren't reached by the search, they lead to their walkable neighbour closest to the target or, if
+        they have none, out of their obstacle.
+        """
+        distances = self._distances
+        best = distances[index]
+        if best == 0:  # the target's tile
+            return ZERO
+        best_direction = ZERO
+        for next_index, direction in self._moves[index]:
+            distance = distances[next_index]
+            if distance is not None and (best is None or distance < best):
+                best, best_direction = distance, direction
+        if best is None:
+            return self._exits.get(index, ZERO)
+        return best_direction
+
+    def direction(self, position: pygame.Vector2) -> pygame.Vector2:
+        """Returns the direction to walk in at a position
+
+        :param position: position to look up
+        :return: normalized direction (leading out of the obstacle on blocked tiles), a zero vector on the target's
+                 tile, on unreachable tiles, before the first 'update' and without blocked tiles (the vector is shared
+                 between tiles and must not be modified)
+        """
+        x, y = self.tile(position)
+        return self.tile_direction(y * self.columns + x)
+
+    def tile_direction(self, index: int) -> pygame.Vector2:
+        """Returns the direction to walk in on a tile
+
+        :param index: index of the tile (y * columns + x)
+        :return: normalized direction or a zero vector, like 'direction'
+        """
+        if not self._distances:
+            return ZERO
+        direction = self._directions.get(index)
+        if direction is None:
+            direction = self._directions[index] = self._compute_direction(index)
+        return direction
@@ -31,3 +31,32 @@ def rotate_image(img: pygame.Surface, angle: float) -> pygame.Surface:
     rot_rect = img.get_rect()
     rot_rect.center = rot_image.get_rect().center
     return rot_image.subsurface(rot_rect)
+
+
+def all_subclasses(cls: type) -> list[type]:
+    """
+    Returns all direct and indirect subclasses of a class
+
+    :param cls: base class
+    :return: list of subclasses
+    """
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(all_subclasses(subclass))
+    return subclasses
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Returns the q-th percentile of a list of values using the nearest-rank method
+
+    :param values: list of measurements
+    :param q: percentile between 0 and 100
+    :return: percentile of the values, 0.0 for an empty list
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
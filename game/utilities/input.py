@@ -0,0 +1,72 @@
+import pygame
+
+
+class InputSource:
+    """Source of mouse and keyboard input
+
+    The default InputSource reads the real mouse and keyboard. Game objects ask their InputSource instead of calling
+    'pygame.mouse.get_pos' or 'pygame.key.get_pressed' directly, so input can be scripted (e.g., for headless runs) or
+    recorded and replayed (see ReplayRecorder and ReplayPlayer).
+    """
+
+    def get_mouse_pos(self) -> tuple[int, int]:
+        """Returns the current mouse position on screen"""
+        return pygame.mouse.get_pos()
+
+    def get_pressed(self):
+        """Returns the state of all keys, indexable by pygame key constants (e.g., K_w)"""
+        return pygame.key.get_pressed()
+
+    def observe(self, event: pygame.event.Event) -> None:
+        """Called with every OS input event the game handles (e.g., to record it)"""
+
+    def step(self) -> list[pygame.event.Event]:
+        """Called at the start of every simulation step
+
+        :return: input events the game handles before the step (e.g., when replaying a recording)
+        """
+        return []
+
+    def spawn_scale(self, measured: float) -> float:
+        """Called after 'step' in endless mode with the spawn scale of the SpawnGovernor
+
+        The scale depends on the measured frame time, so it is treated like input: it is recorded in replays and replaced
+        by the recorded value when playing them back.
+
+        :param measured: spawn scale the SpawnGovernor computed from the frame times
+        :return: spawn scale used for the simulation step
+        """
+        return measured
+
+
+class PressedKeys:
+    """Key state that can be indexed like the result of 'pygame.key.get_pressed'"""
+
+    def __init__(self, keys: set[int]):
+        """Key state that can be indexed like the result of 'pygame.key.get_pressed'
+
+        :param keys: pygame key constants of all pressed keys
+        """
+        self.keys = keys
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.keys
+
+
+class ScriptedInput(InputSource):
+    """InputSource whose state is set by code instead of the real mouse and keyboard"""
+
+    def __init__(self, mouse_pos: tuple[int, int] = (0, 0), pressed: set[int] = None):
+        """InputSource whose state is set by code instead of the real mouse and keyboard
+
+        :param mouse_pos: initial mouse position
+        :param pressed: pygame key constants of initially pressed keys
+        """
+        self.mouse_pos = mouse_pos
+        self.pressed = set(pressed or ())
+
+    def get_mouse_pos(self) -> tuple[int, int]:
+        return self.mouse_pos
+
+    def get_pressed(self) -> PressedKeys:
+        return PressedKeys(self.pressed)
@@ -0,0 +1,91 @@
+from collections import defaultdict
+from typing import Iterable
+
+import pygame
+
+
+class NeighbourGrid:
+    """Uniform grid for finding the nearby sprites of a sprite
+
+    Sprites are sorted into square cells of 'cell_size' pixels based on their 'position' attribute (a point, so every
+    sprite is stored in exactly one cell). A neighbour query only looks at the cell of the queried position and the
+    eight cells around it, so with a 'cell_size' of at least the query radius, no neighbour is missed.
+
+    Every query returns at most 'max_neighbours' sprites and looks at no more than 'max_candidates' sprites. The cost of
+    a query is therefore bounded, no matter how crowded a cell gets, which keeps local avoidance for a whole wave
+    linear in the number of sprites.
+
+    Like the SpatialHash, the grid doesn't track movement and has to be rebuilt every tick.
+    """
+
+    def __init__(self, cell_size: int = 64, max_neighbours: int = 6, max_candidates: int = 32):
+        """Uniform grid for finding the nearby sprites of a sprite
+
+        :param cell_size: edge length of a grid cell in pixels, should be at least the largest query radius
+        :param max_neighbours: maximum number of sprites returned by a query
+        :param max_candidates: maximum number of sprites a query looks at
+        """
+        self.cell_size = cell_size
+        self.max_neighbours = max_neighbours
+        self.max_candidates = max_candidates
+        self._cells: defaultdict[tuple[int, int], list[tuple[pygame.sprite.Sprite, pygame.Vector2]]] = \
+            defaultdict(list)
+        self.queries = 0
+        self.candidates_checked = 0
+
+    def __len__(self) -> int:
+        return sum(len(cell) for cell in self._cells.values())
+
+    def _cell(self, position: pygame.Vector2) -> tuple[int, int]:
+        """Returns the coordinates of the cell containing a position"""
+        return int(position[0] // self.cell_size), int(position[1] // self.cell_size)
+
+    def clear(self) -> None:
+        """Removes all sprites from the grid"""
+        self._cells.clear()
+
+    def rebuild(self, sprites: Iterable[pygame.sprite.Sprite]) -> None:
+        """Replaces the grid's content with the given sprites
+
+        The sprites' positions are copied, so the grid keeps describing the start of the tick while sprites move.
+
+        :param sprites: sprites with a 'position' attribute
+        """
+        self.clear()
+        for sprite in sprites:
+            position = pygame.Vector2(sprite.position)
+            self._cells[self._cell(position)].append((sprite, position))
+
+    def neighbours(self, sprite: pygame.sprite.Sprite, position: pygame.Vector2, radius: float
+                   ) -> list[tuple[pygame.sprite.Sprite, pygame.Vector2]]:
+        """Returns up to 'max_neighbours' sprites within a radius around a position (within the candidate budget)
+
+        The sprite's own cell is searched first, so the closest sprites are usually found before the budget is used up.
+
+        :param sprite: sprite the query is made for, it is never part of the result
+        :param position: center of the search
+        :param radius: search radius in pixels
+        :return: list of (sprite, position) tuples
+        """
+        self.queries += 1
+        found = []
+        checked = 0
+        radius_squared = radius * radius
+        cell_x, cell_y = self._cell(position)
+        for offset_x, offset_y in NEIGHBOUR_CELLS:
+            for other, other_position in self._cells.get((cell_x + offset_x, cell_y + offset_y), ()):
+                checked += 1
+                if other is not sprite and position.distance_squared_to(other_position) < radius_squared:
+                    found.append((other, other_position))
+                if len(found) == self.max_neighbours or checked == self.max_candidates:
+                    self.candidates_checked += checked
+                    return found
+        self.candidates_checked += checked
+        return found
+
+    def stats(self) -> dict:
+        """Returns the number of queries and checked candidates since the grid was created"""
+        return {"queries": self.queries, "candidates_checked": self.candidates_checked}
+
+
+NEIGHBOUR_CELLS = [(0, 0), (-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1)]
@@ -0,0 +1,112 @@
+import csv
+import json
+from collections import deque
+from contextlib import nullcontext
+from time import perf_counter
+
+from .helper_functions import percentile
+
+_DISABLED_SCOPE = nullcontext()
+
+
+class _Scope:
+    """Context manager timing one stage, the duration is added to the Profiler's ring buffer of the scope's name"""
+
+    __slots__ = ("samples", "start")
+
+    def __init__(self, samples: deque):
+        self.samples = samples
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.samples.append(perf_counter() - self.start)
+        return False
+
+
+class Profiler:
+    """Lightweight per-subsystem frame profiler
+
+    Stages of the game loop are wrapped in named scopes ('with profiler.scope("map"): ...'). The durations of the last
+    'capacity' runs of every scope are kept in fixed-size ring buffers, from which rolling averages and percentiles
+    are computed. The results can be dumped as CSV or JSON.
+
+    While the profiler is disabled, 'scope' returns a shared no-op context manager, so instrumented code costs one
+    attribute lookup and an empty 'with' per scope.
+    """
+
+    def __init__(self, enabled: bool = False, capacity: int = 600):
+        """Lightweight per-subsystem frame profiler
+
+        :param enabled: measure scopes right away
+        :param capacity: number of samples kept per scope
+        """
+        self.enabled = enabled
+        self.capacity = capacity
+        self._scopes: dict[str, _Scope] = {}
+
+    def scope(self, name: str):
+        """Returns a context manager timing the enclosed code under a name
+
+        :param name: name of the scope
+        :return: context manager
+        """
+        if not self.enabled:
+            return _DISABLED_SCOPE
+        scope = self._scopes.get(name)
+        if scope is None:
+            scope = self._scopes[name] = _Scope(deque(maxlen=self.capacity))
+        return scope
+
+    def toggle(self) -> bool:
+        """Enables or disables the profiler
+
+        :return: True if the profiler is enabled now
+        """
+        self.enabled = not self.enabled
+        return self.enabled
+
+    def clear(self) -> None:
+        """Drops all samples"""
+        self._scopes.clear()
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Returns rolling statistics of all scopes in the order they were first measured
+
+        :return: dictionary with the number of samples, mean, p50, p99 and max in milliseconds per scope
+        """
+        summary = {}
+        for name, scope in self._scopes.items():
+            samples = list(scope.samples)
+            summary[name] = {
+                "samples": len(samples),
+                "mean_ms": sum(samples) / len(samples) * 1_000 if samples else 0.0,
+                "p50_ms": percentile(samples, 50) * 1_000,
+                "p99_ms": percentile(samples, 99) * 1_000,
+                "max_ms": max(samples, default=0.0) * 1_000,
+            }
+        return summary
+
+    def dump(self, file_path: str) -> None:
+        """Writes the summary and the raw samples to a file
+
+        Files ending in '.json' get the summary and all samples (in milliseconds) as JSON, all other files the summary
+        as CSV with one row per scope.
+
+        :param file_path: path of the file to write
+        """
+        summary = self.summary()
+        if file_path.endswith(".json"):
+            samples = {name: [sample * 1_000 for sample in scope.samples] for name, scope in self._scopes.items()}
+            with open(file_path, "w") as file:
+                json.dump({"summary": summary, "samples_ms": samples}, file, indent=2)
+            return
+        with open(file_path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["scope", "samples", "mean_ms", "p50_ms", "p99_ms", "max_ms"])
+            for name, stats in summary.items():
+                writer.writerow([name, stats["samples"], *(f"{stats[key]:.4f}" for key in
+                                                           ["mean_ms", "p50_ms", "p99_ms", "max_ms"])])
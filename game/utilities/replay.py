@@ -0,0 +1,171 @@
+import struct
+from typing import Optional
+
+import pygame
+from pygame.locals import QUIT, KEYDOWN, MOUSEBUTTONDOWN, MOUSEWHEEL, K_a, K_d, K_s, K_w, K_LEFT, K_RIGHT, K_UP, \
+    K_DOWN
+
+from .input import InputSource, PressedKeys
+
+REPLAY_MAGIC = b"CCRP"
+REPLAY_VERSION = 2
+HEADER = struct.Struct("<4sBQHHHB")  # magic, version, seed, simulation rate, display width, display height, flags
+FLAG_ENDLESS = 1  # the session was played in endless mode, every step stores its spawn scale
+TICK = struct.Struct("<hhBB")  # mouse x, mouse y, bitmask of MOVEMENT_KEYS, number of events
+SPAWN_SCALE = struct.Struct("<d")  # spawn scale of an endless step, stored after the step's events
+MOVEMENT_KEYS = [K_a, K_d, K_s, K_w, K_LEFT, K_RIGHT, K_UP, K_DOWN]  # the only held keys the simulation reads
+EVENT_TYPES = [QUIT, KEYDOWN, MOUSEBUTTONDOWN, MOUSEWHEEL]  # recorded event types, stored as their index
+EVENT_PAYLOADS = {  # event type: (struct of the payload, names of the event's attributes)
+    QUIT: (struct.Struct("<"), ()),
+    KEYDOWN: (struct.Struct("<i"), ("key",)),
+    MOUSEBUTTONDOWN: (struct.Struct("<Bhh"), ("button", "x", "y")),
+    MOUSEWHEEL: (struct.Struct("<h"), ("y",)),
+}
+
+
+def _clamp_short(value: float) -> int:
+    return max(-32_768, min(32_767, int(value)))
+
+
+class ReplayRecorder(InputSource):
+    """InputSource that reads the real mouse and keyboard and records the input of every simulation step
+
+    At the start of every simulation step, the mouse position and the movement keys are read once and written to the
+    replay together with the OS input events the game handled since the last step. During the step, game objects only
+    see that snapshot, so replaying the recording yields exactly the same input.
+
+    A replay is a small header followed by one record per simulation step: the mouse position, a bitmask of
+    MOVEMENT_KEYS and the events of the step (an event type index plus a fixed payload). An idle step takes 6 bytes.
+    In endless mode, every record additionally stores the spawn scale of the step, because it depends on the measured
+    frame time. Records are streamed to disk through a buffered file, so recording doesn't cause a system call per step.
+    """
+
+    def __init__(self, file_path: str, seed: int, simulation_rate: int, display_size: tuple[int, int],
+                 source: Optional[InputSource] = None, buffer_size: int = 64 * 1024, endless: bool = False):
+        """InputSource that reads the real mouse and keyboard and records the input of every simulation step
+
+        :param file_path: path of the replay file
+        :param seed: seed of the game's random number generator
+        :param simulation_rate: simulation steps per second
+        :param display_size: size of the display in pixels, mouse positions are screen positions
+        :param source: InputSource that is recorded, reads the real mouse and keyboard by default
+        :param buffer_size: size of the write buffer in bytes
+        :param endless: the game runs in endless mode, its spawn scale is recorded with every step
+        """
+        self.source = source or InputSource()
+        self.file = open(file_path, "wb", buffering=buffer_size)
+        self.file.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed, simulation_rate, *display_size,
+                                    FLAG_ENDLESS if endless else 0))
+        self.mouse_pos = (0, 0)
+        self.pressed = PressedKeys(set())
+        self._events: list[pygame.event.Event] = []
+        self.ticks = 0
+
+    def get_mouse_pos(self) -> tuple[int, int]:
+        return self.mouse_pos
+
+    def get_pressed(self) -> PressedKeys:
+        return self.pressed
+
+    def observe(self, event: pygame.event.Event) -> None:
+        if event.type in EVENT_PAYLOADS:
+            self._events.append(event)
+
+    def step(self) -> list[pygame.event.Event]:
+        mouse_pos = self.source.get_mouse_pos()
+        self.mouse_pos = (_clamp_short(mouse_pos[0]), _clamp_short(mouse_pos[1]))
+        keys = self.source.get_pressed()
+        mask = 0
+        pressed = set()
+        for bit, key in enumerate(MOVEMENT_KEYS):
+            if keys[key]:
+                mask |= 1 << bit
+                pressed.add(key)
+        self.pressed = PressedKeys(pressed)
+        events = self._events[:255]
+        self._events = self._events[255:]
+        self.file.write(TICK.pack(*self.mouse_pos, mask, len(events)))
+        for event in events:
+            payload, attributes = EVENT_PAYLOADS[event.type]
+            if event.type == MOUSEBUTTONDOWN:
+                values = (event.button, _clamp_short(event.pos[0]), _clamp_short(event.pos[1]))
+            else:
+                values = tuple(getattr(event, attribute) for attribute in attributes)
+            self.file.write(bytes([EVENT_TYPES.index(event.type)]) + payload.pack(*values))
+        self.ticks += 1
+        return []
+
+    def spawn_scale(self, measured: float) -> float:
+        self.file.write(SPAWN_SCALE.pack(measured))
+        return measured
+
+    def close(self) -> None:
+        """Flushes the buffer and closes the replay file"""
+        if not self.file.closed:
+            self.file.close()
+
+
+class ReplayPlayer(InputSource):
+    """InputSource that plays back a replay written by a ReplayRecorder
+
+    The whole replay is read into memory when it is opened. Every simulation step consumes one record: the mouse
+    position and the movement keys are set and the recorded events are returned, so the game handles them before the
+    step exactly like it did while recording. Once all records are consumed, a QUIT event is returned.
+
+    The game has to be created with the replay's seed, simulation rate, display size and endless mode. In endless
+    mode, the recorded spawn scale replaces the one measured during playback.
+    """
+
+    def __init__(self, file_path: str):
+        """InputSource that plays back a replay written by a ReplayRecorder
+
+        :param file_path: path of the replay file
+        """
+        with open(file_path, "rb") as file:
+            self._data = file.read()
+        magic, version, self.seed, self.simulation_rate, width, height, flags = HEADER.unpack_from(self._data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"'{file_path}' is not a replay of version {REPLAY_VERSION}")
+        self.display_size = (width, height)
+        self.endless = bool(flags & FLAG_ENDLESS)
+        self._offset = HEADER.size
+        self.mouse_pos = (0, 0)
+        self.pressed = PressedKeys(set())
+        self.ticks = 0
+
+    @property
+    def finished(self) -> bool:
+        """Returns True when all records were played"""
+        return self._offset >= len(self._data)
+
+    def get_mouse_pos(self) -> tuple[int, int]:
+        return self.mouse_pos
+
+    def get_pressed(self) -> PressedKeys:
+        return self.pressed
+
+    def step(self) -> list[pygame.event.Event]:
+        if self.finished:
+            return [pygame.event.Event(QUIT)]
+        x, y, mask, num_events = TICK.unpack_from(self._data, self._offset)
+        self._offset += TICK.size
+        self.mouse_pos = (x, y)
+        self.pressed = PressedKeys({key for bit, key in enumerate(MOVEMENT_KEYS) if mask & 1 << bit})
+        events = []
+        for _ in range(num_events):
+            event_type = EVENT_TYPES[self._data[self._offset]]
+            payload, attributes = EVENT_PAYLOADS[event_type]
+            values = dict(zip(attributes, payload.unpack_from(self._data, self._offset + 1)))
+            self._offset += 1 + payload.size
+            if event_type == MOUSEBUTTONDOWN:
+                values = {"button": values["button"], "pos": (values["x"], values["y"])}
+            events.append(pygame.event.Event(event_type, values))
+        self.ticks += 1
+        return events
+
+    def spawn_scale(self, measured: float) -> float:
+        if self.finished:
+            return measured
+        scale, = SPAWN_SCALE.unpack_from(self._data, self._offset)
+        self._offset += SPAWN_SCALE.size
+        return scale
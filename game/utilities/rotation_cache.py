@@ -0,0 +1,108 @@
+from collections import OrderedDict
+from typing import Optional
+
+import pygame
+
+from .helper_functions import rotate_image
+
+
+class RotationCache:
+    """LRU cache for rotated Surfaces
+
+    Rotating a Surface every tick is expensive, so rotated images are cached by (source Surface, angle bucket). Angles
+    are quantized to 'resolution' degrees, i.e., with a resolution of 5 a Surface has at most 72 rotated versions. The
+    cache is limited by the memory its rotated Surfaces use ('max_bytes'); when the limit is exceeded, the least
+    recently used rotations are dropped.
+
+    Source Surfaces are used as keys directly, so they must not be modified after they were rotated once. This holds for
+    all Surfaces handed out by the AssetCache.
+    """
+
+    def __init__(self, resolution: float = 5.0, max_bytes: int = 64 * 1024 * 1024):
+        """LRU cache for rotated Surfaces
+
+        :param resolution: angular resolution of the cache in degrees
+        :param max_bytes: upper limit for the memory used by cached Surfaces
+        """
+        self.resolution = resolution
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._rotations: OrderedDict[tuple[pygame.Surface, int], pygame.Surface] = OrderedDict()
+        self._sources: dict[pygame.Surface, tuple[pygame.Surface, int]] = {}
+
+    @property
+    def buckets(self) -> int:
+        """Number of angle buckets per Surface"""
+        return max(1, round(360 / self.resolution))
+
+    def _bucket(self, angle: float) -> int:
+        """Returns the angle bucket an angle falls into"""
+        return round((angle % 360) / self.resolution) % self.buckets
+
+    def rotate(self, img: pygame.Surface, angle: float) -> pygame.Surface:
+        """Rotates a Surface around its center, using a cached rotation if possible
+
+        The returned Surface is shared and must not be drawn onto.
+
+        :param img: pygame Surface to rotate
+        :param angle: rotation angle
+        :return: rotated pygame Surface
+        """
+        key = (img, self._bucket(angle))
+        rotated = self._rotations.get(key)
+        if rotated is not None:
+            self.hits += 1
+            self._rotations.move_to_end(key)
+            return rotated
+        self.misses += 1
+        return self._store(key)
+
+    def prewarm(self, img: pygame.Surface) -> None:
+        """Rotates a Surface into all angle buckets, so rotating it later is a lookup only
+
+        :param img: pygame Surface to rotate
+        """
+        for bucket in range(self.buckets):
+            if (img, bucket) not in self._rotations:
+                self._store((img, bucket))
+
+    def _store(self, key: tuple[pygame.Surface, int]) -> pygame.Surface:
+        """Rotates a Surface into an angle bucket and adds it to the cache"""
+        img, bucket = key
+        rotated = rotate_image(img, bucket * self.resolution)
+        self._rotations[key] = rotated
+        self._sources[rotated] = key
+        self.used_bytes += self._size_of(rotated)
+        while self.used_bytes > self.max_bytes and len(self._rotations) > 1:
+            _, dropped = self._rotations.popitem(last=False)
+            self._sources.pop(dropped, None)
+            self.used_bytes -= self._size_of(dropped)
+        return rotated
+
+    def key_of(self, rotated: pygame.Surface) -> Optional[tuple[pygame.Surface, int]]:
+        """Returns the source Surface and angle bucket of a cached rotation, None if it isn't cached (anymore)"""
+        return self._sources.get(rotated)
+
+    @staticmethod
+    def _size_of(img: pygame.Surface) -> int:
+        """Returns the number of bytes used by a Surface's pixels"""
+        return img.get_width() * img.get_height() * img.get_bytesize()
+
+    def clear(self) -> None:
+        """Drops all cached rotations and resets the counters"""
+        self._rotations.clear()
+        self._sources.clear()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Returns the cache's hit/miss counters, the number of cached rotations and their memory usage"""
+        return {"hits": self.hits, "misses": self.misses, "rotations": len(self._rotations),
+                "bytes": self.used_bytes}
+
+
+rotation_cache = RotationCache()
+"""Shared RotationCache instance used by all game objects"""
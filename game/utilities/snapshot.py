@@ -0,0 +1,91 @@
+import io
+import pickle
+from typing import Any, Optional
+
+import pygame
+
+from .assets import asset_cache
+from .rotation_cache import rotation_cache
+
+
+def surface_key(surface: pygame.Surface) -> tuple:
+    """Returns a key a Surface can be restored from without storing its pixels, if possible
+
+    Surfaces from the AssetCache are referenced by their (path, size) pair, cached rotations of them additionally by
+    their angle bucket. Only Surfaces that aren't in either cache are stored with their pixels.
+
+    :param surface: Surface to reference
+    :return: ("asset", path, size), ("rotation", path, size, bucket) or ("pixels", RGBA bytes, size)
+    """
+    key = asset_cache.key_of(surface)
+    if key is not None:
+        return ("asset", *key)
+    rotation = rotation_cache.key_of(surface)
+    if rotation is not None:
+        source, bucket = rotation
+        key = asset_cache.key_of(source)
+        if key is not None:
+            return ("rotation", *key, bucket)
+    return "pixels", pygame.image.tobytes(surface, "RGBA"), surface.get_size()
+
+
+def load_surface(key: tuple) -> pygame.Surface:
+    """Returns the Surface for a key created by 'surface_key'"""
+    if key[0] == "asset":
+        return asset_cache.get_image(key[1], key[2])
+    if key[0] == "rotation":
+        return rotation_cache.rotate(asset_cache.get_image(key[1], key[2]), key[3] * rotation_cache.resolution)
+    return pygame.image.frombytes(key[1], key[2], "RGBA")
+
+
+class _SnapshotPickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, shared: dict[str, Any]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._shared = {id(obj): name for name, obj in shared.items() if obj is not None}
+
+    def persistent_id(self, obj: Any) -> Optional[tuple]:
+        name = self._shared.get(id(obj))
+        if name is not None:
+            return "shared", name
+        if isinstance(obj, pygame.Surface):
+            return "surface", surface_key(obj)
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, shared: dict[str, Any]):
+        super().__init__(file)
+        self._shared = shared
+
+    def persistent_load(self, pid: tuple) -> Any:
+        kind, key = pid
+        if kind == "shared":
+            return self._shared[key]
+        return load_surface(key)
+
+
+def dump_snapshot(state: Any, shared: dict[str, Any]) -> bytes:
+    """Serializes a graph of game objects to bytes
+
+    Objects in 'shared' (e.g., the display, the game or services like the EventBus) aren't serialized but referenced by
+    name, so restoring a snapshot reconnects the restored objects to the live ones. Surfaces are referenced by their
+    asset key (see 'surface_key'). Everything else is pickled, so references between objects (e.g., a Timer's callback
+    bound to an Enemy) are preserved.
+
+    :param state: objects to serialize, usually a dictionary
+    :param shared: objects that are referenced by name instead of being serialized
+    :return: snapshot
+    """
+    buffer = io.BytesIO()
+    _SnapshotPickler(buffer, shared).dump(state)
+    return buffer.getvalue()
+
+
+def load_snapshot(snapshot: bytes, shared: dict[str, Any]) -> Any:
+    """Restores a graph of game objects serialized by 'dump_snapshot'
+
+    :param snapshot: snapshot created by 'dump_snapshot'
+    :param shared: live objects for all names referenced by the snapshot
+    :return: restored objects
+    """
+    return _SnapshotUnpickler(io.BytesIO(snapshot), shared).load()
@@ -0,0 +1,86 @@
+from collections import defaultdict
+from typing import Iterable, Iterator
+
+import pygame
+
+
+class SpatialHash:
+    """Uniform grid for finding sprites that might collide
+
+    Sprites are sorted into square cells of 'cell_size' pixels based on their 'rect' attribute. A sprite whose rect
+    spans several cells is stored in each of them. Querying a rect only has to look at the sprites in the cells that the
+    rect overlaps instead of all sprites, which makes collision checks between two large groups roughly linear.
+
+    The index doesn't track movement, so it has to be rebuilt every tick after the indexed sprites have moved.
+    """
+
+    def __init__(self, cell_size: int = 128):
+        """Uniform grid for finding sprites that might collide
+
+        :param cell_size: edge length of a grid cell in pixels
+        """
+        self.cell_size = cell_size
+        self._cells: defaultdict[tuple[int, int], list[pygame.sprite.Sprite]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return sum(len(cell) for cell in self._cells.values())
+
+    def sprites(self) -> list[pygame.sprite.Sprite]:
+        """Returns all indexed sprites without duplicates"""
+        return list(dict.fromkeys(sprite for cell in self._cells.values() for sprite in cell))
+
+    def _cell_range(self, rect: pygame.Rect) -> Iterator[tuple[int, int]]:
+        """Yields the coordinates of all cells a rect overlaps"""
+        size = self.cell_size
+        for cell_x in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cell_y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield cell_x, cell_y
+
+    def clear(self) -> None:
+        """Removes all sprites from the index"""
+        self._cells.clear()
+
+    def insert(self, sprite: pygame.sprite.Sprite) -> None:
+        """Adds a sprite to all cells its rect overlaps
+
+        :param sprite: sprite with a 'rect' attribute, sprites without a rect are ignored
+        """
+        if sprite.rect is None:
+            return
+        for cell in self._cell_range(sprite.rect):
+            self._cells[cell].append(sprite)
+
+    def rebuild(self, sprites: Iterable[pygame.sprite.Sprite]) -> None:
+        """Replaces the index's content with the given sprites
+
+        :param sprites: sprites to index
+        """
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def query(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """Returns all indexed sprites whose rect collides with a rect
+
+        :param rect: area to search
+        :return: list of colliding sprites without duplicates
+        """
+        found = {}
+        for cell in self._cell_range(rect):
+            for sprite in self._cells.get(cell, ()):
+                if sprite not in found and rect.colliderect(sprite.rect):
+                    found[sprite] = None
+        return list(found)
+
+    def candidate_pairs(self, sprites: Iterable[pygame.sprite.Sprite]
+                        ) -> list[tuple[pygame.sprite.Sprite, pygame.sprite.Sprite]]:
+        """Returns all pairs of a sprite and an indexed sprite whose rects collide
+
+        :param sprites: sprites to test against the index, sprites without a rect are ignored
+        :return: list of (sprite, indexed sprite) tuples
+        """
+        pairs = []
+        for sprite in sprites:
+            if sprite.rect is not None:
+                pairs.extend((sprite, other) for other in self.query(sprite.rect))
+        return pairs
@@ -0,0 +1,146 @@
+from math import ceil
+from typing import Callable, Optional
+
+
+class Timer:
+    """Handle of a callback scheduled on a TimerWheel
+
+    The timer fires on simulation step 'due'. Repeating timers are rescheduled 'interval' steps after each call.
+    """
+
+    def __init__(self, due: int, callback: Callable[[], None], interval: Optional[int] = None):
+        """Handle of a callback scheduled on a TimerWheel
+
+        :param due: simulation step the timer fires on
+        :param callback: function called without arguments when the timer fires
+        :param interval: number of steps between two calls of a repeating timer, None for one-shot timers
+        """
+        self.due = due
+        self.callback = callback
+        self.interval = interval
+        self.cancelled = False
+        self.fired = False
+
+    @property
+    def active(self) -> bool:
+        """Returns True while the timer will still fire"""
+        return not self.cancelled and (self.interval is not None or not self.fired)
+
+    def cancel(self) -> None:
+        """Stops the timer, it is removed from the wheel the next time its slot is visited"""
+        self.cancelled = True
+
+
+class TimerWheel:
+    """Hierarchical timer wheel ticking with the simulation
+
+    Time is counted in simulation steps. The wheel has several levels of 'slots' slots each; a slot on level n covers
+    slots ** n steps. A timer is stored on the lowest level whose range covers its delay, so scheduling and cancelling
+    are O(1). Whenever a lower level wraps around, the timers of the next slot of the level above are moved down
+    ("cascaded"), until they end up on level 0 and fire. Timers further away than the top level's range are cascaded
+    again until they are in range.
+
+    Since the wheel only advances when 'tick' is called, timers don't run while the simulation is paused and behave
+    the same in headless runs, no matter how fast frames are rendered.
+    """
+
+    def __init__(self, tick_length: float, slots: int = 64, levels: int = 4):
+        """Hierarchical timer wheel ticking with the simulation
+
+        :param tick_length: length of a simulation step in seconds, used to convert delays given in seconds
+        :param slots: number of slots per level
+        :param levels: number of levels
+        """
+        self.tick_length = tick_length
+        self.slots = slots
+        self.levels = levels
+        self.now = 0
+        self.fired = 0
+        self._wheel: list[list[list[Timer]]] = [[[] for _ in range(slots)] for _ in range(levels)]
+        self._pending = 0
+
+    def __len__(self) -> int:
+        """Returns the number of scheduled timers (including cancelled ones that weren't removed yet)"""
+        return self._pending
+
+    @property
+    def time(self) -> float:
+        """Simulated time since the wheel was created or cleared, in seconds"""
+        return self.now * self.tick_length
+
+    def ticks(self, seconds: float) -> int:
+        """Converts a delay in seconds to simulation steps, rounding up (but at least 1 step)"""
+        return max(1, ceil(seconds / self.tick_length - 1e-9))
+
+    def _insert(self, timer: Timer) -> None:
+        delay = max(timer.due - self.now, 0)
+        for level in range(self.levels):
+            if delay < self.slots ** (level + 1) or level == self.levels - 1:
+                self._wheel[level][(timer.due // self.slots ** level) % self.slots].append(timer)
+                self._pending += 1
+                return
+
+    def schedule(self, delay: float, callback: Callable[[], None], repeat: bool = False) -> Timer:
+        """Calls a function after a delay
+
+        :param delay: delay in seconds (rounded up to whole simulation steps)
+        :param callback: function called without arguments
+        :param repeat: call the function again every 'delay' seconds until the timer is cancelled
+        :return: Timer that can be used to cancel the call
+        """
+        return self.schedule_ticks(self.ticks(delay), callback, repeat)
+
+    def schedule_ticks(self, ticks: int, callback: Callable[[], None], repeat: bool = False) -> Timer:
+        """Calls a function after a number of simulation steps
+
+        :param ticks: delay in simulation steps (at least 1)
+        :param callback: function called without arguments
+        :param repeat: call the function again every 'ticks' steps until the timer is cancelled
+        :return: Timer that can be used to cancel the call
+        """
+        ticks = max(1, ticks)
+        timer = Timer(self.now + ticks, callback, ticks if repeat else None)
+        self._insert(timer)
+        return timer
+
+    def _take(self, level: int, slot: int) -> list[Timer]:
+        timers = self._wheel[level][slot]
+        self._wheel[level][slot] = []
+        self._pending -= len(timers)
+        return timers
+
+    def tick(self) -> None:
+        """Advances the wheel by one simulation step and calls all timers that are due"""
+        self.now += 1
+        for level in range(1, self.levels):
+            if self.now % self.slots ** level:
+                break
+            for timer in self._take(level, (self.now // self.slots ** level) % self.slots):
+                if not timer.cancelled:
+                    self._insert(timer)
+        for timer in self._take(0, self.now % self.slots):
+            if timer.cancelled:
+                continue
+            if timer.due > self.now:
+                self._insert(timer)
+                continue
+            timer.fired = True
+            self.fired += 1
+            timer.callback()
+            if timer.interval is not None and not timer.cancelled:
+                timer.due = self.now + timer.interval
+                self._insert(timer)
+
+    def clear(self) -> None:
+        """Removes all timers and resets the time"""
+        for level in self._wheel:
+            for slot in level:
+                for timer in slot:
+                    timer.cancel()
+                slot.clear()
+        self._pending = 0
+        self.now = 0
+
+    def stats(self) -> dict:
+        """Returns the current step, the number of scheduled timers and the number of calls so far"""
+        return {"now": self.now, "pending": self._pending, "fired": self.fired}
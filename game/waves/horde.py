@@ -0,0 +1,111 @@
+from game.actors.enemy import Enemy1, Enemy2, Enemy3, Enemy4
+from game.game_objects.melee.axe import generate_single_edged_axe, generate_double_edged_axe
+from game.game_objects.melee.sword import generate_prime_sword, generate_wooden_sword
+from game.waves.wave_config import WaveSpec
+
+HORDE_MIX = [  # (Enemy class, weapon factory, share of a wave's regular Enemies)
+    (Enemy1, generate_wooden_sword, 0.5),
+    (Enemy2, generate_prime_sword, 0.3),
+    (Enemy3, generate_single_edged_axe, 0.2),
+]
+
+
+class Horde:
+    """Procedural, escalating waves of the endless mode
+
+    Wave n has base_size * growth ** n Enemies (at most 'max_size'), split between the Enemy classes of HORDE_MIX, plus
+    one Enemy4 for every 'boss_interval' waves. Enemies spawn on a ring around the Player; the spawn rate ramps up over
+    the first 'ramp_time' seconds of a wave, so a wave of n Enemies takes roughly 'ramp_time' seconds to spawn.
+    """
+
+    def __init__(self, base_size: int = 10, growth: float = 1.5, max_size: int = 5_000, spawn_budget: int = 32,
+                 spawn_ring: tuple[float, float] = (600, 1_100), ramp_time: float = 10.0, boss_interval: int = 5):
+        """Procedural, escalating waves of the endless mode
+
+        :param base_size: number of Enemies of the first wave
+        :param growth: factor the number of Enemies grows by from wave to wave
+        :param max_size: maximum number of Enemies of a wave
+        :param spawn_budget: maximum number of Enemies spawned per simulation step
+        :param spawn_ring: (minimum, maximum) distance to the Player Enemies are spawned at
+        :param ramp_time: time in seconds until the spawn rate reaches its maximum
+        :param boss_interval: number of waves per Enemy4
+        """
+        self.base_size = base_size
+        self.growth = growth
+        self.max_size = max_size
+        self.spawn_budget = spawn_budget
+        self.spawn_ring = spawn_ring
+        self.ramp_time = ramp_time
+        self.boss_interval = boss_interval
+
+    def wave_size(self, index: int) -> int:
+        """Returns the number of regular Enemies of a wave"""
+        return min(self.max_size, round(self.base_size * self.growth ** index))
+
+    def wave_spec(self, index: int) -> WaveSpec:
+        """Creates the definition of a wave
+
+        :param index: number of endless waves before this one
+        :return: WaveSpec of the wave
+        """
+        size = self.wave_size(index)
+        enemies = {}
+        remaining = size
+        for position, (enemy_cls, weapon_fun, share) in enumerate(HORDE_MIX):
+            count = remaining if position == len(HORDE_MIX) - 1 else round(size * share)
+            remaining -= count
+            if count > 0:
+                enemies[enemy_cls] = (count, weapon_fun)
+        bosses = (index + 1) // self.boss_interval
+        if bosses:
+            enemies[Enemy4] = (bosses, generate_double_edged_axe)
+        # average rate over the ramp is 'size / ramp_time', starting at a fifth of the peak
+        peak_rate = max(1.0, 5 / 3 * size / self.ramp_time)
+        return WaveSpec(enemies=enemies, spawn_budget=self.spawn_budget,
+                        spawn_rate=[(0.0, peak_rate / 5), (self.ramp_time, peak_rate)], spawn_ring=self.spawn_ring)
+
+
+class SpawnGovernor:
+    """Adapts the spawn rate to a frame-time budget
+
+    The governor keeps an exponential moving average of the frame time. While the average is above the budget, the
+    spawn scale is reduced multiplicatively (down to 0, i.e., no more spawns), while it is clearly below the budget, the
+    scale recovers additively. Waves multiply their spawn rate with the scale, so a horde that is too big for the
+    machine stops growing instead of stalling the game, and grows again once Enemies are killed.
+    """
+
+    def __init__(self, frame_budget: float = 1 / 60, smoothing: float = 0.1, decrease: float = 0.7,
+                 increase: float = 0.02, headroom: float = 0.8):
+        """Adapts the spawn rate to a frame-time budget
+
+        :param frame_budget: target frame time in seconds
+        :param smoothing: weight of the latest frame in the moving average (0 to 1)
+        :param decrease: factor the scale is multiplied with while the frame time is above the budget
+        :param increase: amount the scale grows by while the frame time is below 'headroom' times the budget
+        :param headroom: fraction of the budget the frame time has to stay below for the scale to recover
+        """
+        self.frame_budget = frame_budget
+        self.smoothing = smoothing
+        self.decrease = decrease
+        self.increase = increase
+        self.headroom = headroom
+        self.frame_time = 0.0
+        self.scale = 1.0
+
+    def record(self, frame_time: float) -> None:
+        """Adds the duration of a frame and updates the spawn scale
+
+        :param frame_time: time in seconds the last frame took (without waiting for the frame rate limit)
+        """
+        self.frame_time += (frame_time - self.frame_time) * self.smoothing
+        if self.frame_time > self.frame_budget:
+            self.scale *= self.decrease
+            if self.scale < 0.01:
+                self.scale = 0.0
+        elif self.frame_time < self.frame_budget * self.headroom:
+            self.scale = min(1.0, self.scale + self.increase)
+
+    def reset(self) -> None:
+        """Forgets the measured frame times"""
+        self.frame_time = 0.0
+        self.scale = 1.0
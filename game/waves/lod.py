@@ -0,0 +1,120 @@
+from typing import Optional, Sequence
+
+import pygame
+
+from game.actors.enemy import Enemy
+from game.utilities.gamestate import GameState
+
+
+class LODBand:
+    """Distance band of the LODScheduler
+
+    Enemies up to 'max_distance' pixels away from their target (and farther away than the previous band's limit) are
+    updated on every 'interval'-th simulation step.
+    """
+
+    def __init__(self, name: str, max_distance: float, interval: int):
+        """Distance band of the LODScheduler
+
+        :param name: name used when reporting counts
+        :param max_distance: maximum distance to the target in pixels
+        :param interval: number of simulation steps between two updates of an Enemy in this band
+        """
+        self.name = name
+        self.max_distance = max_distance
+        self.interval = max(1, interval)
+
+
+DEFAULT_BANDS = [
+    LODBand("near", 700, 1),
+    LODBand("far", 1_400, 3),
+    LODBand("distant", float("inf"), 6),
+]
+
+
+class LODScheduler:
+    """Level-of-detail scheduling of Enemy updates
+
+    Enemies are sorted into distance bands based on their distance to their target. Enemies in the nearest band are
+    updated on every step, Enemies in farther bands only on every n-th step, with the time that passed since their last
+    update as timestep, so they still move at the same speed. Updates are staggered, so not all distant Enemies are
+    updated in the same step.
+
+    Enemies whose rect doesn't overlap the view (plus a margin) are marked as off-screen: they aren't drawn and their
+    weapon isn't positioned in their hand. Their fired projectiles keep flying and are drawn, as they can still hit the
+    Player.
+
+    While the game isn't running, all Enemies are updated on every step, so state changes (e.g., pausing) apply
+    immediately and no time accumulates.
+
+    The number of Enemies per band, off-screen and updated in the last step are stored in 'counts'.
+
+    Waves with a SteeringSystem move all Enemies in one vectorized pass on every step and only update the due Enemies
+    in Python, so they don't need scheduling. They still use the scheduler's margin and report their counts ('record').
+    """
+
+    def __init__(self, bands: Optional[Sequence[LODBand]] = None, margin: int = 64):
+        """Level-of-detail scheduling of Enemy updates
+
+        :param bands: distance bands, the farthest band should have an infinite 'max_distance'
+        :param margin: distance in pixels outside the view in which Enemies still count as on screen
+        """
+        self.bands = sorted(bands or DEFAULT_BANDS, key=lambda band: band.max_distance)
+        self.margin = margin
+        self.tick = 0
+        self.counts = self._empty_counts()
+
+    def _empty_counts(self) -> dict[str, int]:
+        return {**{band.name: 0 for band in self.bands}, "off_screen": 0, "updated": 0}
+
+    def record(self, distances: Sequence[float], off_screen: int, updated: int) -> None:
+        """Stores the counts of a wave whose Enemies are moved by a SteeringSystem
+
+        :param distances: array with the distance of every Enemy to its target
+        :param off_screen: number of off-screen Enemies
+        :param updated: number of Enemies updated in Python
+        """
+        self.tick += 1
+        counts = self._empty_counts()
+        closer = 0
+        for band in self.bands:
+            within = int((distances <= band.max_distance).sum())
+            counts[band.name] = within - closer
+            closer = within
+        counts["off_screen"] = off_screen
+        counts["updated"] = updated
+        self.counts = counts
+
+    def band(self, distance: float) -> LODBand:
+        """Returns the band an Enemy at a distance to its target belongs to"""
+        for band in self.bands:
+            if distance <= band.max_distance:
+                return band
+        return self.bands[-1]
+
+    def update(self, enemies: Sequence[Enemy], game_state: GameState, dt: float, target_position: pygame.Vector2,
+               view: pygame.Rect) -> None:
+        """Updates the Enemies that are due in this simulation step
+
+        :param enemies: Enemies to schedule
+        :param game_state: current GameState
+        :param dt: length of the simulation step in seconds
+        :param target_position: position the distances are measured to
+        :param view: visible area
+        """
+        self.tick += 1
+        counts = self._empty_counts()
+        view = view.inflate(2 * self.margin, 2 * self.margin)
+        running = game_state == GameState.RUNNING
+        for index, enemy in enumerate(enemies):
+            band = self.band(enemy.position.distance_to(target_position))
+            counts[band.name] += 1
+            enemy.on_screen = enemy.rect is None or view.colliderect(enemy.rect)
+            if not enemy.on_screen:
+                counts["off_screen"] += 1
+            enemy.lod_elapsed += dt
+            if not running or (self.tick + index) % band.interval == 0:
+                enemy.update(game_state, enemy.lod_elapsed, update_weapon=enemy.on_screen)
+                enemy.lod_elapsed = 0.0
+                counts["updated"] += 1
+        self.counts = counts
@@ -1,22 +1,83 @@
+from math import tau
+from typing import Optional, Sequence
+
 import pygame
 import random
 
 from game.actors import Player
-from game.utilities import GameState
-from game.game_objects.projectile import Projectile
+from game.actors.enemy import Enemy
+from game.actors.steering import SteeringSystem
+from game.game_objects import ProjectileSystem
+from game.utilities import GameState, SpatialHash, NeighbourGrid, FlowField, Camera, TimerWheel, EventBus
+from game.waves.lod import LODScheduler
 
 
 class Wave:
-    def __init__(self, display: pygame.Surface, target: Player, enemies_to_spawn: dict):
+    crowd_separation = True  # push enemies apart using a NeighbourGrid, so they don't stack up
+
+    def __init__(self, display: pygame.Surface, target: Player, enemies_to_spawn: dict,
+                 spawn_budget: Optional[int] = None, spawn_rate: Optional[Sequence[tuple[float, float]]] = None,
+                 spawn_ring: Optional[tuple[float, float]] = None, rng: Optional[random.Random] = None,
+                 timers: Optional[TimerWheel] = None, events: Optional[EventBus] = None,
+                 flow_field: Optional[FlowField] = None, world_bounds: Optional[pygame.Rect] = None,
+                 lod_scheduler: Optional[LODScheduler] = None, vectorized_steering: bool = False,
+                 projectile_system: Optional[ProjectileSystem] = None):
+        """Wave of Enemies attacking a target
+
+        Without 'spawn_budget' and 'spawn_rate', all Enemies are spawned at once by 'spawn_enemies'. Otherwise,
+        'spawn_enemies' only starts spawning and the Enemies are created over the following simulation steps in
+        'update', so a big wave doesn't stall a single frame.
+
+        The game's services (from 'rng' on) are passed on to the spawned Enemies, so several games can run in one
+        process.
+
+        :param display: pygame.display used for rendering
+        :param target: Player the Enemies attack
+        :param enemies_to_spawn: dictionary: key = Enemy class, value = tuple (num_enemies, weapon factory)
+        :param spawn_budget: maximum number of Enemies spawned per simulation step, None for no limit
+        :param spawn_rate: spawn rate curve as (seconds since spawning started, Enemies per second) points, linearly
+                           interpolated and held after the last point; None to spawn as fast as the budget allows
+        :param spawn_ring: (minimum, maximum) distance to the target Enemies are spawned at, None to spawn them
+                           anywhere between (0, 0) and (1200, 1200)
+        :param rng: random number generator for spawn positions and speeds, the game's seeded one for deterministic
+                    replays
+        :param timers: TimerWheel for the Enemies' cooldowns and despawns
+        :param events: EventBus the Enemies' events are published on
+        :param flow_field: shared FlowField towards the Player, used to walk around obstacles
+        :param world_bounds: area of the map, Enemies spawned on a ring are kept inside it and their projectiles are
+                             culled when they leave it
+        :param lod_scheduler: updates distant Enemies less often, if set
+        :param vectorized_steering: steer the Enemies in a SteeringSystem (requires numpy)
+        :param projectile_system: ProjectileSystem the Enemies' weapons spawn their projectiles in, if set
+        """
         self.display = display
         self.target = target
         self.spawned_enemies = pygame.sprite.Group()
         self.enemies_to_spawn = enemies_to_spawn
+        self.spawn_budget = spawn_budget
+        self.spawn_rate = sorted(spawn_rate) if spawn_rate else None
+        self.spawn_ring = spawn_ring
+        self.rng = rng if rng is not None else random.Random()
+        self.timers = timers
+        self.events = events
+        self.flow_field = flow_field
+        self.world_bounds = world_bounds
+        self.lod_scheduler = lod_scheduler
+        self.projectile_system = projectile_system
         self.spawned = False
+        self.pending = 0
+        self._queue: list[list] = []
+        self._spawn_time = 0.0
+        self._spawn_credit = 0.0
+        self.spawn_scale = 1.0  # factor the spawn rate is scaled with, 0 pauses spawning (see SpawnGovernor)
+        self.steering: Optional[SteeringSystem] = SteeringSystem(
+            separation_radius=Enemy.separation_radius, separation_weight=Enemy.separation_weight
+        ) if vectorized_steering else None
+        self.crowd: Optional[NeighbourGrid] = NeighbourGrid() if self.crowd_separation else None
 
     @property
     def is_complete(self) -> bool:
-        if not self.spawned:
+        if not self.spawned or self.pending:
             return False
         for enemy in self.spawned_enemies.sprites():
             if enemy.is_alive:
@@ -24,21 +85,146 @@ class Wave:
         return True
 
     def spawn_enemies(self) -> None:
+        """Starts spawning the wave's Enemies, spawns all of them right away if there is no budget or rate curve"""
         if self.spawned:
             return
 
         # dictionary: key = Enemy class, value = tupel (num_enemies, Weapon)
-        for enemy_cls, enemy_vals in self.enemies_to_spawn.items():
-            for i in range(enemy_vals[0]):
-                enemy = enemy_cls(position=(random.randint(0, 1200), random.randint(0, 1200)),
-                                  target=self.target, display=self.display)
-                weapon_fun = enemy_vals[1]
-                weapon = weapon_fun(display=self.display, owner=enemy)
-                enemy.weapons.add(weapon)
-                self.spawned_enemies.add(enemy)
+        self._queue = [[enemy_cls, weapon_fun, count]
+                       for enemy_cls, (count, weapon_fun) in self.enemies_to_spawn.items() if count > 0]
+        self.pending = sum(entry[2] for entry in self._queue)
+        self._spawn_time = 0.0
+        self._spawn_credit = 0.0
         self.spawned = True
+        if self.steering is not None:
+            self.steering.clear()  # Enemies of an earlier game, if the wave is played again after a reset
+        if self.spawn_budget is None and self.spawn_rate is None:
+            self._spawn(self.pending)
+
+    def _spawn_position(self) -> tuple[float, float]:
+        """Returns a random spawn position, on the spawn ring around the target if the wave has one"""
+        if self.spawn_ring is None:
+            return self.rng.randint(0, 1200), self.rng.randint(0, 1200)
+        offset = pygame.Vector2(self.rng.uniform(*self.spawn_ring), 0).rotate_rad(self.rng.uniform(0, tau))
+        x, y = self.target.position + offset
+        if self.world_bounds is not None:
+            x = max(self.world_bounds.left, min(self.world_bounds.right - Player.size[0], x))
+            y = max(self.world_bounds.top, min(self.world_bounds.bottom - Player.size[1], y))
+        return x, y
+
+    def _spawn(self, count: int) -> None:
+        """Creates the next 'count' pending Enemies with their weapons"""
+        for _ in range(min(count, self.pending)):
+            entry = self._queue[0]
+            enemy_cls, weapon_fun = entry[0], entry[1]
+            entry[2] -= 1
+            if entry[2] == 0:
+                self._queue.pop(0)
+            enemy = enemy_cls(position=self._spawn_position(), target=self.target, display=self.display, rng=self.rng,
+                              timers=self.timers, events=self.events, projectile_system=self.projectile_system,
+                              world_bounds=self.world_bounds)
+            weapon = weapon_fun(display=self.display, owner=enemy)
+            enemy.weapons.add(weapon)
+            if self.steering is not None:
+                self.steering.add(enemy)
+            enemy.crowd = self.crowd
+            enemy.flow_field = self.flow_field
+            self.spawned_enemies.add(enemy)
+            self.pending -= 1
+
+    def _current_spawn_rate(self) -> float:
+        """Returns the spawn rate curve's value at the current spawn time, in Enemies per second"""
+        points = self.spawn_rate
+        if self._spawn_time <= points[0][0]:
+            return points[0][1]
+        for (start, start_rate), (end, end_rate) in zip(points, points[1:]):
+            if self._spawn_time <= end:
+                return start_rate + (end_rate - start_rate) * (self._spawn_time - start) / (end - start)
+        return points[-1][1]
+
+    def _spawn_pending(self, dt: float) -> None:
+        """Spawns the Enemies that are due in this simulation step, at most 'spawn_budget'
+
+        The spawn rate curve is scaled with 'spawn_scale'. Without a curve, 'spawn_scale' only pauses spawning (at 0).
+        """
+        self._spawn_time += dt
+        if self.spawn_rate is None:
+            due = self.pending if self.spawn_scale > 0 else 0
+        else:
+            self._spawn_credit += self._current_spawn_rate() * self.spawn_scale * dt
+            due = int(self._spawn_credit)
+        if self.spawn_budget is not None:
+            due = min(due, self.spawn_budget)
+        due = min(due, self.pending)
+        if self.spawn_rate is not None:
+            self._spawn_credit -= due
+        self._spawn(due)
+
+    def update(self, game_state: GameState, dt: float, projectiles: SpatialHash,
+               view: Optional[pygame.Rect] = None) -> None:
+        """Method to run on every simulation step
+
+        Spawns pending Enemies while the game is running, rebuilds the neighbour grid used for crowd separation,
+        updates the Enemies (only the ones that are due, if there is a LODScheduler) and applies damage from the
+        Player's projectiles. With a SteeringSystem, the Enemies are steered and moved in vectorized passes and only
+        the due ones (see SteeringSystem.update_due) are updated in Python while the game is running.
+
+        :param game_state: current GameState
+        :param dt: length of the simulation step in seconds
+        :param projectiles: SpatialHash containing the Player's projectiles
+        :param view: visible area in world coordinates, used by the LODScheduler (defaults to the display's area)
+        """
+        if self.pending and game_state == GameState.RUNNING:
+            self._spawn_pending(dt)
+        view = view or self.display.get_rect()
+        if self.steering is not None:
+            self._update_steered(game_state, dt, view)
+        else:
+            if self.crowd is not None:
+                self.crowd.rebuild(enemy for enemy in self.spawned_enemies if enemy.is_alive)
+            if self.lod_scheduler is not None:
+                self.lod_scheduler.update(self.spawned_enemies.sprites(), game_state, dt, self.target.position, view)
+            else:
+                self.spawned_enemies.update(game_state, dt)
+        if self.steering is not None:
+            hits = self.steering.hits(projectiles.sprites())
+        else:
+            hits = projectiles.candidate_pairs(self.spawned_enemies) if len(projectiles) else []
+        for enemy, projectile in hits:
+            enemy.take_hit(projectile)
+
+    def _update_steered(self, game_state: GameState, dt: float, view: pygame.Rect) -> None:
+        """Steers the Enemies with the SteeringSystem and updates the due ones
+
+        While the game isn't running, all Enemies are updated in Python (so state changes like pausing apply to all of
+        them) and woken up, so they are all updated once more when the game continues.
+        """
+        steering = self.steering
+        steering.step(self.target.position)
+        if game_state != GameState.RUNNING:
+            self.spawned_enemies.update(game_state, dt)
+            steering.wake()
+            return
+        updated = steering.update_due(game_state, dt)
+        margin = self.lod_scheduler.margin if self.lod_scheduler is not None else 0
+        steering.move(dt if self.target.is_alive else 0.0, flow_field=self.flow_field,
+                      separation=self.crowd is not None, view=view.inflate(2 * margin, 2 * margin))
+        if self.lod_scheduler is not None:
+            count = len(steering)
+            self.lod_scheduler.record(steering.distance[:count], count - int(steering.on_screen[:count].sum()),
+                                      updated)
+
+    def draw(self, alpha: float = 1.0, camera: Optional[Camera] = None) -> None:
+        """Renders all Enemies of the wave that are on screen and the projectiles of all Enemies
+
+        Off-screen Enemies aren't drawn, but their projectiles can fly into view and still hit the Player.
 
-    def update(self, game_state: GameState, projectiles: [Projectile]) -> None:
-        self.spawned_enemies.update(game_state)
+        :param alpha: fraction of a simulation step that has passed since the last step (0 to 1)
+        :param camera: Camera used for culling and the world-to-screen transform
+        """
         for enemy in self.spawned_enemies:
-            enemy.calc_new_health(projectiles)
+            if enemy.on_screen:
+                enemy.draw(alpha, camera)
+            elif enemy.active_weapon is not None and enemy.active_weapon.fired_projectiles:
+                enemy.actor = None  # only the projectiles are drawn, not the Weapon in the Enemy's hand
+                enemy.active_weapon.draw(enemy.rotation, alpha, camera)
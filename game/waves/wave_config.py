@@ -0,0 +1,112 @@
+import json
+from os import path
+from typing import Callable, Optional
+
+import pygame
+
+from game.actors.player import Player
+from game.actors.enemy import Enemy
+from game.game_objects.melee.axe import generate_single_edged_axe, generate_double_edged_axe
+from game.game_objects.melee.sword import generate_prime_sword, generate_wooden_sword
+from game.game_objects.ranged.bow import generate_bow
+from game.game_objects.ranged.wand import generate_wand
+from game.utilities import all_subclasses
+from game.waves.wave import Wave
+
+DEFAULT_WAVES_PATH = path.join("resources", "waves", "default.json")
+WEAPON_FACTORIES = {  # weapon name used in wave files: function creating the weapon for an Enemy
+    "wooden_sword": generate_wooden_sword,
+    "prime_sword": generate_prime_sword,
+    "single_edged_axe": generate_single_edged_axe,
+    "double_edged_axe": generate_double_edged_axe,
+    "bow": generate_bow,
+    "wand": generate_wand,
+}
+
+
+class WaveSpec:
+    """Parsed definition of a Wave
+
+    Specs are cheap: they only hold Enemy classes, counts, weapon factories and the spawn settings. The WaveManager
+    turns a spec into a Wave (with 'build') when the wave starts.
+    """
+
+    def __init__(self, enemies: dict[type[Enemy], tuple[int, Callable]], spawn_budget: Optional[int] = None,
+                 spawn_rate: Optional[list[tuple[float, float]]] = None,
+                 spawn_ring: Optional[tuple[float, float]] = None):
+        """Parsed definition of a Wave
+
+        :param enemies: dictionary: key = Enemy class, value = tuple (num_enemies, weapon factory)
+        :param spawn_budget: maximum number of Enemies spawned per simulation step
+        :param spawn_rate: spawn rate curve as (seconds, Enemies per second) points
+        :param spawn_ring: (minimum, maximum) distance to the target Enemies are spawned at
+        """
+        self.enemies = enemies
+        self.spawn_budget = spawn_budget
+        self.spawn_rate = spawn_rate
+        self.spawn_ring = spawn_ring
+
+    @property
+    def size(self) -> int:
+        """Number of Enemies in the wave"""
+        return sum(count for count, _ in self.enemies.values())
+
+    def build(self, display: pygame.Surface, target: Player, **wave_args) -> Wave:
+        """Creates the Wave described by the spec
+
+        :param display: pygame.display used for rendering
+        :param target: Player the Enemies attack
+        :param wave_args: the game's services passed on to the Wave (e.g., 'rng', 'timers' or 'flow_field')
+        :return: Wave whose Enemies weren't spawned yet
+        """
+        return Wave(display=display, target=target, enemies_to_spawn=dict(self.enemies),
+                    spawn_budget=self.spawn_budget, spawn_rate=self.spawn_rate, spawn_ring=self.spawn_ring,
+                    **wave_args)
+
+
+def _parse_wave(definition: dict, defaults: dict, enemy_classes: dict[str, type[Enemy]]) -> WaveSpec:
+    """Creates a WaveSpec from one entry of a wave file's 'waves' list"""
+    enemies = {}
+    for entry in definition["enemies"]:
+        if entry["enemy"] not in enemy_classes:
+            raise ValueError(f"Unknown enemy '{entry['enemy']}', expected one of {list(enemy_classes)}")
+        if entry["weapon"] not in WEAPON_FACTORIES:
+            raise ValueError(f"Unknown weapon '{entry['weapon']}', expected one of {list(WEAPON_FACTORIES)}")
+        enemy_cls = enemy_classes[entry["enemy"]]
+        if enemy_cls in enemies:
+            raise ValueError(f"Enemy '{entry['enemy']}' is listed twice in one wave")
+        enemies[enemy_cls] = (int(entry["count"]), WEAPON_FACTORIES[entry["weapon"]])
+    settings = {**defaults, **definition}
+    spawn_rate = settings.get("spawn_rate")
+    spawn_ring = settings.get("spawn_ring")
+    return WaveSpec(enemies=enemies, spawn_budget=settings.get("spawn_budget"),
+                    spawn_rate=[(float(time), float(rate)) for time, rate in spawn_rate] if spawn_rate else None,
+                    spawn_ring=(float(spawn_ring[0]), float(spawn_ring[1])) if spawn_ring else None)
+
+
+_parsed: dict[str, tuple[float, list[WaveSpec]]] = {}
+
+
+def load_wave_specs(file_path: str = DEFAULT_WAVES_PATH) -> list[WaveSpec]:
+    """Reads a wave file
+
+    A wave file is a JSON object with a list of 'waves'. Every wave has a list of 'enemies' (objects with the Enemy
+    class name as 'enemy', a 'count' and a 'weapon' name from WEAPON_FACTORIES) and optionally 'spawn_budget',
+    'spawn_rate' ([seconds, Enemies per second] points) and 'spawn_ring' ([minimum, maximum] distance). Spawn settings
+    on the top level are used for all waves that don't set them.
+
+    Files are parsed once and cached until they are modified.
+
+    :param file_path: path of the wave file
+    :return: new list of the file's WaveSpecs
+    """
+    modified = path.getmtime(file_path)
+    cached = _parsed.get(file_path)
+    if cached is None or cached[0] != modified:
+        with open(file_path) as file:
+            definition = json.load(file)
+        defaults = {key: value for key, value in definition.items() if key != "waves"}
+        enemy_classes = {enemy_cls.__name__: enemy_cls for enemy_cls in all_subclasses(Enemy)}
+        cached = _parsed[file_path] = (modified, [_parse_wave(wave, defaults, enemy_classes)
+                                                  for wave in definition["waves"]])
+    return list(cached[1])
@@ -1,12 +1,16 @@
-from typing import Optional, List
+from typing import Optional, List, Union
 
 import pygame
 
-from game.utilities.events import WIN_EVENT, SPAWN_WAVE_EVENT
+from game.utilities.events import EventBus, GameEvent, WinEvent, SpawnWaveEvent, HordeStatsEvent
 from game.actors.player import Player
 from game.utilities.gamestate import GameState
+from game.utilities.spatial_hash import SpatialHash
+from game.utilities.timers import Timer, TimerWheel
+from game.utilities.camera import Camera
 from game.waves.wave import Wave
-from game.game_objects.projectile import Projectile
+from game.waves.wave_config import WaveSpec
+from game.waves.horde import Horde, SpawnGovernor
 
 
 class WaveManager:
@@ -14,20 +18,50 @@ class WaveManager:
 
     This class contains and manages the different waves of enemies. The individual Wave objects are stored in a list.
     The currently active wave is determined using the '_active_wave_idx' attribute. When a wave is completed, the next
-    one is spawned.
+    one is spawned. Waves can also be given as WaveSpecs, which are turned into Wave objects when they become active,
+    with the WaveManager's TimerWheel and EventBus and the game's other services in 'wave_args'.
+
+    In endless mode, the given waves are followed by an infinite series of escalating waves created by a Horde. The
+    spawn rate of the active wave is scaled by a SpawnGovernor to stay within a frame-time budget (the game reports
+    its frame times with 'record_frame_time'), and a HordeStatsEvent with the current load is published every
+    'stats_interval' seconds.
     """
 
     def __init__(
-        self, display: pygame.Surface, target: Player, waves: Optional[List[Wave]] = None
+        self, display: pygame.Surface, target: Player, waves: Optional[List[Union[Wave, WaveSpec]]] = None,
+        timers: Optional[TimerWheel] = None, wave_delay: float = 0.0, events: Optional[EventBus] = None,
+        endless: bool = False, horde: Optional[Horde] = None, frame_budget: float = 1 / 60,
+        stats_interval: float = 0.5, wave_args: Optional[dict] = None
     ):
         """Class for managing the individual waves
 
-        :param waves: list of Wave objects to sequentially run through
+        :param waves: list of Wave objects (or WaveSpecs) to sequentially run through
+        :param timers: TimerWheel the next wave is scheduled on, without one it is spawned immediately
+        :param wave_delay: time in seconds between the completion of a wave and the spawn of the next one
+        :param events: EventBus the SpawnWaveEvent and WinEvent are published on
+        :param endless: keep spawning procedurally generated waves after the given ones, the game is never won
+        :param horde: generator of the endless waves, a Horde with default settings by default
+        :param frame_budget: frame time in seconds the spawn rate of endless waves is adapted to
+        :param stats_interval: time in seconds between two HordeStatsEvents in endless mode (requires a TimerWheel)
+        :param wave_args: further arguments of the Waves built from WaveSpecs (e.g., the game's 'rng', 'flow_field'
+                          or 'projectile_system', see Wave)
         """
         self.target = target
         self.display = display
         self.waves = waves or []
+        self.timers = timers
+        self.events = events
+        self.wave_delay = wave_delay
+        self.wave_args = wave_args or {}
+        self._spawn_timer: Optional[Timer] = None
+        self.endless = endless
+        self.horde = horde or Horde()
+        self.governor = SpawnGovernor(frame_budget=frame_budget)
+        self.stats_interval = stats_interval
+        self._stats_timer: Optional[Timer] = None
+        self._base_waves = len(self.waves)
         self._active_wave_idx = -1
+        self._schedule_stats()
         self.spawn_next_wave()
 
     @property
@@ -38,7 +72,11 @@ class WaveManager:
         :return: currently active Wave or None
         """
         if self.waves and self._active_wave_idx is not None:
-            return self.waves[self._active_wave_idx]
+            wave = self.waves[self._active_wave_idx]
+            if isinstance(wave, WaveSpec):
+                wave = self.waves[self._active_wave_idx] = wave.build(self.display, self.target, timers=self.timers,
+                                                                      events=self.events, **self.wave_args)
+            return wave
 
     def clear_current_wave(self) -> None:
         """Removes all enemies in the current wave"""
@@ -66,30 +104,98 @@ class WaveManager:
 
         Spawns a new wave if the '_active_wave_idx' counter is still in the range of the list of waves and the current
         wave is completed, or if the first wave hasn't been spawned yet (= on game start). If the current wave was the
-        last wave, a WIN_EVENT is fired.
+        last wave, a WinEvent is published, unless the WaveManager is endless, which appends the next Horde wave.
         """
+        if self.endless and self._active_wave_idx >= len(self.waves) - 1:
+            self.waves.append(self.horde.wave_spec(len(self.waves) - self._base_waves))
         if (self._active_wave_idx < len(self.waves) - 1 and self.active_wave.is_complete) or \
                 (self._active_wave_idx == -1 and self.active_wave.spawned is False):
             self._active_wave_idx += 1
             self.active_wave.spawn_enemies()
-            pygame.event.post(pygame.event.Event(SPAWN_WAVE_EVENT))
+            self._publish(SpawnWaveEvent(self._active_wave_idx))
         elif self.active_wave and self.active_wave.is_complete:
-            pygame.event.post(pygame.event.Event(WIN_EVENT))
+            self._publish(WinEvent())
+
+    def _publish(self, event: GameEvent) -> None:
+        if self.events is not None:
+            self.events.publish(event)
+
+    def _schedule_stats(self) -> None:
+        """Publishes a HordeStatsEvent every 'stats_interval' seconds in endless mode"""
+        if self._stats_timer is not None:
+            self._stats_timer.cancel()
+            self._stats_timer = None
+        if self.endless and self.timers is not None:
+            self._stats_timer = self.timers.schedule(self.stats_interval, self._publish_stats, repeat=True)
+
+    def _publish_stats(self) -> None:
+        wave = self.active_wave
+        projectiles = len(self.target.active_weapon.fired_projectiles) if self.target.active_weapon else 0
+        for enemy in wave.spawned_enemies:
+            if enemy.active_weapon is not None:
+                projectiles += len(enemy.active_weapon.fired_projectiles)
+        if self.target.projectile_system is not None:
+            projectiles += len(self.target.projectile_system)
+        self._publish(HordeStatsEvent(wave=self._active_wave_idx, enemies=len(wave.spawned_enemies),
+                                      pending=wave.pending, projectiles=projectiles,
+                                      frame_time=self.governor.frame_time, spawn_scale=self.governor.scale))
+
+    def record_frame_time(self, frame_time: float) -> None:
+        """Reports the duration of a frame, used to adapt the spawn rate of endless waves
+
+        :param frame_time: time in seconds the frame took (without waiting for the frame rate limit)
+        """
+        if self.endless:
+            self.governor.record(frame_time)
+
+    def _spawn_scheduled_wave(self) -> None:
+        self._spawn_timer = None
+        self.spawn_next_wave()
 
     def reset(self) -> None:
         """Resets the WaveManager to the first wave"""
+        if self._spawn_timer is not None:
+            self._spawn_timer.cancel()
+            self._spawn_timer = None
         self.clear_current_wave()
         self._active_wave_idx = 0
+        if self.endless:
+            del self.waves[max(self._base_waves, 1):]
+            if self._base_waves == 0:
+                self.waves[0] = self.horde.wave_spec(0)
+            self.governor.reset()
+            self._schedule_stats()
         for wave in self.waves:
-            wave.spawned = False
+            if isinstance(wave, Wave):
+                wave.spawned = False
         self.active_wave.spawn_enemies()
 
-    def update(self, game_state: GameState, projectiles: [Projectile]) -> None:
-        """Method to run on tick
+    def update(self, game_state: GameState, dt: float, projectiles: SpatialHash,
+               view: Optional[pygame.Rect] = None) -> None:
+        """Method to run on every simulation step
+
+        Spawns a new wave (after 'wave_delay' seconds on the TimerWheel, if there is one), if the current one is
+        completed. Also updates all Enemies in the current wave.
 
-        Spawns a new wave, if the current one is completed. Also updates all Enemies in the current wave.
+        :param game_state: current GameState
+        :param dt: length of the simulation step in seconds
+        :param projectiles: SpatialHash containing the Player's projectiles
+        :param view: visible area in world coordinates
         """
         if self.active_wave.is_complete:
-            self.spawn_next_wave()
-        self.active_wave.update(game_state, projectiles)
+            if self.timers is None:
+                self.spawn_next_wave()
+            elif self._spawn_timer is None:
+                self._spawn_timer = self.timers.schedule(self.wave_delay, self._spawn_scheduled_wave)
+        if self.endless:
+            self.active_wave.spawn_scale = self.governor.scale
+        self.active_wave.update(game_state, dt, projectiles, view)
+
+    def draw(self, alpha: float = 1.0, camera: Optional[Camera] = None) -> None:
+        """Renders the current wave
+
+        :param alpha: fraction of a simulation step that has passed since the last step (0 to 1)
+        :param camera: Camera used for culling and the world-to-screen transform
+        """
+        self.active_wave.draw(alpha, camera)
 
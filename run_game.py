@@ -1,5 +1,12 @@
+import argparse
+
 from game import CircleClashGame
 
 if __name__ == "__main__":
-    g = CircleClashGame()
+    parser = argparse.ArgumentParser(description="Circle Clash")
+    parser.add_argument("--record", help="record the session to a replay file")
+    parser.add_argument("--seed", type=int, help="seed of the random number generator")
+    parser.add_argument("--endless", action="store_true", help="play endless, escalating waves")
+    args = parser.parse_args()
+    g = CircleClashGame(seed=args.seed, record=args.record, endless=args.endless)
     g.run()